@@ -0,0 +1,64 @@
+"""add dashboard kennzahl
+
+Revision ID: 3b8e1f6c2d94
+Revises: c5fe3307cb10
+Create Date: 2026-10-18 14:02:17.318540
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e1f6c2d94"
+down_revision: Union[str, None] = "c5fe3307cb10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Counts per Gemeinde, check and key figure, refreshed by the app after writes
+    op.execute("""
+        CREATE MATERIALIZED VIEW dashboard_kennzahl AS
+        SELECT e.gemeinde_id, 'klimacheck' AS check_typ, k.kennzahl, k.schluessel,
+               count(*) AS anzahl
+        FROM klimacheck_eingabe e,
+        LATERAL (VALUES
+            ('gesamt', ''),
+            ('veroeffentlicht', e.veroeffentlicht::text),
+            ('klimarelevanz', e.klimarelevanz_id::text),
+            ('auswirkung_thg', coalesce(e.auswirkung_thg::text, 'keine_angabe')),
+            ('auswirkung_klimaanpassung',
+             coalesce(e.auswirkung_klimaanpassung::text, 'keine_angabe')),
+            ('monat', to_char(e.erstellt_am, 'YYYY-MM'))
+        ) AS k (kennzahl, schluessel)
+        GROUP BY e.gemeinde_id, k.kennzahl, k.schluessel
+        UNION ALL
+        SELECT e.gemeinde_id, 'mobilitaetscheck', k.kennzahl, k.schluessel, count(*)
+        FROM mobilitaetscheck_eingabe e,
+        LATERAL (VALUES
+            ('gesamt', ''),
+            ('veroeffentlicht', e.veroeffentlicht::text),
+            ('monat', to_char(e.erstellt_am, 'YYYY-MM'))
+        ) AS k (kennzahl, schluessel)
+        GROUP BY e.gemeinde_id, k.kennzahl, k.schluessel
+        UNION ALL
+        SELECT e.gemeinde_id, 'mobilitaetscheck', 'auswirkung',
+               coalesce(ezu.auswirkung::text, 'keine_angabe'), count(*)
+        FROM mobilitaetscheck_eingabe_ziel_unter ezu
+        JOIN mobilitaetscheck_eingabe_ziel_ober ezo
+          ON ezo.id = ezu.eingabe_ziel_ober_id
+        JOIN mobilitaetscheck_eingabe e ON e.id = ezo.eingabe_id
+        WHERE ezo.tangiert AND ezu.tangiert
+        GROUP BY e.gemeinde_id, coalesce(ezu.auswirkung::text, 'keine_angabe')
+        """)
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY, and serves the lookups
+    op.execute("""
+        CREATE UNIQUE INDEX ix_dashboard_kennzahl
+        ON dashboard_kennzahl (gemeinde_id, check_typ, kennzahl, schluessel)
+        """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW dashboard_kennzahl")
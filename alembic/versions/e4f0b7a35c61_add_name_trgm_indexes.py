@@ -0,0 +1,43 @@
+"""add name trgm indexes
+
+Revision ID: e4f0b7a35c61
+Revises: 7c2a9d41e8b3
+Create Date: 2026-10-18 16:08:44.120937
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4f0b7a35c61"
+down_revision: Union[str, None] = "7c2a9d41e8b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["indikator", "tag", "textblock"]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_name_trgm",
+            table,
+            ["name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(
+            f"ix_{table}_name_trgm",
+            table_name=table,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+    # The extension is left installed, other objects may depend on it
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from app.core.deps import auth_backend, fastapi_users
 from app.api.routers import (
+    export_job,
     gemeinde_gebiet,
     indikator,
     klimacheck,
@@ -12,6 +13,7 @@ from app.api.routers import (
     mobilitaetscheck_ziel_ober,
     mobilitaetscheck_ziel_unter,
     option,
+    statistik,
     tag,
     textblock,
     user,
@@ -98,3 +100,5 @@ router.include_router(
     tags=["Einstellungen", "Mobilitätscheck"],
 )
 router.include_router(option.router, prefix="/option", tags=["Option"])
+router.include_router(export_job.router, prefix="/exports", tags=["Export"])
+router.include_router(statistik.router, prefix="/statistik", tags=["Statistik"])
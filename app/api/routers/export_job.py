@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.exceptions import ExportJobNotReadyError
+from app.crud.export_job import crud_export_job as crud
+from app.crud.magistratsvorlage import crud_magistratsvorlage
+from app.core.deps import current_active_user, get_async_session
+from app.models.user import User
+from app.schemas.export_job import (
+    ExportJobCreate as CreateSchema,
+    ExportJobRead as ReadSchema,
+)
+from app.services.pdf.export_jobs import export_job_worker
+from app.utils.auth_util import check_user_authorization
+from app.utils.enum_util import ExportJobStatusEnum
+
+router = APIRouter()
+
+
+@router.post("", response_model=ReadSchema, status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+    obj_in: CreateSchema,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances = await crud_magistratsvorlage.get_by_ids(
+        db, obj_in.magistratsvorlage_ids, loader_profile="minimal"
+    )
+    for instance in instances:
+        check_user_authorization(user, instance.gemeinde_id)
+
+    job = await crud.create(db, obj_in, user)
+    export_job_worker.notify()
+    return job
+
+
+@router.get("/{id}", response_model=ReadSchema)
+async def get_export_job(
+    id: int,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    job = await crud.get(db, id)
+    check_user_authorization(user, job.gemeinde_id)
+    return job
+
+
+@router.get("/{id}/file", response_class=FileResponse)
+async def get_export_job_file(
+    id: int,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    job = await crud.get(db, id)
+    check_user_authorization(user, job.gemeinde_id)
+    if job.status != ExportJobStatusEnum.fertig:
+        raise ExportJobNotReadyError(id, job.status.value)
+
+    return FileResponse(
+        job.datei, media_type="application/zip", filename=f"export_{id}.zip"
+    )
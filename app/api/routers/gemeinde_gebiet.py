@@ -1,10 +1,10 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.gemeinde_gebiet import crud_gemeinde_gebiet as crud
-from app.core.deps import current_active_user, get_async_session
+from app.core.deps import check_not_modified, current_active_user, get_async_session
 from app.models.gemeinde_gebiet import GemeindeGebiet
 from app.models.user import User
 from app.schemas.gemeinde_gebiet import (
@@ -12,24 +12,40 @@ from app.schemas.gemeinde_gebiet import (
     GemeindeGebietUpdate,
     GemeindeGebietRead,
 )
-from app.utils.auth_util import check_user_authorization
+from app.schemas.pagination import PaginationParams
+from app.utils.auth_util import authorized_gemeinde_id, check_user_authorization
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[GemeindeGebietRead])
 async def get_gemeinede_gebiete(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
 
     sort_params = [("name", "asc")]
-    return await crud.get_all(
-        db=db, gemeinde_id=user.gemeinde_id, sort_params=sort_params
+    instances = await crud.get_all(
+        db=db,
+        gemeinde_id=user.gemeinde_id,
+        sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
     )
+    return instances
 
 
-@router.get("/{id}", response_model=GemeindeGebietRead)
+@router.get(
+    "/{id}",
+    response_model=GemeindeGebietRead,
+    dependencies=[Depends(check_not_modified(crud))],
+)
 async def get_gemeinde_gebiet(
     id: int,
     db: AsyncSession = Depends(get_async_session),
@@ -57,12 +73,11 @@ async def update_gemeinde_gebiet(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde_id)
-    return await crud.update(
+    return await crud.update_returning(
         db=db,
         id=id,
         obj_in=updates,
+        gemeinde_id=authorized_gemeinde_id(user),
     )
 
 
@@ -73,6 +88,6 @@ async def delete_gemeinde_gebiet(
     user: User = Depends(current_active_user),
 ):
 
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     await crud.delete(db, id)
@@ -1,43 +1,114 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status, Response
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.klimacheck_eingabe import crud_klimacheck_eingabe as crud
-from app.core.deps import current_active_user, get_async_session
+from app.crud.magistratsvorlage import crud_magistratsvorlage
+from app.core.deps import check_not_modified, current_active_user, get_async_session
 from app.models.user import User
 from app.schemas.klimacheck_eingabe import (
     KlimacheckEingabeCreate as CreateSchema,
     KlimacheckEingabeUpdate as UpdateSchema,
     KlimacheckEingabeRead as ReadSchema,
     KlimacheckEingabeFilter as FilterSchema,
+    KlimacheckEingabeSummaryRead as SummaryReadSchema,
 )
-from app.utils.auth_util import check_user_authorization
+from app.schemas.eingabe_kopie import (
+    EingabeKopieCreate as CopySchema,
+    EingabeKopieRead as CopyReadSchema,
+)
+from app.schemas.pagination import PaginationParams
+from app.utils.auth_util import authorized_gemeinde_id, check_user_authorization
+from app.utils.etag_util import etag_matches, not_modified
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[ReadSchema])
 async def get_climate_submissions(
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    sort_params = [("erstellt_am", "desc")]
+
+    instances = await crud.get_by_key(
+        db=db,
+        key="gemeinde_id",
+        value=user.gemeinde_id,
+        sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="detail",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
+
+
+@router.get(
+    "/uebersicht",
+    response_model=List[SummaryReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_climate_submission_summaries(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     sort_params = [("erstellt_am", "desc")]
 
-    return await crud.get_by_key(
+    instances = await crud.get_by_key(
         db=db,
         key="gemeinde_id",
         value=user.gemeinde_id,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="list",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
+
+
+@router.get(
+    "/suche",
+    response_model=List[SummaryReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def search_climate_submissions(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200, description="Search terms."),
+    pagination: PaginationParams = Depends(),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances, next_cursor = await crud.search(
+        db,
+        q,
+        gemeinde_id=user.gemeinde_id,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="list",
     )
+    set_next_cursor(response, next_cursor)
+    return instances
 
 
 @router.get("/nach-parametern", response_model=List[ReadSchema])
 async def filter_climate_submissions(
+    response: Response,
     user_rolle: bool = None,
     user_id: bool = None,
     veroeffentlicht: bool = None,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
@@ -54,7 +125,18 @@ async def filter_climate_submissions(
 
     sort_params = [("erstellt_am", "desc")]
 
-    return await crud.get_by_multi_keys(db=db, keys=keys, sort_params=sort_params)
+    instances = await crud.get_by_multi_keys(
+        db=db,
+        keys=keys,
+        sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="detail",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
 
 
 @router.get(
@@ -65,6 +147,8 @@ async def filter_climate_submissions(
 )
 async def get_klimacheck(
     magistratsvorlage_id: int,
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
 ):
     sort_params = [("erstellt_am", "desc")]
@@ -74,6 +158,12 @@ async def get_klimacheck(
         key="magistratsvorlage_id",
         value=magistratsvorlage_id,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="detail",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
     )
 
     if not instances:
@@ -82,42 +172,80 @@ async def get_klimacheck(
     return instances
 
 
-@router.get("/{id}", response_model=ReadSchema)
+@router.get(
+    "/{id}",
+    response_model=ReadSchema,
+    dependencies=[Depends(check_not_modified(crud))],
+)
 async def get_climate_submission(
     id: int,
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
 
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="detail")
     check_user_authorization(user, instance.gemeinde_id)
     return instance
 
 
+@router.post(
+    "/duplizieren",
+    response_model=List[CopyReadSchema],
+    status_code=status.HTTP_201_CREATED,
+)
+async def klimacheck_eingaben_duplizieren(
+    obj_in: CopySchema,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances = await crud.get_by_ids(db, obj_in.ids, loader_profile="minimal")
+    for instance in instances:
+        check_user_authorization(user, instance.gemeinde_id)
+    if obj_in.magistratsvorlage_id is not None:
+        magistratsvorlage = await crud_magistratsvorlage.get(
+            db, obj_in.magistratsvorlage_id, loader_profile="minimal"
+        )
+        check_user_authorization(user, magistratsvorlage.gemeinde_id)
+
+    id_map = await crud.copy_many(db, obj_in.ids, user, obj_in.magistratsvorlage_id)
+    return [
+        CopyReadSchema(id=id, kopie_id=id_map[id]) for id in dict.fromkeys(obj_in.ids)
+    ]
+
+
 @router.post("/duplizieren/{id}", response_model=ReadSchema)
 async def klimacheck_eingabe_duplizieren(
     id: int,
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde)
+    instance = await crud.get(db, id, loader_profile="minimal")
+    check_user_authorization(user, instance.gemeinde_id)
     return await crud.copy(db, id, user)
 
 
 @router.get("/export/{id}", status_code=status.HTTP_201_CREATED)
 async def export_climate_submission(
     id: int,
+    request: Request,
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     export = await crud.export(db, id)
+    if etag_matches(request, export.etag):
+        return not_modified(export.etag, {"Cache-Control": "private, no-cache"})
 
     filename = f"klimacheck_{id}.pdf"
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return StreamingResponse(export, media_type="application/pdf", headers=headers)
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "ETag": export.etag,
+        "Cache-Control": "private, no-cache",
+    }
+    return Response(
+        await export.render(), media_type="application/pdf", headers=headers
+    )
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=ReadSchema)
@@ -137,9 +265,14 @@ async def update_climate_submission(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde_id)
-    return await crud.update(db, id, updates, user)
+    return await crud.update_returning(
+        db,
+        id,
+        updates,
+        user,
+        gemeinde_id=authorized_gemeinde_id(user),
+        loader_profile="detail",
+    )
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -148,6 +281,6 @@ async def delete_climate_submission(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     await crud.delete(db, id)
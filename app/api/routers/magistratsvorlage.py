@@ -1,40 +1,178 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.magistratsvorlage import crud_magistratsvorlage as crud
-from app.core.deps import current_active_user, get_async_session
+from app.core.deps import check_not_modified, current_active_user, get_async_session
 from app.models.gemeinde_gebiet import GemeindeGebiet
 from app.models.user import User
 from app.schemas.magistratsvorlage import (
     MagistratsvorlageCreate as CreateSchema,
     MagistratsvorlageUpdate as UpdateSchema,
     MagistratsvorlageRead as ReadSchema,
+    MagistratsvorlageBaseRead as SummaryReadSchema,
 )
-from app.utils.auth_util import check_user_authorization
+from app.schemas.aenderungen import AenderungenRead
+from app.schemas.pagination import PaginationParams
+from app.services.pdf.batch_export import (
+    archive_exports,
+    render_in_order,
+    started,
+    zip_stream,
+)
+from app.services.pdf.render_service import pdf_render_service
+from app.utils.auth_util import authorized_gemeinde_id, check_user_authorization
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
 association_fields = {"gemeinde_gebiet_ids": (GemeindeGebiet, "gemeinde_gebiete")}
 
 
+async def export_archive(
+    db: AsyncSession, user: User, ids: List[int], filename: str
+) -> StreamingResponse:
+    """
+    Streams a ZIP of the PDFs of all checks of the given Magistratsvorlagen.
+    With several Magistratsvorlagen, each gets its own folder.
+    """
+    instances = await crud.get_by_ids(db, ids, loader_profile="minimal")
+    for instance in instances:
+        check_user_authorization(user, instance.gemeinde_id)
+
+    files = await archive_exports(db, ids)
+    stream = await started(
+        zip_stream(render_in_order(files, pdf_render_service.workers))
+    )
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    return StreamingResponse(stream, media_type="application/zip", headers=headers)
+
+
 @router.get("", response_model=List[ReadSchema])
 async def get_magistratsvorlagen(
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    sort_params = [("erstellt_am", "desc")]
+
+    instances = await crud.get_by_key(
+        db=db,
+        key="gemeinde_id",
+        value=user.gemeinde_id,
+        sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
+
+
+@router.get(
+    "/uebersicht",
+    response_model=List[SummaryReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_magistratsvorlagen_summaries(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     sort_params = [("erstellt_am", "desc")]
 
-    return await crud.get_by_key(
+    instances = await crud.get_by_key(
         db=db,
         key="gemeinde_id",
         value=user.gemeinde_id,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="list",
     )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
 
 
-@router.get("/{id}", response_model=ReadSchema)
+@router.get(
+    "/aenderungen",
+    response_model=AenderungenRead[ReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_magistratsvorlagen_changes(
+    seit: Optional[datetime] = Query(
+        None,
+        description="Sync point of the previous response, all Magistratsvorlagen without it.",
+    ),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances, geloescht, naechster_sync, vollstaendig = await crud.get_changes(
+        db, user.gemeinde_id, seit
+    )
+    return {
+        "geaendert": instances,
+        "geloescht": geloescht,
+        "seit": naechster_sync,
+        "vollstaendig": vollstaendig,
+    }
+
+
+@router.get(
+    "/suche",
+    response_model=List[SummaryReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def search_magistratsvorlagen(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200, description="Search terms."),
+    pagination: PaginationParams = Depends(),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances, next_cursor = await crud.search(
+        db,
+        q,
+        gemeinde_id=user.gemeinde_id,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="list",
+    )
+    set_next_cursor(response, next_cursor)
+    return instances
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_magistratsvorlagen(
+    ids: List[int] = Query(..., min_length=1),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    return await export_archive(db, user, ids, "magistratsvorlagen.zip")
+
+
+@router.get("/{id}/export", response_class=StreamingResponse)
+async def export_magistratsvorlage(
+    id: int,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    return await export_archive(db, user, [id], f"magistratsvorlage_{id}.zip")
+
+
+@router.get(
+    "/{id}",
+    response_model=ReadSchema,
+    dependencies=[Depends(check_not_modified(crud))],
+)
 async def get_magistratsvorlage_by_id(
     id: int,
     db: AsyncSession = Depends(get_async_session),
@@ -65,10 +203,13 @@ async def update_magistratsvorlage(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde_id)
     return await crud.update_with_associations(
-        db=db, id=id, obj_in=updates, association_fields=association_fields, user=user
+        db=db,
+        id=id,
+        obj_in=updates,
+        association_fields=association_fields,
+        user=user,
+        gemeinde_id=authorized_gemeinde_id(user),
     )
 
 
@@ -78,6 +219,6 @@ async def delete_magistratsvorlage(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     await crud.delete(db, id)
@@ -1,37 +1,132 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status, Response
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Query, Request, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.mobilitaetscheck_eingabe import crud_mobility_submission as crud
-from app.core.deps import current_active_user, get_async_session
+from app.crud.magistratsvorlage import crud_magistratsvorlage
+from app.core.deps import check_not_modified, current_active_user, get_async_session
 from app.models.user import User
 from app.schemas.mobilitaetscheck_eingabe import (
     MobilitaetscheckEingabeCreate as CreateSchema,
     MobilitaetscheckEingabeUpdate as UpdateSchema,
     MobilitaetscheckEingabeRead as ReadSchema,
     MobilitaetscheckEingabeFilter as FilterSchema,
+    MobilitaetscheckEingabeSummaryRead as SummaryReadSchema,
+    MobilitaetscheckEingabeGesamtwirkungRead as GesamtwirkungReadSchema,
 )
-from app.utils.auth_util import check_user_authorization
-from app.services.pdf.mobilitaetscheck_pdf import MobilitaetscheckPDF
+from app.schemas.eingabe_kopie import (
+    EingabeKopieCreate as CopySchema,
+    EingabeKopieRead as CopyReadSchema,
+)
+from app.schemas.aenderungen import AenderungenRead
+from app.schemas.pagination import PaginationParams
+from app.utils.auth_util import authorized_gemeinde_id, check_user_authorization
+from app.utils.etag_util import etag_matches, not_modified
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[ReadSchema], status_code=status.HTTP_200_OK)
 async def get_mobility_submissions(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     sort_params = [("erstellt_am", "desc")]
 
-    return await crud.get_by_key(
+    instances = await crud.get_by_key(
         db=db,
         key="gemeinde_id",
         value=user.gemeinde_id,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="detail",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
+
+
+@router.get(
+    "/uebersicht",
+    response_model=List[SummaryReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_mobility_submission_summaries(
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    sort_params = [("erstellt_am", "desc")]
+
+    instances = await crud.get_by_key(
+        db=db,
+        key="gemeinde_id",
+        value=user.gemeinde_id,
+        sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="list",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
+
+
+@router.get(
+    "/aenderungen",
+    response_model=AenderungenRead[ReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_mobility_submission_changes(
+    seit: Optional[datetime] = Query(
+        None,
+        description="Sync point of the previous response, all submissions without it.",
+    ),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances, geloescht, naechster_sync, vollstaendig = await crud.get_changes(
+        db, user.gemeinde_id, seit, loader_profile="detail"
+    )
+    return {
+        "geaendert": instances,
+        "geloescht": geloescht,
+        "seit": naechster_sync,
+        "vollstaendig": vollstaendig,
+    }
+
+
+@router.get(
+    "/suche",
+    response_model=List[SummaryReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def search_mobility_submissions(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200, description="Search terms."),
+    pagination: PaginationParams = Depends(),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances, next_cursor = await crud.search(
+        db,
+        q,
+        gemeinde_id=user.gemeinde_id,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="list",
     )
+    set_next_cursor(response, next_cursor)
+    return instances
 
 
 @router.get(
@@ -40,9 +135,11 @@ async def get_mobility_submissions(
     status_code=status.HTTP_200_OK,
 )
 async def filter_mobility_submissions(
+    response: Response,
     user_rolle: bool = None,
     veroeffentlicht: bool = None,
     user_id: bool = None,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
@@ -62,7 +159,18 @@ async def filter_mobility_submissions(
 
     sort_params = [("erstellt_am", "desc")]
 
-    return await crud.get_by_multi_keys(db=db, keys=keys, sort_params=sort_params)
+    instances = await crud.get_by_multi_keys(
+        db=db,
+        keys=keys,
+        sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="detail",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
 
 
 @router.get(
@@ -73,6 +181,8 @@ async def filter_mobility_submissions(
 )
 async def get_mobility_submission(
     magistratsvorlage_id: int,
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
 ):
     sort_params = [("erstellt_am", "desc")]
@@ -82,6 +192,12 @@ async def get_mobility_submission(
         key="magistratsvorlage_id",
         value=magistratsvorlage_id,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        loader_profile="detail",
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
     )
 
     if not instances:
@@ -90,17 +206,66 @@ async def get_mobility_submission(
     return instances
 
 
-@router.get("/{id}", response_model=ReadSchema, status_code=status.HTTP_200_OK)
+@router.get(
+    "/gesamtwirkung",
+    response_model=List[GesamtwirkungReadSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_mobility_submission_impacts(
+    ids: List[int] = Query(..., min_length=1, max_length=500),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    gesamtwirkung = await crud.get_gesamtwirkung(
+        db, ids, gemeinde_id=authorized_gemeinde_id(user)
+    )
+    return [
+        GesamtwirkungReadSchema(eingabe_id=id, ziele=ziele)
+        for id, ziele in gesamtwirkung.items()
+    ]
+
+
+@router.get(
+    "/{id}",
+    response_model=ReadSchema,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_not_modified(crud))],
+)
 async def get_mobility_submission(
     id: int,
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="detail")
     check_user_authorization(user, instance.gemeinde_id)
     return instance
 
 
+@router.post(
+    "/duplizieren",
+    response_model=List[CopyReadSchema],
+    status_code=status.HTTP_201_CREATED,
+)
+async def copy_mobility_submissions(
+    obj_in: CopySchema,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    instances = await crud.get_by_ids(db, obj_in.ids, loader_profile="minimal")
+    for instance in instances:
+        check_user_authorization(user, instance.gemeinde_id)
+    if obj_in.magistratsvorlage_id is not None:
+        magistratsvorlage = await crud_magistratsvorlage.get(
+            db, obj_in.magistratsvorlage_id, loader_profile="minimal"
+        )
+        check_user_authorization(user, magistratsvorlage.gemeinde_id)
+
+    id_map = await crud.copy_many(db, obj_in.ids, user, obj_in.magistratsvorlage_id)
+    return [
+        CopyReadSchema(id=id, kopie_id=id_map[id]) for id in dict.fromkeys(obj_in.ids)
+    ]
+
+
 @router.post(
     "/duplizieren/{id}",
     response_model=ReadSchema,
@@ -111,7 +276,7 @@ async def copy_mobility_submission(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     return await crud.copy(db, id, user)
 
@@ -119,20 +284,25 @@ async def copy_mobility_submission(
 @router.get("/export/{id}", status_code=status.HTTP_201_CREATED)
 async def export_mobility_submission(
     id: int,
+    request: Request,
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     pdf_export = await crud.export(db, id)
-    # validated_instance = ReadSchema.model_validate(instance)
-    # print(validated_instance.model_dump())
-    # pdf = MobilitaetscheckPDF(orientation="P", unit="mm", format="A4")
-    # pdf_export = pdf.export(validated_instance.model_dump())
+    if etag_matches(request, pdf_export.etag):
+        return not_modified(pdf_export.etag, {"Cache-Control": "private, no-cache"})
 
     filename = f"mobilitaetscheck_{id}.pdf"
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return StreamingResponse(pdf_export, media_type="application/pdf", headers=headers)
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "ETag": pdf_export.etag,
+        "Cache-Control": "private, no-cache",
+    }
+    return Response(
+        await pdf_export.render(), media_type="application/pdf", headers=headers
+    )
 
 
 @router.post("", response_model=ReadSchema, status_code=status.HTTP_201_CREATED)
@@ -144,6 +314,17 @@ async def create_mobility_submission(
     return await crud.create(db, submission, user)
 
 
+@router.post(
+    "/aus-katalog", response_model=ReadSchema, status_code=status.HTTP_201_CREATED
+)
+async def create_mobility_submission_from_catalog(
+    submission: CreateSchema,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    return await crud.create_from_catalog(db, submission, user)
+
+
 @router.patch("/{id}", response_model=ReadSchema, status_code=status.HTTP_202_ACCEPTED)
 async def update_mobility_submission(
     id: int,
@@ -151,9 +332,14 @@ async def update_mobility_submission(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde_id)
-    return await crud.update(db, id, updates, user)
+    return await crud.update_returning(
+        db,
+        id,
+        updates,
+        user,
+        gemeinde_id=authorized_gemeinde_id(user),
+        loader_profile="detail",
+    )
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -162,6 +348,6 @@ async def delete_mobility_submission(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     return await crud.delete(db, id)
@@ -1,41 +1,46 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.mobilitaetscheck_eingabe_ziel_unter import crud_mobility_subresult as crud
 from app.core.deps import current_active_user, get_async_session
 from app.models.indikator import Indikator
+from app.models.user import User
 from app.schemas.mobilitaetscheck_eingabe_ziel_unter import (
     MobilitaetscheckEingabeZielUnterCreate as CreateSchema,
     MobilitaetscheckEingabeZielUnterUpdate as UpdateSchema,
+    MobilitaetscheckEingabeZielUnterBulkUpdate as BulkUpdateSchema,
     MobilitaetscheckEingabeZielUnterRead as ReadSchema,
 )
+from app.utils.auth_util import authorized_gemeinde_id
 
 router = APIRouter()
 
 association_fields = {"indikator_ids": (Indikator, "indikatoren")}
 
 
-@router.get(
-    "/{id}",
-    response_model=ReadSchema,
-    dependencies=[Depends(current_active_user)],
-)
+@router.get("/{id}", response_model=ReadSchema)
 async def get_mobility_subresult(
-    id: int, db: AsyncSession = Depends(get_async_session)
+    id: int,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
 ):
+    await crud.check_gemeinde(
+        db, [id], authorized_gemeinde_id(user), "access this resource"
+    )
     return await crud.get(db, id)
 
 
-@router.post(
-    "",
-    status_code=status.HTTP_201_CREATED,
-    response_model=ReadSchema,
-    dependencies=[Depends(current_active_user)],
-)
+@router.post("", status_code=status.HTTP_201_CREATED, response_model=ReadSchema)
 async def create_mobility_subresult(
     obj_in: CreateSchema,
     db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
 ):
+    await crud.check_eingabe_ziel_ober_gemeinde(
+        db, obj_in.eingabe_ziel_ober_id, authorized_gemeinde_id(user)
+    )
     return await crud.create_with_associations(
         db=db,
         obj_in=obj_in,
@@ -43,16 +48,25 @@ async def create_mobility_subresult(
     )
 
 
-@router.patch(
-    "/{id}",
-    response_model=ReadSchema,
-    dependencies=[Depends(current_active_user)],
-)
+@router.patch("", response_model=List[ReadSchema])
+async def update_mobility_subresults(
+    updates: List[BulkUpdateSchema],
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    return await crud.update_many(
+        db=db, objs_in=updates, gemeinde_id=authorized_gemeinde_id(user)
+    )
+
+
+@router.patch("/{id}", response_model=ReadSchema)
 async def update_mobility_subresult(
     id: int,
     updates: UpdateSchema,
     db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
 ):
+    await crud.check_gemeinde(db, [id], authorized_gemeinde_id(user))
     return await crud.update_with_associations(
         db=db,
         id=id,
@@ -61,12 +75,13 @@ async def update_mobility_subresult(
     )
 
 
-@router.delete(
-    "/{id}",
-    status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(current_active_user)],
-)
+@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mobility_subresult(
-    id: int, db: AsyncSession = Depends(get_async_session)
+    id: int,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
 ):
+    await crud.check_gemeinde(
+        db, [id], authorized_gemeinde_id(user), "delete this resource"
+    )
     return await crud.delete(db, id)
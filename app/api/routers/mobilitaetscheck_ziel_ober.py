@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.mobilitaetscheck_ziel_ober import crud_main_objective as crud
@@ -11,25 +11,35 @@ from app.schemas.mobilitaetscheck_ziel_ober import (
     MobilitaetscheckZielOberUpdate as UpdateSchema,
     MobilitaetscheckZielOberRead as ReadSchema,
 )
-from app.utils.auth_util import check_user_authorization
+from app.schemas.pagination import PaginationParams
+from app.utils.auth_util import authorized_gemeinde_id, check_user_authorization
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[ReadSchema])
 async def get_main_objectives(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     sort_params = [("nr", "asc")]
 
     # Fetch all records using get_all
-    return await crud.get_by_key(
+    instances = await crud.get_by_key(
         db,
         key="gemeinde_id",
         value=user.gemeinde_id,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
 
 
 @router.get("/{id}", response_model=ReadSchema)
@@ -59,9 +69,9 @@ async def update_main_objective(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde_id)
-    return await crud.update(db, id, updates, user)
+    return await crud.update_returning(
+        db, id, updates, user, gemeinde_id=authorized_gemeinde_id(user)
+    )
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -70,6 +80,6 @@ async def delete_main_objective(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     await crud.delete(db, id)
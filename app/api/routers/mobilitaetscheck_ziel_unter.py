@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.mobilitaetscheck_ziel_unter import crud_sub_objective as crud
@@ -12,29 +12,41 @@ from app.schemas.mobilitaetscheck_ziel_unter import (
     MobilitaetscheckZielUnterBaseRead as ReadBaseSchema,
     MobilitaetscheckZielUnterRead as ReadSchema,
 )
-from app.utils.auth_util import check_user_authorization
+from app.schemas.pagination import PaginationParams
+from app.utils.auth_util import authorized_gemeinde_id, check_user_authorization
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[ReadSchema])
 async def get_sub_objectives(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     sort_params = [("ziel_ober.nr", "asc"), ("nr", "asc")]
 
-    return await crud.get_by_key(
+    instances = await crud.get_by_key(
         db=db,
         key="gemeinde_id",
         value=user.gemeinde_id,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
 
 
 @router.get("/nach-parametern", response_model=List[ReadSchema])
 async def get_by_params(
     ziel_ober_id: int,
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
@@ -44,11 +56,17 @@ async def get_by_params(
     }
     sort_params = [("nr", "asc")]
 
-    return await crud.get_by_multi_keys(
+    instances = await crud.get_by_multi_keys(
         db=db,
         keys=keys,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
     )
+    return instances
 
 
 @router.get("/{id}", response_model=ReadBaseSchema)
@@ -78,9 +96,9 @@ async def update_sub_objective(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde_id)
-    return await crud.update(db, id, updates, user)
+    return await crud.update_returning(
+        db, id, updates, user, gemeinde_id=authorized_gemeinde_id(user)
+    )
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -89,6 +107,6 @@ async def delete_sub_objective(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     await crud.delete(db, id)
@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.klimacheck_klimarelevanz import crud_klimacheck_klimarelevanz
@@ -10,7 +10,7 @@ from app.crud.mobilitaetscheck_auswirkung_raeumlich import (
 )
 from app.crud.gemeinde import crud_gemeinde
 from app.crud.user_rolle import crud_user_rolle
-from app.core.deps import current_active_user, get_async_session
+from app.core.deps import current_active_user, current_superuser, get_async_session
 from app.schemas.klimacheck_klimarelevanz import KlimacheckKlimarelevanzRead
 from app.schemas.klimacheck_auswirkung_dauer import KlimacheckAuswirkungDauerRead
 from app.schemas.mobilitaetscheck_auswirkung_raeumlich import (
@@ -18,6 +18,7 @@ from app.schemas.mobilitaetscheck_auswirkung_raeumlich import (
 )
 from app.schemas.gemeinde import GemeindeRead
 from app.schemas.user_rolle import UserRolleRead
+from app.services.option.option_cache import option_cache
 from app.utils.label_util import (
     KLIMACHECK_AUSWIRKUNG_LABELS,
     MOBILITAETSCHECK_AUSWIRKUNG_TICKMARK_LABELS,
@@ -31,15 +32,31 @@ router = APIRouter()
     response_model=List[GemeindeRead],
     status_code=status.HTTP_200_OK,
 )
-async def get_municipality_options(db: AsyncSession = Depends(get_async_session)):
-    return await crud_gemeinde.get_all(db=db, sort_params=[("name", "asc")])
+async def get_municipality_options(
+    request: Request, db: AsyncSession = Depends(get_async_session)
+):
+    return await option_cache.response(
+        request,
+        "gemeinde",
+        GemeindeRead,
+        lambda: crud_gemeinde.get_all(db=db, sort_params=[("name", "asc")]),
+        public=True,
+    )
 
 
 @router.get(
     "/user-rolle", response_model=List[UserRolleRead], status_code=status.HTTP_200_OK
 )
-async def get_user_role_options(db: AsyncSession = Depends(get_async_session)):
-    return await crud_user_rolle.get_all(db=db, sort_params=[("name", "asc")])
+async def get_user_role_options(
+    request: Request, db: AsyncSession = Depends(get_async_session)
+):
+    return await option_cache.response(
+        request,
+        "user-rolle",
+        UserRolleRead,
+        lambda: crud_user_rolle.get_all(db=db, sort_params=[("name", "asc")]),
+        public=True,
+    )
 
 
 @router.get(
@@ -48,9 +65,16 @@ async def get_user_role_options(db: AsyncSession = Depends(get_async_session)):
     dependencies=[Depends(current_active_user)],
     status_code=status.HTTP_200_OK,
 )
-async def get_climate_impact_options(db: AsyncSession = Depends(get_async_session)):
-    return await crud_klimacheck_klimarelevanz.get_all(
-        db=db, sort_params=[("name", "asc")]
+async def get_climate_impact_options(
+    request: Request, db: AsyncSession = Depends(get_async_session)
+):
+    return await option_cache.response(
+        request,
+        "klimacheck/klimarelevanz",
+        KlimacheckKlimarelevanzRead,
+        lambda: crud_klimacheck_klimarelevanz.get_all(
+            db=db, sort_params=[("name", "asc")]
+        ),
     )
 
 
@@ -74,10 +98,15 @@ async def get_climate_impact_ghg_options():
     status_code=status.HTTP_200_OK,
 )
 async def get_climate_impact_duration_options(
-    db: AsyncSession = Depends(get_async_session),
+    request: Request, db: AsyncSession = Depends(get_async_session)
 ):
-    return await crud_klimacheck_auswirkung_dauer.get_all(
-        db=db, sort_params=[("name", "asc")]
+    return await option_cache.response(
+        request,
+        "klimacheck/auswirkung-dauer",
+        KlimacheckAuswirkungDauerRead,
+        lambda: crud_klimacheck_auswirkung_dauer.get_all(
+            db=db, sort_params=[("name", "asc")]
+        ),
     )
 
 
@@ -88,10 +117,15 @@ async def get_climate_impact_duration_options(
     status_code=status.HTTP_200_OK,
 )
 async def get_mobility_spatial_impact_options(
-    db: AsyncSession = Depends(get_async_session),
+    request: Request, db: AsyncSession = Depends(get_async_session)
 ):
-    return await crud_mobilitaetscheck_auswirkung_raeumlich.get_all(
-        db=db, sort_params=[("name", "asc")]
+    return await option_cache.response(
+        request,
+        "mobilitaetscheck/auswirkung-raeumlich",
+        MobilitaetscheckAuswirkungRaeumlichRead,
+        lambda: crud_mobilitaetscheck_auswirkung_raeumlich.get_all(
+            db=db, sort_params=[("name", "asc")]
+        ),
     )
 
 
@@ -107,3 +141,16 @@ async def get_mobility_impact_tickmarks_options():
         for value, label in MOBILITAETSCHECK_AUSWIRKUNG_TICKMARK_LABELS.items()
     ]
     return result
+
+
+@router.delete(
+    "/cache",
+    dependencies=[Depends(current_superuser)],
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def clear_option_cache():
+    """
+    Drops the cached options of this app worker, e.g. after the reference
+    data was changed directly in the database.
+    """
+    option_cache.clear()
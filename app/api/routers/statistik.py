@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import current_active_user, get_async_session
+from app.models.user import User
+from app.schemas.dashboard import DashboardRead
+from app.schemas.mobilitaetscheck_statistik import MobilitaetscheckStatistikRead
+from app.services.statistik.dashboard import get_dashboard
+from app.services.statistik.mobilitaetscheck_statistik import statistik_cache
+from app.utils.auth_util import check_user_authorization
+
+router = APIRouter()
+
+
+@router.get("/dashboard", response_model=DashboardRead)
+async def get_dashboard_counts(
+    gemeinde_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    if gemeinde_id is None:
+        gemeinde_id = user.gemeinde_id
+    check_user_authorization(user, gemeinde_id)
+    return await get_dashboard(db, gemeinde_id)
+
+
+@router.get("/mobilitaetscheck", response_model=MobilitaetscheckStatistikRead)
+async def get_mobility_statistics(
+    gemeinde_id: Optional[int] = None,
+    user: User = Depends(current_active_user),
+):
+    if gemeinde_id is None:
+        gemeinde_id = user.gemeinde_id
+    check_user_authorization(user, gemeinde_id)
+    return await statistik_cache.get(gemeinde_id)
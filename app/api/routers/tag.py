@@ -1,35 +1,59 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.tag import crud_tag as crud
-from app.core.deps import current_active_user, get_async_session
+from app.core.deps import check_not_modified, current_active_user, get_async_session
 from app.models.user import User
 from app.schemas.tag import (
     TagCreate as CreateSchema,
     TagUpdate as UpdateSchema,
     TagRead as ReadSchema,
 )
+from app.schemas.pagination import PaginationParams
 from app.utils.auth_util import check_user_authorization
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[ReadSchema])
 async def get_tags(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     sort_params = [("name", "asc")]
-    return await crud.get_by_or_keys(
+    instances = await crud.get_by_or_keys(
         db,
         or_keys=[{"gemeinde_id": user.gemeinde_id}, {"gemeindespezifisch": False}],
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
+
 
+@router.get("/vorschlaege", response_model=List[ReadSchema])
+async def get_tag_suggestions(
+    q: str = Query(..., min_length=1, max_length=100, description="Typed text."),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions."),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    return await crud.suggest(db, q, user.gemeinde_id, limit=limit)
 
-@router.get("/{id}", response_model=ReadSchema)
+
+@router.get(
+    "/{id}",
+    response_model=ReadSchema,
+    dependencies=[Depends(check_not_modified(crud))],
+)
 async def get_tag(
     id: int,
     db: AsyncSession = Depends(get_async_session),
@@ -58,7 +82,7 @@ async def update_tag(
     user: User = Depends(current_active_user),
 ):
 
-    tag = await crud.get(db, id)
+    tag = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, tag.gemeinde_id)
     return await crud.update(db, id, updates)
 
@@ -70,6 +94,6 @@ async def delete_tag(
     user: User = Depends(current_active_user),
 ):
 
-    tag = await crud.get(db, id)
+    tag = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, tag.gemeinde_id)
     await crud.delete(db, id)
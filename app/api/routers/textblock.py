@@ -1,10 +1,10 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.textblock import crud_textblock as crud
-from app.core.deps import current_active_user, get_async_session
+from app.core.deps import check_not_modified, current_active_user, get_async_session
 from app.models.textblock import Textblock
 from app.models.user import User
 from app.models.tag import Tag
@@ -13,7 +13,11 @@ from app.schemas.textblock import (
     TextblockUpdate as UpdateSchema,
     TextblockRead as ReadSchema,
 )
-from app.utils.auth_util import check_user_authorization
+from app.schemas.katalog_facette import KatalogFacettenRead
+from app.schemas.pagination import PaginationParams
+from app.utils.auth_util import authorized_gemeinde_id, check_user_authorization
+from app.utils.enum_util import TagModusEnum
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
@@ -22,18 +26,59 @@ association_fields = {"tag_ids": (Tag, "tags")}
 
 @router.get("", response_model=List[ReadSchema])
 async def get_all_text_blocks(
+    response: Response,
+    tag_ids: List[int] = Query([], description="Only entries with these tags."),
+    tag_modus: TagModusEnum = Query(
+        TagModusEnum.oder, description="Entries with any (oder) or all (und) tags."
+    ),
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     sort_params = [("name", "asc")]
-    return await crud.get_by_or_keys(
+    instances = await crud.get_visible(
         db,
-        or_keys=[{"gemeinde_id": user.gemeinde_id}, {"gemeindespezifisch": False}],
+        user.gemeinde_id,
+        tag_ids=tag_ids,
+        tag_modus=tag_modus,
         sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
+    )
+    return instances
+
+
+@router.get("/facetten", response_model=KatalogFacettenRead)
+async def get_text_block_facets(
+    tag_ids: List[int] = Query([], description="Only entries with these tags."),
+    tag_modus: TagModusEnum = Query(
+        TagModusEnum.oder, description="Entries with any (oder) or all (und) tags."
+    ),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    anzahl, tags = await crud.count_tags(db, user.gemeinde_id, tag_ids, tag_modus)
+    return KatalogFacettenRead(anzahl=anzahl, tags=tags)
 
 
-@router.get("/{id}", response_model=ReadSchema)
+@router.get("/vorschlaege", response_model=List[ReadSchema])
+async def get_text_block_suggestions(
+    q: str = Query(..., min_length=1, max_length=100, description="Typed text."),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions."),
+    db: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    return await crud.suggest(db, q, user.gemeinde_id, limit=limit)
+
+
+@router.get(
+    "/{id}",
+    response_model=ReadSchema,
+    dependencies=[Depends(check_not_modified(crud))],
+)
 async def get_text_block(
     id: int,
     db: AsyncSession = Depends(get_async_session),
@@ -65,13 +110,12 @@ async def update_text_block(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
-    check_user_authorization(user, instance.gemeinde_id)
     return await crud.update_with_associations(
         db=db,
         id=id,
         obj_in=updates,
         user=user,
+        gemeinde_id=authorized_gemeinde_id(user),
         association_fields=association_fields,
     )
 
@@ -82,6 +126,6 @@ async def delete_text_block(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
-    instance = await crud.get(db, id)
+    instance = await crud.get(db, id, loader_profile="minimal")
     check_user_authorization(user, instance.gemeinde_id)
     await crud.delete(db, id)
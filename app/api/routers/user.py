@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from typing import List
@@ -6,7 +6,9 @@ from typing import List
 from app.core.deps import current_superuser, get_async_session
 from app.crud.user import crud_user as crud
 from app.models.user import User
+from app.schemas.pagination import PaginationParams
 from app.schemas.user import UserRead as ReadSchema
+from app.utils.pagination_util import set_next_cursor
 
 router = APIRouter()
 
@@ -17,13 +19,20 @@ router = APIRouter()
     dependencies=[Depends(current_superuser)],
 )
 async def get_all_users_in_municipality(
+    response: Response,
+    pagination: PaginationParams = Depends(),
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_superuser),
 ):
-
+    sort_params = [("name", "asc")]
     instances = await crud.get_all(
         db=db,
         gemeinde_id=user.gemeinde_id,
-        sort_params=[("name", "asc")],
+        sort_params=sort_params,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(
+        response, crud.next_cursor(instances, sort_params, pagination.limit)
     )
     return instances
@@ -0,0 +1,124 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# {table name: IDs of the written rows, or None if they are not known}
+Changes = Dict[str, Optional[Set[Any]]]
+
+# Execution option naming the rows an UPDATE or DELETE statement writes, for
+# statements whose rows cannot be told from their parameters
+CHANGED_IDS = "changed_ids"
+
+# Changes of the current transaction of a session
+_CHANGES = "changes"
+
+# (tables, callback, whether it takes the rows, whether it runs for other workers)
+_callbacks: List[Tuple[Set[str], Callable[..., None], bool, bool]] = []
+_publishers: List[Callable[[Changes], None]] = []
+
+
+def on_commit(
+    tables: Iterable[str], callback: Callable[[], None], remote: bool = True
+) -> None:
+    """
+    Registers a callback which runs after every commit that wrote to one of
+    the tables, be it by flushed ORM instances or by `INSERT`, `UPDATE` and
+    `DELETE` statements.
+
+    Commits of this process run the callback synchronously, so it should only
+    clear or schedule something. Commits of other app workers run it once
+    their changes arrive through the invalidation bus, unless `remote` is off.
+    """
+    _callbacks.append((set(tables), callback, False, remote))
+
+
+def on_commit_rows(
+    tables: Iterable[str], callback: Callable[[str, Optional[Set[Any]]], None]
+) -> None:
+    """
+    Like `on_commit`, for callbacks evicting single rows. The callback runs
+    per written table with the IDs of the rows, or with None if they are not
+    known. IDs from other app workers arrive as strings.
+    """
+    _callbacks.append((set(tables), callback, True, True))
+
+
+def on_publish(publisher: Callable[[Changes], None]) -> None:
+    """Registers a function passing the changes of every commit on."""
+    _publishers.append(publisher)
+
+
+def watched_tables() -> Set[str]:
+    """The tables with callbacks for changes of other app workers."""
+    return {table for tables, *_, remote in _callbacks if remote for table in tables}
+
+
+def dispatch(changes: Changes, remote: bool = False) -> None:
+    """
+    Runs the callbacks of the tables in `changes`, committed by this process
+    or, if `remote`, by another app worker.
+    """
+    for tables, callback, rows, for_remote in _callbacks:
+        written = tables & changes.keys()
+        if not written or (remote and not for_remote):
+            continue
+        if not rows:
+            callback()
+            continue
+        for table in written:
+            callback(table, changes[table])
+
+
+def _add(session: Session, table: str, ids: Optional[Iterable[Any]]) -> None:
+    changes: Changes = session.info.setdefault(_CHANGES, {})
+    if ids is None or (table in changes and changes[table] is None):
+        changes[table] = None
+    else:
+        changes.setdefault(table, set()).update(ids)
+
+
+def _statement_ids(state: ORMExecuteState) -> Optional[List[Any]]:
+    ids = state.execution_options.get(CHANGED_IDS)
+    if ids is not None:
+        return list(ids)
+    # Bulk UPDATE by primary key, with one parameter set per row
+    params = state.parameters
+    if state.is_update and isinstance(params, list) and params:
+        if all(isinstance(p, dict) and "id" in p for p in params):
+            return [p["id"] for p in params]
+    return None
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            ids = None if state.is_insert else _statement_ids(state)
+            _add(state.session, table.name, ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session: Session, flush_context: Any) -> None:
+    # Still the flushed instances, now with their primary keys
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table is not None:
+            key = inspect(instance).mapper.primary_key_from_instance(instance)
+            _add(session, table, None if None in key else key)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    changes = session.info.pop(_CHANGES, None)
+    if not changes:
+        return
+    dispatch(changes)
+    for publisher in _publishers:
+        publisher(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_CHANGES, None)
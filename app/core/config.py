@@ -53,6 +53,34 @@ class Settings(BaseSettings):
     RESET_PASSWORD_TOKEN_SECRET: str = secrets.token_urlsafe(32)
     VERIFICATION_TOKEN_SECRET: str = secrets.token_urlsafe(32)
     JWT_LIFETIME_SECONDS: int = 60 * 60 * 12  # 12 hours
+    USER_CACHE_TTL_SECONDS: int = 60  # 0 disables the cache
+    USER_CACHE_MAX_SIZE: int = 10_000
+
+    # PDF Settings
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_MAX_QUEUE: int = 16  # running and waiting renders per app worker
+    PDF_RENDER_TIMEOUT_SECONDS: float = 30
+    PDF_CACHE_MAX_SIZE_MB: int = 256  # 0 disables the cache
+    EXPORT_JOB_DIR: str = "exports"
+    EXPORT_JOB_CONCURRENCY: int = 1  # jobs run at the same time per app worker
+    EXPORT_JOB_RETENTION_HOURS: int = 24
+    EXPORT_JOB_POLL_SECONDS: float = 5
+
+    # Statistik Settings
+    STATISTIK_CACHE_TTL_SECONDS: int = 300  # 0 disables the cache
+    DASHBOARD_REFRESH_DELAY_SECONDS: float = 5  # debounce of the view refresh
+
+    # Cache Invalidation Settings
+    INVALIDATION_BUS_ENABLED: bool = True  # LISTEN/NOTIFY between app workers
+    INVALIDATION_BUS_CHANNEL: str = "cache_invalidation"
+    INVALIDATION_BUS_RETRY_SECONDS: float = 5
+
+    # Option Settings
+    OPTION_CACHE_TTL_SECONDS: int = 60 * 60  # 0 disables the cache
+    OPTION_CACHE_MAX_AGE_SECONDS: int = 60 * 60 * 24  # Cache-Control of the responses
+
+    # Delta Sync Settings
+    LOESCHPROTOKOLL_RETENTION_DAYS: int = 30  # older sync points get all records
 
     # FastAPI Settings
     DOMAIN: str
@@ -1,11 +1,10 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi_users import FastAPIUsers
 from fastapi_users.authentication import (
     AuthenticationBackend,
     CookieTransport,
-    JWTStrategy,
 )
 from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,7 +13,10 @@ from uuid import UUID
 from app.core.config import settings
 from app.core.db import async_session_maker
 from app.models.user import User
+from app.services.user.user_cache import CachedJWTStrategy
 from app.services.user.user_manager import UserManager
+from app.utils.auth_util import check_user_authorization
+from app.utils.etag_util import http_date, is_not_modified, last_modified_etag
 
 
 # Asynchronous Database Dependencies
@@ -38,8 +40,8 @@ cookie_transport = CookieTransport(
 )
 
 
-def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(
+def get_jwt_strategy() -> CachedJWTStrategy:
+    return CachedJWTStrategy(
         secret=settings.JWT_SECRET_KEY, lifetime_seconds=settings.JWT_LIFETIME_SECONDS
     )
 
@@ -56,3 +58,36 @@ fastapi_users = FastAPIUsers[User, UUID](get_user_manager, [auth_backend])
 current_user = fastapi_users.current_user()
 current_active_user = fastapi_users.current_user(active=True, verified=True)
 current_superuser = fastapi_users.current_user(superuser=True)
+
+
+# Conditional Request Dependencies
+def check_not_modified(crud: Any) -> Callable[..., Awaitable[None]]:
+    """
+    Dependency for a detail GET by `id` of the model of `crud`, which answers
+    `If-None-Match` and `If-Modified-Since` with 304 Not Modified from the
+    record's `zuletzt_geaendert_am` alone, before the route loads and
+    serialises the record.
+
+    Otherwise the response gets the validators as read before the record is
+    loaded, so a change in between is sent again on the next request.
+    """
+
+    async def dependency(
+        id: int,
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user),
+    ) -> None:
+        row = await crud.get_last_modified(db, id)
+        check_user_authorization(user, row.gemeinde_id)
+        headers = {
+            "ETag": last_modified_etag(id, row.zuletzt_geaendert_am),
+            "Last-Modified": http_date(row.zuletzt_geaendert_am),
+            "Cache-Control": "private, no-cache",
+        }
+        if is_not_modified(request, headers["ETag"], row.zuletzt_geaendert_am):
+            raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import uuid
+from typing import Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.changes import Changes, dispatch, on_publish, watched_tables
+from app.core.config import settings
+from app.core.db import async_engine
+
+# NOTIFY payloads are limited to 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+
+
+class InvalidationBus:
+    """
+    Passes the changes committed by one app worker on to all the others
+    through Postgres `LISTEN`/`NOTIFY`, so each of them evicts what its
+    in-process caches hold of the changed rows.
+
+    Every commit is sent as the written tables with the IDs of the rows, see
+    `app.core.changes`; subscribers register there with `on_commit` and
+    `on_commit_rows`. Notifications sent while a worker was disconnected are
+    lost, so after a reconnect it evicts everything.
+    """
+
+    def __init__(self, engine: AsyncEngine, channel: str, retry_seconds: float):
+        self.engine = engine
+        self.channel = channel
+        self.retry_seconds = retry_seconds
+        self.worker_id = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+        self._notifications: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        tasks = [*self._notifications]
+        if self._listener is not None:
+            self._listener.cancel()
+            tasks.append(self._listener)
+            self._listener = None
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def publish(self, changes: Changes) -> None:
+        """Sends the changes of a commit of this worker, without waiting."""
+        if self._listener is None:
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._notify(self.encode(changes))
+        )
+        self._notifications.add(task)
+        task.add_done_callback(self._notifications.discard)
+
+    def encode(self, changes: Changes) -> str:
+        tabellen = {
+            table: None if ids is None else sorted(str(id) for id in ids)
+            for table, ids in changes.items()
+        }
+        payload = json.dumps({"von": self.worker_id, "tabellen": tabellen})
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            # Too many rows, whole tables are evicted instead
+            tabellen = dict.fromkeys(changes)
+            payload = json.dumps({"von": self.worker_id, "tabellen": tabellen})
+        return payload
+
+    def receive(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message["von"] == self.worker_id:
+                return
+            changes = {
+                table: None if ids is None else set(ids)
+                for table, ids in message["tabellen"].items()
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return
+        dispatch(changes, remote=True)
+
+    async def _notify(self, payload: str) -> None:
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(select(func.pg_notify(self.channel, payload)))
+                await conn.commit()
+        except Exception as e:
+            # The other workers catch up after their TTLs
+            print(e)
+
+    async def _listen(self) -> None:
+        connected_before = False
+        while True:
+            try:
+                async with self.engine.connect() as conn:
+                    await conn.execution_options(isolation_level="AUTOCOMMIT")
+                    await conn.exec_driver_sql(f'LISTEN "{self.channel}"')
+                    if connected_before:
+                        dispatch(dict.fromkeys(watched_tables()), remote=True)
+                    connected_before = True
+
+                    raw = await conn.get_raw_connection()
+                    try:
+                        async for notify in raw.driver_connection.notifies():
+                            self.receive(notify.payload)
+                    finally:
+                        # Still listening, it is not handed out again
+                        await conn.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The database may be unavailable, reconnect after a pause
+                print(e)
+            await asyncio.sleep(self.retry_seconds)
+
+
+invalidation_bus = InvalidationBus(
+    engine=async_engine,
+    channel=settings.INVALIDATION_BUS_CHANNEL,
+    retry_seconds=settings.INVALIDATION_BUS_RETRY_SECONDS,
+)
+
+on_publish(invalidation_bus.publish)
@@ -0,0 +1,85 @@
+from typing import Any, Dict, Iterable, Set, Tuple
+
+from sqlalchemy import and_, bindparam, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.util import identity_key
+
+# {parent id: target ids} of a many-to-many relationship
+Associations = Dict[Any, Iterable[Any]]
+
+
+async def sync_associations(
+    db: AsyncSession,
+    relationship: InstrumentedAttribute,
+    associations: Associations,
+) -> None:
+    """
+    Sets the targets of a many-to-many relationship for several parents,
+    inserting and deleting only the association rows which change.
+
+    The rows are written with executemany statements in the current
+    transaction, which the caller commits. Target IDs that do not exist are
+    ignored, as they were when the collections were assigned.
+
+    :param relationship: The relationship, e.g. `Indikator.tags`, whose
+        `secondary` table holds the associations.
+    :param associations: The target IDs per parent ID. Parents which are not
+        given keep their targets.
+    """
+    if not associations:
+        return
+
+    prop = relationship.property
+    table = prop.secondary
+    # Single column foreign keys, as on all association tables of this app
+    ((parent_pk, parent_fk),) = prop.synchronize_pairs
+    ((target_pk, target_fk),) = prop.secondary_synchronize_pairs
+
+    requested = {id for ids in associations.values() for id in ids}
+    known: Set[Any] = set()
+    if requested:
+        result = await db.execute(select(target_pk).where(target_pk.in_(requested)))
+        known = set(result.scalars().all())
+
+    result = await db.execute(
+        select(parent_fk, target_fk).where(parent_fk.in_(list(associations)))
+    )
+    current: Set[Tuple[Any, Any]] = {tuple(row) for row in result.all()}
+    target = {
+        (parent_id, target_id)
+        for parent_id, ids in associations.items()
+        for target_id in set(ids) & known
+    }
+
+    removed = current - target
+    added = target - current
+    if removed:
+        await db.execute(
+            delete(table).where(
+                and_(
+                    parent_fk == bindparam("parent_id"),
+                    target_fk == bindparam("target_id"),
+                )
+            ),
+            [
+                {"parent_id": parent_id, "target_id": target_id}
+                for parent_id, target_id in removed
+            ],
+        )
+    if added:
+        await db.execute(
+            insert(table),
+            [
+                {parent_fk.key: parent_id, target_fk.key: target_id}
+                for parent_id, target_id in added
+            ],
+        )
+
+    # Loaded collections no longer match the table, they are loaded again on use
+    for parent_id in associations:
+        instance = db.sync_session.identity_map.get(
+            identity_key(prop.parent.class_, parent_id)
+        )
+        if instance is not None:
+            db.expire(instance, [prop.key])
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import (
     Any,
     Dict,
@@ -11,16 +12,37 @@ from typing import (
     Union,
 )
 
-from sqlalchemy import desc, asc, or_
+from sqlalchemy import Double, cast, desc, asc, func, or_, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import aliased, joinedload, RelationshipProperty
-from sqlalchemy.sql import Select
-
-
-from app.crud.exceptions import DatabaseCommitError, NotFoundError
+from sqlalchemy.orm import aliased, joinedload, raiseload, RelationshipProperty
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import ColumnElement, Select
+
+
+from app.core.changes import CHANGED_IDS
+from app.crud.association import sync_associations
+from app.crud.exceptions import AuthorizationError, DatabaseCommitError, NotFoundError
+from app.crud.last_modified import (
+    embedding_keys,
+    is_tracked,
+    log_deletion,
+    retention,
+    sync_point,
+    touch_embedding,
+)
+from app.models.loeschprotokoll import Loeschprotokoll
 from app.models.user import User
+from app.utils.pagination_util import (
+    KeysetColumn,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+
+# Text search configuration of the `suchtext` columns and of the queries
+SEARCH_CONFIG = "german"
 
 # Define generic type variables for models and schemas
 ModelType = TypeVar("ModelType")
@@ -30,6 +52,18 @@ UpdateSchemaType = TypeVar("UpdateSchemaType")
 sorting_order = Literal["asc", "desc"]
 
 
+def load_user_read(relationship: Any) -> Any:
+    """
+    Joined load of a user relationship with the role and municipality serialized
+    by `UserRead`, without the users of that municipality or role.
+    """
+    return joinedload(relationship).options(
+        joinedload(User.rolle).raiseload("*"),
+        joinedload(User.gemeinde).raiseload("*"),
+        raiseload("*"),
+    )
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         """
@@ -39,8 +73,40 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    @property
+    def loader_profiles(self) -> Dict[str, List[Any]]:
+        """
+        Named sets of loader options which replace the relationship loading
+        declared on the model for a single query. Subclasses extend these with
+        profiles such as "list", "detail" or "pdf" for their routes.
+
+        * `minimal`: Only the columns of the model, e.g. for authorization checks.
+        """
+        return {"minimal": [raiseload("*")]}
+
+    def loader_options(self, loader_profile: Optional[str] = None) -> List[Any]:
+        """
+        Resolves a loader profile into its loader options. Without a profile the
+        relationships are loaded as declared on the model.
+
+        :raises ValueError: If the profile is not defined for this model.
+        """
+        if loader_profile is None:
+            return []
+        try:
+            return self.loader_profiles[loader_profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown loader profile '{loader_profile}' for {self.model.__name__}."
+            )
+
     def extend_statement(
-        self, statement: select, *, extra_fields: List[Any] = []
+        self,
+        statement: select,
+        *,
+        extra_fields: List[Any] = [],
+        options: List[Any] = [],
+        loader_profile: Optional[str] = None,
     ) -> select:
         for field in extra_fields:
             if (
@@ -49,6 +115,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 and hasattr(self.model, field.key)
             ):
                 statement = statement.options(joinedload(field))
+        options = [*self.loader_options(loader_profile), *options]
+        if options:
+            # Loader options (load_only, noload, ...) replacing the mapped defaults
+            statement = statement.options(*options)
         return statement
 
     # def sort(
@@ -175,6 +245,77 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return statement
 
+    def keyset_columns(self, sort_params) -> List[KeysetColumn]:
+        """
+        Resolves the sort parameters into the columns of the keyset, with the primary
+        key appended as a tie-breaker so that every row has a unique position.
+
+        Only columns of the model itself can be part of a keyset; the columns should
+        not be nullable.
+        """
+        keys = []
+        for attr, sort_instruction in sort_params:
+            if not isinstance(sort_instruction, str):
+                raise ValueError(
+                    "Keyset pagination only supports sorting by columns of the model."
+                )
+            column = getattr(self.model, attr, None)
+            if column is not None:
+                keys.append((column, sort_instruction))
+
+        if not any(column.key == "id" for column, _ in keys):
+            keys.append((self.model.id, keys[-1][1] if keys else "asc"))
+
+        return keys
+
+    def apply_pagination(
+        self,
+        statement: Select,
+        sort_params,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Select:
+        """
+        Restricts an already sorted statement to the page following `cursor`.
+
+        Args:
+            statement (Select): The statement with sorting applied.
+            sort_params (List[Tuple]): Sorting parameters used for the statement.
+            limit (Optional[int]): Page size. Without a limit the statement is returned unchanged.
+            cursor (Optional[str]): Cursor returned by `next_cursor` for the previous page.
+
+        Returns:
+            Select: The statement with the keyset condition and limit applied.
+        """
+        if limit is None:
+            return statement
+
+        keys = self.keyset_columns(sort_params)
+        id_column, id_order = keys[-1]
+        if id_column.key == "id" and all(attr != "id" for attr, _ in sort_params):
+            statement = statement.order_by(
+                asc(id_column) if id_order == "asc" else desc(id_column)
+            )
+
+        if cursor:
+            statement = statement.where(
+                keyset_condition(keys, decode_cursor(cursor, keys))
+            )
+
+        return statement.limit(limit)
+
+    def next_cursor(
+        self, instances: List[ModelType], sort_params, limit: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Returns the cursor for the page after `instances`, or None if the page is not full.
+        """
+        if limit is None or len(instances) < limit:
+            return None
+
+        keys = self.keyset_columns(sort_params)
+        return encode_cursor([getattr(instances[-1], column.key) for column, _ in keys])
+
     async def get_all(
         self,
         db: AsyncSession,
@@ -183,6 +324,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Tuple[str, Union[str, Tuple[str, Union[str, Tuple[str, str]]]]]
         ] = [],
         extra_fields: List[Any] = [],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        options: List[Any] = [],
+        loader_profile: Optional[str] = None,
     ) -> List[ModelType]:
         """
         Retrieve all records for the model, optionally filtering by municipality_id.
@@ -190,10 +335,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         statement = select(self.model)
         # Apply sorting
         statement = self.apply_sorting(statement, self.model, sort_params)
-        statement = self.extend_statement(statement, extra_fields=extra_fields)
+        statement = self.extend_statement(
+            statement,
+            extra_fields=extra_fields,
+            options=options,
+            loader_profile=loader_profile,
+        )
 
         if gemeinde_id is not None:
             statement = statement.where(self.model.gemeinde_id == gemeinde_id)
+        statement = self.apply_pagination(statement, sort_params, limit, cursor)
 
         result = await db.execute(statement)
         instances = result.scalars().all()
@@ -207,11 +358,21 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return instances
 
     async def get(
-        self, db: AsyncSession, id: Any, extra_fields: List[Any] = []
+        self,
+        db: AsyncSession,
+        id: Any,
+        extra_fields: List[Any] = [],
+        options: List[Any] = [],
+        loader_profile: Optional[str] = None,
     ) -> Optional[ModelType]:
         """Retrieve a single record by ID."""
         statement = select(self.model).where(self.model.id == id)
-        statement = self.extend_statement(statement, extra_fields=extra_fields)
+        statement = self.extend_statement(
+            statement,
+            extra_fields=extra_fields,
+            options=options,
+            loader_profile=loader_profile,
+        )
         result = await db.execute(statement)
         instance = result.scalars().first()
 
@@ -220,6 +381,98 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return instance
 
+    async def get_by_ids(
+        self,
+        db: AsyncSession,
+        ids: List[Any],
+        extra_fields: List[Any] = [],
+        options: List[Any] = [],
+        loader_profile: Optional[str] = None,
+    ) -> List[ModelType]:
+        """Retrieve several records by ID in a single query, in the order of `ids`."""
+        statement = select(self.model).where(self.model.id.in_(ids))
+        statement = self.extend_statement(
+            statement,
+            extra_fields=extra_fields,
+            options=options,
+            loader_profile=loader_profile,
+        )
+        result = await db.execute(statement)
+        instances = {instance.id: instance for instance in result.scalars().all()}
+
+        missing = [id for id in ids if id not in instances]
+        if missing:
+            raise NotFoundError(self.model.__name__, missing[0])
+
+        return [instances[id] for id in dict.fromkeys(ids)]
+
+    async def get_changes(
+        self,
+        db: AsyncSession,
+        gemeinde_id: int,
+        seit: Optional[datetime] = None,
+        loader_profile: Optional[str] = None,
+    ) -> Tuple[List[ModelType], List[Any], datetime, bool]:
+        """
+        The records of a municipality changed since a sync point and the IDs of
+        those deleted since, for clients updating their copy of a list.
+
+        Changes are found by `zuletzt_geaendert_am`, deletions in the
+        `Loeschprotokoll`. Records may be returned again by the following sync,
+        but none is missed, see `sync_point`.
+
+        :param seit: The sync point returned by the previous call. Without it,
+            or if it is older than the deletions are kept, all records are
+            returned.
+        :return: The changed records, oldest change first, the IDs of the
+            deleted records, the sync point for the next call and whether the
+            records are all of the municipality's rather than the changes.
+        """
+        if seit is not None and seit.tzinfo is None:
+            seit = seit.replace(tzinfo=timezone.utc)
+        naechster_sync = await sync_point(db)
+        vollstaendig = seit is None or seit < naechster_sync - retention()
+
+        statement = select(self.model).where(self.model.gemeinde_id == gemeinde_id)
+        if not vollstaendig:
+            statement = statement.where(self.model.zuletzt_geaendert_am >= seit)
+        statement = statement.order_by(self.model.zuletzt_geaendert_am, self.model.id)
+        statement = self.extend_statement(statement, loader_profile=loader_profile)
+        result = await db.execute(statement)
+        instances = list(result.scalars().all())
+
+        geloescht: List[Any] = []
+        if not vollstaendig:
+            result = await db.execute(
+                select(Loeschprotokoll.datensatz_id)
+                .where(
+                    Loeschprotokoll.tabelle == self.model.__tablename__,
+                    Loeschprotokoll.gemeinde_id == gemeinde_id,
+                    Loeschprotokoll.geloescht_am >= seit,
+                )
+                .distinct()
+            )
+            geloescht = list(result.scalars().all())
+
+        return instances, geloescht, naechster_sync, vollstaendig
+
+    async def get_last_modified(self, db: AsyncSession, id: Any) -> Row:
+        """
+        The time of the last change of a record, as `zuletzt_geaendert_am`, and
+        its `gemeinde_id`, for answering conditional requests without loading it.
+
+        :raises NotFoundError: If the record does not exist.
+        """
+        result = await db.execute(
+            select(self.model.zuletzt_geaendert_am, self.model.gemeinde_id).where(
+                self.model.id == id
+            )
+        )
+        row = result.first()
+        if row is None:
+            raise NotFoundError(self.model.__name__, id)
+        return row
+
     async def get_by_key(
         self,
         db: AsyncSession,
@@ -230,10 +483,20 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Tuple[str, Union[str, Tuple[str, Union[str, Tuple[str, str]]]]]
         ] = [],
         extra_fields: List[Any] = [],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        options: List[Any] = [],
+        loader_profile: Optional[str] = None,
     ) -> Optional[ModelType]:
         statement = select(self.model).where(getattr(self.model, key) == value)
         statement = self.apply_sorting(statement, self.model, sort_params)
-        statement = self.extend_statement(statement, extra_fields=extra_fields)
+        statement = self.apply_pagination(statement, sort_params, limit, cursor)
+        statement = self.extend_statement(
+            statement,
+            extra_fields=extra_fields,
+            options=options,
+            loader_profile=loader_profile,
+        )
         result = await db.execute(statement)
         instances = result.scalars().all()
 
@@ -254,6 +517,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         sort_params: List[
             Tuple[str, Union[str, Tuple[str, Union[str, Tuple[str, str]]]]]
         ] = [],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        options: List[Any] = [],
+        loader_profile: Optional[str] = None,
     ) -> List[ModelType]:
         """
         Retrieves records that match at least one of the key-value conditions provided.
@@ -263,6 +530,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             or_keys (List[Dict[str, Any]]): A list of dictionaries, each representing a set of conditions to be OR'ed together.
             extra_fields (Optional[List[Any]]): SQLAlchemy query options like joinedload.
             sort_params (Optional[List[Tuple]]): Sort parameters.
+            limit (Optional[int]): Page size for keyset pagination.
+            cursor (Optional[str]): Cursor of the previous page.
+            options (Optional[List[Any]]): Loader options overriding the mapped relationship loading.
+            loader_profile (Optional[str]): Name of a profile from `loader_profiles`.
 
         Returns:
             List[ModelType]: List of model instances matching any of the filters.
@@ -299,9 +570,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         # Apply sorting
         statement = self.apply_sorting(statement, self.model, sort_params)
+        statement = self.apply_pagination(statement, sort_params, limit, cursor)
 
         # Apply extra loading fields (e.g., eager loading)
-        statement = self.extend_statement(statement, extra_fields=extra_fields)
+        statement = self.extend_statement(
+            statement,
+            extra_fields=extra_fields,
+            options=options,
+            loader_profile=loader_profile,
+        )
         result = await db.execute(statement)
         return result.scalars().all()
 
@@ -314,6 +591,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Tuple[str, Union[str, Tuple[str, Union[str, Tuple[str, str]]]]]
         ] = [],
         extra_fields: List[Any] = [],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        options: List[Any] = [],
+        loader_profile: Optional[str] = None,
     ) -> List[ModelType]:
         """
         Retrieves records matching multiple key-value pairs with optional query options,
@@ -324,6 +605,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             keys (Dict[str, Any]): Dictionary of key-value pairs for filtering.
                 Keys can be strings (attribute names) including nested relationships like "author.role".
             extra_fields (Optional[List[Any]]): Optional list of SQLAlchemy query options (e.g., joinedload).
+            limit (Optional[int]): Page size for keyset pagination.
+            cursor (Optional[str]): Cursor of the previous page.
+            options (Optional[List[Any]]): Loader options overriding the mapped relationship loading.
+            loader_profile (Optional[str]): Name of a profile from `loader_profiles`.
 
         Returns:
             List[ModelType]: List of model instances matching the filters.
@@ -360,8 +645,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         # Apply sorting
         statement = self.apply_sorting(statement, self.model, sort_params)
+        statement = self.apply_pagination(statement, sort_params, limit, cursor)
         # Extend statement with any extra_fields for eager loading
-        statement = self.extend_statement(statement, extra_fields=extra_fields)
+        statement = self.extend_statement(
+            statement,
+            extra_fields=extra_fields,
+            options=options,
+            loader_profile=loader_profile,
+        )
 
         result = await db.execute(statement)
         instances = result.scalars().all()
@@ -374,6 +665,73 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return instances
 
+    def search_match(self, query: ColumnElement) -> Tuple[ColumnElement, ColumnElement]:
+        """
+        The condition matching a text search query and the rank of the matches,
+        from the generated `suchtext` column of the model. Subclasses extend
+        these with the text of nested records.
+        """
+        return (
+            self.model.suchtext.op("@@")(query),
+            # `ts_rank` is a `real`, whose values do not survive the round trip
+            # through a cursor compared as `double precision`
+            cast(func.ts_rank(self.model.suchtext, query), Double),
+        )
+
+    async def search(
+        self,
+        db: AsyncSession,
+        text: str,
+        gemeinde_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        loader_profile: Optional[str] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        Full-text search in German, best matches first.
+
+        The query is parsed like a web search: words, "quoted phrases", `or` and
+        `-` to exclude a word. Matches are found through the GIN index of the
+        `suchtext` column, and pages follow each other by rank and ID.
+
+        Returns:
+            The records of the page, and the cursor of the next page if the page
+            is full.
+
+        :raises NotFoundError: If nothing matches.
+        """
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, text)
+        condition, rank = self.search_match(query)
+        rank = rank.label("rang")
+        keys: List[KeysetColumn] = [(rank, "desc"), (self.model.id, "desc")]
+
+        statement = (
+            select(self.model, rank)
+            .where(condition)
+            .order_by(desc(rank), desc(self.model.id))
+        )
+        if gemeinde_id is not None:
+            statement = statement.where(self.model.gemeinde_id == gemeinde_id)
+        if cursor:
+            statement = statement.where(
+                keyset_condition(keys, decode_cursor(cursor, keys))
+            )
+        if limit is not None:
+            statement = statement.limit(limit)
+        statement = self.extend_statement(statement, loader_profile=loader_profile)
+
+        result = await db.execute(statement)
+        rows = result.unique().all()
+
+        if not rows:
+            raise NotFoundError(self.model.__name__)
+
+        next_cursor = None
+        if limit is not None and len(rows) == limit:
+            instance, rang = rows[-1]
+            next_cursor = encode_cursor([rang, instance.id])
+        return [instance for instance, _ in rows], next_cursor
+
     async def create(
         self, db: AsyncSession, obj_in: CreateSchemaType, user: Optional[User] = None
     ) -> ModelType:
@@ -389,6 +747,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.add(new_instance)
 
         try:
+            await db.flush()
+            await touch_embedding(db, self.model, [new_instance.id])
             await db.commit()
             await db.refresh(new_instance)
         except SQLAlchemyError as e:
@@ -404,34 +764,36 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: CreateSchemaType,
         association_fields: Dict[str, Tuple[Type[ModelType], str]],
         user: Optional[User] = None,
+        loader_profile: Optional[str] = None,
     ) -> ModelType:
-        # Create a copy of obj_in, excluding any association fields
-        obj_in_data = obj_in.model_copy(
-            deep=True, update={field: None for field in association_fields.keys()}
+        """
+        Create a new record together with its many-to-many associations, in a
+        single transaction.
+        """
+        obj_data = obj_in.model_dump(
+            exclude_none=True, exclude_unset=True, exclude=set(association_fields)
         )
-        new_instance = await self.create(db, obj_in_data, user)
 
-        # Handle each association field
-        for field_name, (model, relationship_attr) in association_fields.items():
-            ids = getattr(obj_in, field_name, None)
-            if ids:
-                # Fetch related instances by IDs
-                stmt = select(model).where(model.id.in_(ids))
-                result = await db.execute(stmt)
-                related_instances = result.scalars().all()
+        if user:
+            obj_data["gemeinde_id"] = user.gemeinde_id
+            obj_data["erstellt_von"] = user.id
+            obj_data["zuletzt_bearbeitet_von"] = user.id
 
-                # Extend the specified relationship attribute on the new instance
-                getattr(new_instance, relationship_attr).extend(related_instances)
+        new_instance = self.model(**obj_data)
+        db.add(new_instance)
 
-        # Commit the associations
         try:
+            await db.flush()
+            await self.sync_association_fields(
+                db, new_instance.id, obj_in, association_fields
+            )
+            await touch_embedding(db, self.model, [new_instance.id])
             await db.commit()
-            await db.refresh(new_instance)
         except SQLAlchemyError as e:
             await db.rollback()
             raise DatabaseCommitError(e)
 
-        return new_instance
+        return await self.get(db, new_instance.id, loader_profile=loader_profile)
 
     async def update(
         self,
@@ -447,9 +809,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if user:
             update_data["zuletzt_bearbeitet_von"] = user.id
 
-        for field, value in update_data.items():
-            setattr(instance, field, value)
         try:
+            if update_data.keys() & embedding_keys(self.model):
+                # The records it is moved out of
+                await touch_embedding(db, self.model, [id])
+            for field, value in update_data.items():
+                setattr(instance, field, value)
+            await db.flush()
+            await touch_embedding(db, self.model, [id])
             await db.commit()
             await db.refresh(instance)
         except SQLAlchemyError as e:
@@ -458,6 +825,83 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return instance
 
+    async def update_returning(
+        self,
+        db: AsyncSession,
+        id: Any,
+        obj_in: UpdateSchemaType,
+        user: Optional[User] = None,
+        gemeinde_id: Optional[int] = None,
+        loader_profile: Optional[str] = None,
+        association_fields: Dict[str, Tuple[Type[ModelType], str]] = {},
+    ) -> ModelType:
+        """
+        Update a record by ID with a single `UPDATE ... RETURNING`, without
+        fetching it first.
+
+        :param user: The user recorded as the last editor.
+        :param gemeinde_id: If given, only a record of this municipality is updated,
+            so no separate authorization check is needed.
+        :param loader_profile: The relationships needed for the response. They
+            are loaded by one `SELECT` after the update, except for `minimal`
+            where the returned row is used as is.
+        :param association_fields: Many-to-many fields of `obj_in`, synchronised
+            in the same transaction, see `sync_association_fields`.
+        :raises NotFoundError: If the record does not exist.
+        :raises AuthorizationError: If the record belongs to another municipality.
+        """
+        update_data = obj_in.model_dump(
+            exclude_none=True, exclude_unset=True, exclude=set(association_fields)
+        )
+
+        if user:
+            update_data["zuletzt_bearbeitet_von"] = user.id
+
+        statement = (
+            update(self.model)
+            .where(self.model.id == id)
+            .execution_options(**{CHANGED_IDS: [id]})
+        )
+        if gemeinde_id is not None:
+            statement = statement.where(self.model.gemeinde_id == gemeinde_id)
+        if update_data:
+            statement = statement.values(**update_data)
+        else:
+            # Nothing to change, the no-op assignment still checks the WHERE clause
+            statement = statement.values(id=self.model.id)
+
+        try:
+            if update_data.keys() & embedding_keys(self.model):
+                # The records it is moved out of
+                await touch_embedding(db, self.model, [id])
+            # The relationships of the returned row are not loaded here
+            result = await db.execute(
+                statement.returning(self.model).options(*self.loader_options("minimal"))
+            )
+            instance = result.scalars().first()
+            if instance is None:
+                await db.rollback()
+            else:
+                await self.sync_association_fields(db, id, obj_in, association_fields)
+                await touch_embedding(db, self.model, [id])
+                await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise DatabaseCommitError(e)
+
+        if instance is None:
+            # Only on failure, find out whether the record is missing or foreign
+            exists = await db.execute(select(self.model.id).where(self.model.id == id))
+            if exists.scalar() is None:
+                raise NotFoundError(self.model.__name__, id)
+            raise AuthorizationError("update this resource")
+
+        if loader_profile == "minimal":
+            return instance
+
+        # Joined eager loads cannot be attached to RETURNING
+        return await self.get(db, id, loader_profile=loader_profile)
+
     async def update_with_associations(
         self,
         db: AsyncSession,
@@ -467,42 +911,51 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             str, Tuple[Type[ModelType], str]
         ],  # {"tag_ids": (Tag, "tags"), "indicator_ids": (Indicator, "indicators")}
         user: Optional[User] = None,
+        gemeinde_id: Optional[int] = None,
+        loader_profile: Optional[str] = None,
     ) -> Optional[ModelType]:
-
-        # Create a copy of obj_in with association fields set to None
-        obj_in_copy = obj_in.model_copy(
-            deep=True, update={field: None for field in association_fields.keys()}
+        """
+        Update a record and its many-to-many associations in a single
+        transaction, see `update_returning`.
+        """
+        return await self.update_returning(
+            db,
+            id,
+            obj_in,
+            user,
+            gemeinde_id=gemeinde_id,
+            loader_profile=loader_profile,
+            association_fields=association_fields,
         )
 
-        # Update the main instance with user-specific context fields
-        instance = await self.update(db, id, obj_in_copy, user)
+    async def sync_association_fields(
+        self,
+        db: AsyncSession,
+        id: Any,
+        obj_in: Union[CreateSchemaType, UpdateSchemaType],
+        association_fields: Dict[str, Tuple[Type[ModelType], str]],
+    ) -> None:
+        """
+        Sets the many-to-many associations of a record to the IDs given in
+        `obj_in`, without committing. Fields which are None are left unchanged.
 
-        # Update each association field
-        for field_name, (model, relationship_attr) in association_fields.items():
+        :param association_fields: The ID fields of `obj_in` with the target model
+            and relationship they set, e.g. `{"tag_ids": (Tag, "tags")}`.
+        """
+        for field_name, (_, relationship_attr) in association_fields.items():
             ids = getattr(obj_in, field_name, None)
             if ids is not None:
-                # Fetch the related instances based on IDs
-                stmt = select(model).where(model.id.in_(ids))
-                result = await db.execute(stmt)
-                related_instances = result.scalars().all()
-
-                # Replace the current relationship with the new instances
-                setattr(instance, relationship_attr, related_instances)
-
-        # Commit the updates
-        try:
-            await db.commit()
-            await db.refresh(instance)
-        except SQLAlchemyError as e:
-            await db.rollback()
-            raise DatabaseCommitError(e)
-
-        return instance
+                await sync_associations(
+                    db, getattr(self.model, relationship_attr), {id: ids}
+                )
 
     async def delete(self, db: AsyncSession, id: Any) -> None:
         """Delete a record by ID."""
         instance = await self.get(db, id)
         try:
+            await touch_embedding(db, self.model, [id])
+            if is_tracked(self.model):
+                await log_deletion(db, self.model, id, instance.gemeinde_id)
             await db.delete(instance)
             await db.commit()
         except SQLAlchemyError as e:
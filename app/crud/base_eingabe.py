@@ -1,10 +1,17 @@
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
-from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
+from app.crud.deep_copy import IdMap, NestedAttributes, copy_records
+from app.crud.exceptions import DatabaseCommitError, NotFoundError
+from app.crud.last_modified import touch_embedding
+from app.models.user import User
 from app.services.pdf.base_pdf import BasePDF
+from app.services.pdf.pdf_cache import PDFExport, pdf_cache
+from app.services.pdf.render_service import snapshot
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
@@ -15,115 +22,151 @@ class CRUDEingabe(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
     # def __init__(self, model: Type[ModelType]):
     #     super().__init__(model)
 
-    def detach_instance(self, instance: Any, exclude: Optional[List[str]] = []) -> Any:
-        """
-        Creates a detached copy of a SQLAlchemy instance, excluding specified columns.
-
-        :param instance: The SQLAlchemy instance to detach.
-        :param exclude: An optional list of column names to exclude from the copied instance.
-        :return: A detached copy of the instance.
-        """
-        instance_copy = instance.__class__(
-            **{
-                c.key: getattr(instance, c.key)
-                for c in inspect(instance).mapper.column_attrs
-                if c.key not in exclude
-            }
+    async def update(
+        self,
+        db: AsyncSession,
+        id: Any,
+        obj_in: UpdateSchemaType,
+        user: Optional[User] = None,
+    ) -> ModelType:
+        instance = await super().update(db, id, obj_in, user)
+        pdf_cache.invalidate(self.model.__tablename__, id)
+        return instance
+
+    async def update_returning(
+        self,
+        db: AsyncSession,
+        id: Any,
+        obj_in: UpdateSchemaType,
+        user: Optional[User] = None,
+        gemeinde_id: Optional[int] = None,
+        loader_profile: Optional[str] = None,
+        association_fields: Dict[str, Tuple[Type[ModelType], str]] = {},
+    ) -> ModelType:
+        instance = await super().update_returning(
+            db,
+            id,
+            obj_in,
+            user=user,
+            gemeinde_id=gemeinde_id,
+            loader_profile=loader_profile,
+            association_fields=association_fields,
         )
+        pdf_cache.invalidate(self.model.__tablename__, id)
+        return instance
 
-        # Optionally set specific columns to None if included in exclude
-        for column in exclude:
-            if hasattr(instance_copy, column):
-                setattr(instance_copy, column, None)
-
-        return instance_copy
+    async def delete(self, db: AsyncSession, id: Any) -> None:
+        await super().delete(db, id)
+        pdf_cache.invalidate(self.model.__tablename__, id)
 
-    async def copy_nested(
+    async def copy_many(
         self,
-        instance: Any,
-        copied_instance: Any,
-        nested_attrs: Dict[str, List[str]],
+        db: AsyncSession,
+        ids: List[int],
+        updates: Optional[Dict[str, Any]] = None,
         exclude: Optional[List[str]] = [],
-    ) -> None:
+        nested_attributes: NestedAttributes = {},
+    ) -> IdMap:
         """
-        Recursively copies nested attributes from the instance to the copied instance.
+        Copies several submissions by ID, including any nested attributes specified,
+        in a single transaction.
 
-        :param instance: The original SQLAlchemy instance.
-        :param copied_instance: The detached copy of the original instance.
-        :param nested_attrs: A dictionary where keys are attribute names representing nested data structures
-                             and values are lists of further nested attributes to copy within each item.
-        :param exclude: A list of column names to exclude when detaching nested instances.
+        The copies are made set-based in the database, see `copy_records`, so the
+        number of statements depends on the depth of the tree but neither on its
+        size nor on the number of submissions.
+
+        :param db: The database session.
+        :param ids: The IDs of the submissions to copy.
+        :param updates: A dictionary of attributes to update on the copied instances.
+        :param exclude: An optional list of column names left to their defaults on the copies.
+        :param nested_attributes: The relationships copied along with the submissions,
+                                  each with the relationships copied along with its items.
+        :return: The IDs of the copies by the IDs of the submissions.
+        :raises NotFoundError: If one of the submissions does not exist.
         """
-        for attr, sub_attrs in nested_attrs.items():
-            nested_items = getattr(instance, attr, None)
-            if nested_items is None:
-                continue
-
-            copied_items = []
-            for item in nested_items:
-                copied_item = self.detach_instance(item, exclude=exclude)
-                setattr(
-                    copied_item, "submission", copied_instance
-                )  # Set parent reference
-
-                # Recursively copy sub-nested items if sub-attributes are provided
-                if sub_attrs:
-                    await self.copy_nested(
-                        item,
-                        copied_item,
-                        {sub_attr: [] for sub_attr in sub_attrs},
-                        exclude,
-                    )
-                copied_items.append(copied_item)
-
-            setattr(copied_instance, attr, copied_items)
+        return await self._copy_many(db, ids, updates, exclude, nested_attributes)
+
+    async def _copy_many(
+        self,
+        db: AsyncSession,
+        ids: List[int],
+        updates: Optional[Dict[str, Any]],
+        exclude: Optional[List[str]],
+        nested_attributes: NestedAttributes,
+    ) -> IdMap:
+        # Shared by `copy` and `copy_many`, which subclasses override with their own signature
+        try:
+            id_map = await copy_records(
+                db,
+                self.model,
+                ids,
+                updates=updates or {},
+                exclude=exclude,
+                nested_attributes=nested_attributes,
+            )
+            missing = [id for id in ids if id not in id_map]
+            if missing:
+                await db.rollback()
+                raise NotFoundError(self.model.__name__, missing[0])
+            await touch_embedding(db, self.model, list(id_map.values()))
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise DatabaseCommitError(e)
+
+        return id_map
 
     async def copy(
         self,
         db: AsyncSession,
         id: int,
-        updates: Optional[Dict[str, Union[int, bool]]] = None,
+        updates: Optional[Dict[str, Any]] = None,
         exclude: Optional[List[str]] = [],
-        nested_attributes: Dict[str, List[str]] = {},
+        nested_attributes: NestedAttributes = {},
+        loader_profile: Optional[str] = None,
     ) -> Any:
         """
-        Copies a submission by ID, including any nested attributes specified, and assigns new ownership.
+        Copies a submission by ID, see `copy_many`.
 
-        :param db: The database session.
-        :param id: The ID of the submission to copy.
-        :param user: The user to assign as the creator and last editor of the copied submission.
-        :param exclude: An optional list of column names to exclude when detaching the instance.
-        :param nested_attributes: A dictionary where keys are attribute names representing nested data structures
-                                and values are lists of further nested attributes to copy within each item.
-        :param updates: A dictionary of attributes to update on the copied instance.
+        :param loader_profile: The relationships loaded on the returned copy.
         :return: A copied submission instance.
         """
+        id_map = await self._copy_many(db, [id], updates, exclude, nested_attributes)
+        return await self.get(db, id_map[id], loader_profile=loader_profile)
 
-        # Fetch the original instance
-        instance = await self.get(db, id)
-
-        # Create a detached copy of the submission
-        copied_instance = self.detach_instance(instance, exclude=exclude)
+    async def export(self, db: AsyncSession, id: int, PDF: Type[BasePDF]) -> PDFExport:
+        """
+        Prepares the PDF export of an Eingabe.
 
-        # Apply updates to the copied instance if provided
-        if updates:
-            for attr, value in updates.items():
-                setattr(copied_instance, attr, value)
+        :param id: The ID of the Eingabe.
+        :param PDF: The PDF class used for rendering.
+        :return: The export, whose `render` returns the cached or rendered PDF.
+        """
+        instance = await self.get(db, id, loader_profile="pdf")
+        return PDFExport((self.model.__tablename__, id), PDF, snapshot(instance))
 
-        # Copy nested attributes if specified
-        if nested_attributes:
-            await self.copy_nested(
-                instance, copied_instance, nested_attributes, exclude
-            )
+    async def export_by_magistratsvorlagen(
+        self, db: AsyncSession, magistratsvorlage_ids: List[int], PDF: Type[BasePDF]
+    ) -> List[PDFExport]:
+        """
+        Prepares the PDF exports of all Eingaben of the given Magistratsvorlagen.
 
-        # Add the copied instance to the session and commit
-        db.add(copied_instance)
-        await db.commit()
-        await db.refresh(copied_instance)
+        The Eingaben are loaded together, so the number of queries does not grow
+        with the number of Eingaben.
 
-        return copied_instance
+        :param magistratsvorlage_ids: The IDs of the Magistratsvorlagen.
+        :param PDF: The PDF class used for rendering.
+        :return: The exports, ordered by Magistratsvorlage and Eingabe.
+        """
+        statement = (
+            select(self.model)
+            .where(self.model.magistratsvorlage_id.in_(magistratsvorlage_ids))
+            .order_by(self.model.magistratsvorlage_id, self.model.id)
+        )
+        statement = self.extend_statement(statement, loader_profile="pdf")
+        result = await db.execute(statement)
 
-    async def export(self, db: AsyncSession, id: int, PDF: BasePDF) -> bytes:
-        instance = await self.get(db, id)
-        pdf = PDF(orientation="P", unit="mm", format="A4")
-        return pdf.export(instance)
+        return [
+            PDFExport((self.model.__tablename__, instance.id), PDF, snapshot(instance))
+            for instance in result.scalars().all()
+        ]
@@ -0,0 +1,174 @@
+from typing import Any, List, Optional, Tuple, TypeVar, Union
+
+from sqlalchemy import Float, case, desc, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+from app.crud.base import CRUDBase
+from app.models.tag import Tag
+from app.utils.enum_util import TagModusEnum
+
+ModelType = TypeVar("ModelType")
+CreateSchemaType = TypeVar("CreateSchemaType")
+UpdateSchemaType = TypeVar("UpdateSchemaType")
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"%{escaped}%"
+
+
+class CRUDKatalog(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    Catalogue entries such as Indikatoren, Textblöcke and Tags, which are
+    shared with all municipalities unless they are `gemeindespezifisch`.
+    """
+
+    def visible_to(self, gemeinde_id: int) -> ColumnElement:
+        """The entries of the municipality and those shared with all."""
+        return or_(
+            self.model.gemeinde_id == gemeinde_id,
+            self.model.gemeindespezifisch.is_(False),
+        )
+
+    def tagged_with(
+        self, tag_ids: List[int], modus: TagModusEnum = TagModusEnum.oder
+    ) -> ColumnElement:
+        """
+        The entries with any (`oder`) or all (`und`) of the tags, looked up in
+        the association table through its `(tag_id, ...)` index.
+        """
+        prop = self.model.tags.property
+        ((_, entry_id),) = prop.synchronize_pairs
+        ((_, tag_id),) = prop.secondary_synchronize_pairs
+
+        tag_ids = list(set(tag_ids))
+        entries = select(entry_id).where(tag_id.in_(tag_ids))
+        if modus == TagModusEnum.und:
+            entries = entries.group_by(entry_id).having(
+                func.count(tag_id.distinct()) == len(tag_ids)
+            )
+        return self.model.id.in_(entries)
+
+    def catalogue_filter(
+        self,
+        gemeinde_id: int,
+        tag_ids: List[int] = [],
+        tag_modus: TagModusEnum = TagModusEnum.oder,
+    ) -> List[ColumnElement]:
+        conditions = [self.visible_to(gemeinde_id)]
+        if tag_ids:
+            conditions.append(self.tagged_with(tag_ids, tag_modus))
+        return conditions
+
+    async def get_visible(
+        self,
+        db: AsyncSession,
+        gemeinde_id: int,
+        tag_ids: List[int] = [],
+        tag_modus: TagModusEnum = TagModusEnum.oder,
+        sort_params: List[
+            Tuple[str, Union[str, Tuple[str, Union[str, Tuple[str, str]]]]]
+        ] = [],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        loader_profile: Optional[str] = None,
+    ) -> List[ModelType]:
+        """
+        The entries visible to a municipality, optionally only those with the
+        given tags. Like `get_by_or_keys`, an empty result is no error.
+        """
+        statement = select(self.model).where(
+            *self.catalogue_filter(gemeinde_id, tag_ids, tag_modus)
+        )
+        statement = self.apply_sorting(statement, self.model, sort_params)
+        statement = self.apply_pagination(statement, sort_params, limit, cursor)
+        statement = self.extend_statement(statement, loader_profile=loader_profile)
+        result = await db.execute(statement)
+        return result.scalars().all()
+
+    async def count_tags(
+        self,
+        db: AsyncSession,
+        gemeinde_id: int,
+        tag_ids: List[int] = [],
+        tag_modus: TagModusEnum = TagModusEnum.oder,
+    ) -> Tuple[int, List[Any]]:
+        """
+        The facets of the entries visible to a municipality and filtered by
+        tags: how many entries there are and how many of them carry each tag.
+
+        Both come from a single query, which groups the association rows of the
+        filtered entries by tag, with an extra grouping set for the total.
+
+        Returns:
+            The number of entries, and rows of `tag_id`, `name` and `anzahl`
+            ordered by name.
+        """
+        prop = self.model.tags.property
+        ((_, entry_id),) = prop.synchronize_pairs
+        ((_, tag_id),) = prop.secondary_synchronize_pairs
+
+        entries = (
+            select(self.model.id)
+            .where(*self.catalogue_filter(gemeinde_id, tag_ids, tag_modus))
+            .subquery()
+        )
+        result = await db.execute(
+            select(
+                Tag.id.label("tag_id"),
+                Tag.name,
+                func.count(entries.c.id.distinct()).label("anzahl"),
+                func.grouping(Tag.id).label("gesamt"),
+            )
+            .select_from(entries)
+            .outerjoin(prop.secondary, entry_id == entries.c.id)
+            .outerjoin(Tag, Tag.id == tag_id)
+            .group_by(func.grouping_sets(tuple_(Tag.id, Tag.name), tuple_()))
+        )
+
+        anzahl = 0
+        tags = []
+        for row in result.all():
+            if row.gesamt:
+                anzahl = row.anzahl
+            elif row.tag_id is not None:
+                # Entries without tags form a group of their own, which is left out
+                tags.append(row)
+        return anzahl, sorted(tags, key=lambda row: (row.name, row.tag_id))
+
+    async def suggest(
+        self,
+        db: AsyncSession,
+        text: str,
+        gemeinde_id: int,
+        limit: int = 10,
+        loader_profile: Optional[str] = None,
+    ) -> List[ModelType]:
+        """
+        Typeahead lookup of the entries visible to a municipality by name.
+
+        Names containing the text or a word similar to it match, both through
+        the trigram GIN index on `name`. Names starting with the text come
+        first, then the closest matches.
+        """
+        name = self.model.name
+        pattern = _like_pattern(text)
+        similarity = func.word_similarity(text, name, type_=Float)
+        statement = (
+            select(self.model)
+            .where(
+                self.visible_to(gemeinde_id),
+                or_(name.ilike(pattern, escape="/"), name.op("%>")(text)),
+            )
+            .order_by(
+                desc(case((name.ilike(pattern[1:], escape="/"), 1), else_=0)),
+                desc(similarity),
+                name,
+                self.model.id,
+            )
+            .limit(limit)
+        )
+        statement = self.extend_statement(statement, loader_profile=loader_profile)
+        result = await db.execute(statement)
+        return result.scalars().all()
@@ -0,0 +1,37 @@
+from typing import Any, List
+
+from sqlalchemy import Integer, String, column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Materialised view of the dashboard counts, see the migration adding it. It is
+# not part of the metadata, so it is neither created nor compared as a table.
+dashboard_kennzahl = table(
+    "dashboard_kennzahl",
+    column("gemeinde_id", Integer),
+    column("check_typ", String),
+    column("kennzahl", String),
+    column("schluessel", String),
+    column("anzahl", Integer),
+)
+
+
+async def get_kennzahlen(db: AsyncSession, gemeinde_id: int) -> List[Any]:
+    """
+    The precomputed counts of a municipality, read from the unique index of
+    the view rather than aggregated from the checks.
+    """
+    view = dashboard_kennzahl
+    result = await db.execute(
+        select(
+            view.c.check_typ, view.c.kennzahl, view.c.schluessel, view.c.anzahl
+        ).where(view.c.gemeinde_id == gemeinde_id)
+    )
+    return result.all()
+
+
+async def refresh_kennzahlen(db: AsyncSession) -> None:
+    """
+    Recomputes the view without blocking reads of the previous counts.
+    """
+    await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY dashboard_kennzahl"))
+    await db.commit()
@@ -0,0 +1,123 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, Table, case, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+# Relationships copied along with a record, each with the relationships copied
+# along with its targets, e.g. {"eingabe_ziel_ober": {"eingabe_ziel_unter": {}}}.
+# Targets of many-to-many relationships are linked rather than copied.
+NestedAttributes = Dict[str, "NestedAttributes"]
+
+# {source id: copy id}
+IdMap = Dict[Any, Any]
+
+
+async def copy_records(
+    db: AsyncSession,
+    model: Any,
+    ids: List[Any],
+    updates: Dict[str, Any] = {},
+    exclude: List[str] = [],
+    nested_attributes: NestedAttributes = {},
+) -> IdMap:
+    """
+    Copies records and their nested records in the database, one level of the
+    tree at a time, without loading them as ORM instances.
+
+    Each level takes one `SELECT` of the source rows and one multi-row
+    `INSERT ... RETURNING` whose IDs come back in the order of the rows, which
+    gives the mapping from source to copy for the next level. Association rows
+    of many-to-many relationships are copied with a single `INSERT ... SELECT`.
+    Nothing is committed.
+
+    :param updates: Values set on the copies of the records, not on nested ones.
+    :param exclude: Columns left to their defaults on the copies at all levels.
+        Primary keys, generated columns and `zuletzt_geaendert_am` are never
+        copied.
+    :param nested_attributes: The relationships copied along, see
+        `NestedAttributes`.
+    :return: The IDs of the copies by the IDs of the records, without the IDs
+        of records which do not exist.
+    """
+    table = model.__table__
+    id_map = await _copy_rows(db, table, table.c.id.in_(ids), updates, exclude)
+    if id_map:
+        await _copy_nested(db, model, id_map, nested_attributes, exclude)
+    return id_map
+
+
+async def _copy_rows(
+    db: AsyncSession,
+    table: Table,
+    criterion: ColumnElement,
+    updates: Dict[str, Any],
+    exclude: List[str],
+    parent: Optional[Tuple[Column, IdMap]] = None,
+) -> IdMap:
+    # Copies are new records, last changed when they are made
+    columns = [
+        column
+        for column in table.columns
+        if not column.primary_key
+        and column.computed is None
+        and column.key != "zuletzt_geaendert_am"
+        and column.key not in exclude
+        and column.key not in updates
+    ]
+    result = await db.execute(
+        select(table.c.id, *columns).where(criterion).order_by(table.c.id)
+    )
+    rows = result.all()
+    if not rows:
+        return {}
+
+    params = []
+    for row in rows:
+        values = {column.key: value for column, value in zip(columns, row[1:])}
+        if parent is not None:
+            foreign_key, parent_map = parent
+            values[foreign_key.key] = parent_map[values[foreign_key.key]]
+        params.append({**values, **updates})
+
+    result = await db.execute(
+        insert(table).returning(table.c.id, sort_by_parameter_order=True), params
+    )
+    return dict(zip((row.id for row in rows), result.scalars().all()))
+
+
+async def _copy_nested(
+    db: AsyncSession,
+    model: Any,
+    id_map: IdMap,
+    nested_attributes: NestedAttributes,
+    exclude: List[str],
+) -> None:
+    for attr, sub_attributes in nested_attributes.items():
+        prop = getattr(model, attr).property
+        # The foreign key referring to the parent, on the child or association table
+        ((_, foreign_key),) = prop.synchronize_pairs
+
+        if prop.secondary is not None:
+            others = [c for c in prop.secondary.columns if c is not foreign_key]
+            await db.execute(
+                insert(prop.secondary).from_select(
+                    [foreign_key.key, *(c.key for c in others)],
+                    select(case(id_map, value=foreign_key), *others).where(
+                        foreign_key.in_(list(id_map))
+                    ),
+                )
+            )
+            continue
+
+        child = prop.mapper.class_
+        child_map = await _copy_rows(
+            db,
+            child.__table__,
+            foreign_key.in_(list(id_map)),
+            {},
+            exclude,
+            parent=(foreign_key, id_map),
+        )
+        if child_map and sub_attributes:
+            await _copy_nested(db, child, child_map, sub_attributes, exclude)
@@ -33,3 +33,33 @@ class DatabaseCommitError(CRUDOperationError):
     def __init__(self, original_exception: Exception):
         self.original_exception = original_exception
         super().__init__("An error occurred while committing changes to the database.")
+
+
+class InvalidCursorError(CRUDOperationError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: Optional[str] = None):
+        super().__init__(f"The pagination cursor {cursor!r} is invalid.")
+
+
+class PDFRenderUnavailableError(CRUDOperationError):
+    """Raised when the PDF render queue is full."""
+
+    def __init__(self):
+        super().__init__(
+            "Too many PDF exports are in progress, please try again later."
+        )
+
+
+class PDFRenderTimeoutError(CRUDOperationError):
+    """Raised when rendering a PDF takes longer than the configured timeout."""
+
+    def __init__(self, timeout: float):
+        super().__init__(f"The PDF export did not finish within {timeout} seconds.")
+
+
+class ExportJobNotReadyError(CRUDOperationError):
+    """Raised when the file of an export job is requested before it is ready."""
+
+    def __init__(self, id: int, status: str):
+        super().__init__(f"Export job {id} has no file yet, its status is {status!r}.")
@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.crud.exceptions import DatabaseCommitError
+from app.models.export_job import ExportJob as Model
+from app.models.user import User
+from app.schemas.export_job import ExportJobCreate as CreateSchema
+from app.utils.enum_util import ExportJobStatusEnum
+
+
+class CRUDExportJob(CRUDBase[Model, CreateSchema, CreateSchema]):
+    def __init__(self):
+        super().__init__(Model)
+
+    async def create(
+        self, db: AsyncSession, obj_in: CreateSchema, user: Optional[User] = None
+    ) -> Model:
+        """Submit a new export job, which has no editor unlike other records."""
+        new_instance = Model(
+            magistratsvorlage_ids=obj_in.magistratsvorlage_ids,
+            gemeinde_id=user.gemeinde_id,
+            erstellt_von=user.id,
+        )
+        db.add(new_instance)
+
+        try:
+            await db.commit()
+            await db.refresh(new_instance)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise DatabaseCommitError(e)
+
+        return new_instance
+
+    async def claim_next(
+        self, db: AsyncSession, stale_before: datetime
+    ) -> Optional[int]:
+        """
+        Marks the oldest waiting job as running and returns its ID.
+
+        Running jobs without progress since `stale_before` are claimed again, as
+        their worker is gone. Jobs locked by another worker are skipped, so each
+        job is claimed once.
+        """
+        candidate = (
+            select(Model.id)
+            .where(
+                or_(
+                    Model.status == ExportJobStatusEnum.wartend,
+                    and_(
+                        Model.status == ExportJobStatusEnum.laeuft,
+                        Model.aktualisiert_am < stale_before,
+                    ),
+                )
+            )
+            .order_by(Model.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            update(Model)
+            .where(Model.id == candidate)
+            .values(
+                status=ExportJobStatusEnum.laeuft,
+                anzahl_fertig=0,
+                aktualisiert_am=datetime.now(),
+            )
+            .returning(Model.id)
+        )
+        result = await db.execute(statement)
+        await db.commit()
+        return result.scalar_one_or_none()
+
+    async def update_state(self, db: AsyncSession, id: int, **values: Any) -> None:
+        """Updates the state of a job, which also counts as its progress."""
+        statement = (
+            update(Model)
+            .where(Model.id == id)
+            .values(aktualisiert_am=datetime.now(), **values)
+        )
+        await db.execute(statement)
+        await db.commit()
+
+    async def get_expired(self, db: AsyncSession, before: datetime) -> List[Model]:
+        """Finished and failed jobs completed before `before`."""
+        statement = select(Model).where(Model.abgeschlossen_am < before)
+        result = await db.execute(statement)
+        return result.scalars().all()
+
+    async def delete_by_ids(self, db: AsyncSession, ids: List[int]) -> None:
+        await db.execute(delete(Model).where(Model.id.in_(ids)))
+        await db.commit()
+
+
+crud_export_job = CRUDExportJob()
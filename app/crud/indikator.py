@@ -1,4 +1,4 @@
-from app.crud.base import CRUDBase
+from app.crud.base_katalog import CRUDKatalog
 from app.models.indikator import Indikator as Model
 from app.schemas.indikator import (
     IndikatorCreate as CreateSchema,
@@ -6,7 +6,7 @@ from app.schemas.indikator import (
 )
 
 
-class CRUDIndikator(CRUDBase[Model, CreateSchema, UpdateSchema]):
+class CRUDIndikator(CRUDKatalog[Model, CreateSchema, UpdateSchema]):
     def __init__(self):
         super().__init__(Model)
 
@@ -1,5 +1,9 @@
+from typing import Any, Dict, List, Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, noload, raiseload
 
+from app.crud.base import load_user_read
 from app.crud.base_eingabe import CRUDEingabe
 from app.models.klimacheck_eingabe import KlimacheckEingabe as Model
 from app.models.user import User
@@ -7,6 +11,7 @@ from app.schemas.klimacheck_eingabe import (
     KlimacheckEingabeCreate as CreateSchema,
     KlimacheckEingabeUpdate as UpdateSchema,
 )
+from app.services.pdf.pdf_cache import PDFExport
 from app.services.pdf.klimacheck_pdf import KlimacheckPDF
 
 
@@ -14,7 +19,52 @@ class CRUDKlimacheckEingabe(CRUDEingabe[Model, CreateSchema, UpdateSchema]):
     def __init__(self):
         super().__init__(Model)
 
-    async def copy(self, db: AsyncSession, id: int, user: User) -> Model:
+    @property
+    def loader_profiles(self) -> Dict[str, List[Any]]:
+        """
+        * `list`: Summary columns, magistrate submission, climate relevance and author
+          in a single query.
+        * `detail`: The lookups and users serialized by the read schema.
+        * `pdf`: The magistrate submission and lookups printed in the PDF export.
+        """
+        lookups = [
+            joinedload(Model.magistratsvorlage).raiseload("*"),
+            joinedload(Model.klimarelevanz),
+            joinedload(Model.auswirkung_dauer),
+        ]
+
+        return {
+            **super().loader_profiles,
+            "list": [
+                load_only(
+                    Model.id,
+                    Model.name,
+                    Model.magistratsvorlage_id,
+                    Model.klimarelevanz_id,
+                    Model.auswirkung_thg,
+                    Model.auswirkung_klimaanpassung,
+                    Model.veroeffentlicht,
+                    Model.erstellt_am,
+                    Model.gemeinde_id,
+                    Model.erstellt_von,
+                ),
+                joinedload(Model.magistratsvorlage).noload("*"),
+                joinedload(Model.klimarelevanz),
+                joinedload(Model.autor)
+                .load_only(User.id, User.vorname, User.nachname)
+                .noload("*"),
+                noload("*"),
+            ],
+            "detail": [
+                *lookups,
+                load_user_read(Model.autor),
+                load_user_read(Model.letzter_bearbeiter),
+                raiseload("*"),
+            ],
+            "pdf": [*lookups, raiseload("*")],
+        }
+
+    def copy_arguments(self, user: User) -> Dict[str, Any]:
         exclude = ["id", "erstellt_von"]
 
         updates = {
@@ -23,10 +73,34 @@ class CRUDKlimacheckEingabe(CRUDEingabe[Model, CreateSchema, UpdateSchema]):
             "veroeffentlicht": False,
         }
 
-        return await super().copy(db=db, id=id, updates=updates, exclude=exclude)
+        return {"updates": updates, "exclude": exclude}
 
-    async def export(self, db: AsyncSession, id: int):
+    async def copy(self, db: AsyncSession, id: int, user: User) -> Model:
+        return await super().copy(
+            db=db, id=id, **self.copy_arguments(user), loader_profile="detail"
+        )
+
+    async def copy_many(
+        self,
+        db: AsyncSession,
+        ids: List[int],
+        user: User,
+        magistratsvorlage_id: Optional[int] = None,
+    ) -> Dict[int, int]:
+        arguments = self.copy_arguments(user)
+        if magistratsvorlage_id is not None:
+            arguments["updates"]["magistratsvorlage_id"] = magistratsvorlage_id
+        return await super().copy_many(db=db, ids=ids, **arguments)
+
+    async def export(self, db: AsyncSession, id: int) -> PDFExport:
         return await super().export(db=db, id=id, PDF=KlimacheckPDF)
 
+    async def export_by_magistratsvorlagen(
+        self, db: AsyncSession, magistratsvorlage_ids: List[int]
+    ) -> List[PDFExport]:
+        return await super().export_by_magistratsvorlagen(
+            db=db, magistratsvorlage_ids=magistratsvorlage_ids, PDF=KlimacheckPDF
+        )
+
 
 crud_klimacheck_eingabe = CRUDKlimacheckEingabe()
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import Select, delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import MANYTOONE, InstrumentedAttribute
+
+from app.core.config import settings
+from app.models.indikator import Indikator
+from app.models.klimacheck_eingabe import KlimacheckEingabe
+from app.models.loeschprotokoll import Loeschprotokoll
+from app.models.magistratsvorlage import Magistratsvorlage
+from app.models.mobilitaetscheck_eingabe import MobilitaetscheckEingabe
+from app.models.mobilitaetscheck_eingabe_ziel_ober import (
+    MobilitaetscheckEingabeZielOber,
+)
+from app.models.mobilitaetscheck_eingabe_ziel_unter import (
+    MobilitaetscheckEingabeZielUnter,
+)
+from app.models.textblock import Textblock
+
+# Relationships serialised by the detail views, each with whether its targets
+# are embedded along with their own embedded records or with their columns only.
+# A write to a record sets `zuletzt_geaendert_am` of the records embedding it,
+# so the detail views of both stop matching the validators clients hold.
+EMBEDDED_RELATIONSHIPS: List[Tuple[InstrumentedAttribute, bool]] = [
+    (MobilitaetscheckEingabe.eingabe_ziel_ober, True),
+    (MobilitaetscheckEingabe.magistratsvorlage, False),
+    (MobilitaetscheckEingabeZielOber.eingabe_ziel_unter, True),
+    (MobilitaetscheckEingabeZielOber.ziel_ober, False),
+    (MobilitaetscheckEingabeZielUnter.ziel_unter, False),
+    (MobilitaetscheckEingabeZielUnter.indikatoren, False),
+    (KlimacheckEingabe.magistratsvorlage, False),
+    (Magistratsvorlage.mobilitaetschecks, True),
+    (Magistratsvorlage.klimachecks, True),
+    (Magistratsvorlage.gemeinde_gebiete, False),
+    (Indikator.tags, False),
+    (Textblock.tags, False),
+]
+
+# The IDs of records, as a list or a `SELECT` of one column
+Ids = Union[List[Any], Select]
+
+
+def _embedding_ids(relationship: InstrumentedAttribute, ids: Ids) -> Select:
+    # The IDs of the records whose relationship contains one of the targets
+    prop = relationship.property
+    if prop.secondary is not None:
+        ((_, parent_fk),) = prop.synchronize_pairs
+        ((_, target_fk),) = prop.secondary_synchronize_pairs
+        return select(parent_fk).where(target_fk.in_(ids))
+    ((_, foreign_key),) = prop.synchronize_pairs
+    if prop.direction is MANYTOONE:
+        return select(prop.parent.class_.id).where(foreign_key.in_(ids))
+    return select(foreign_key).where(prop.mapper.class_.id.in_(ids))
+
+
+def embedding_keys(model: Any) -> Set[str]:
+    """
+    The foreign keys of a model which place its records in embedding records,
+    whose change moves a record from one to another.
+    """
+    return {
+        foreign_key.key
+        for relationship, _ in EMBEDDED_RELATIONSHIPS
+        if relationship.property.mapper.class_ is model
+        and relationship.property.secondary is None
+        and relationship.property.direction is not MANYTOONE
+        for _, foreign_key in relationship.property.synchronize_pairs
+    }
+
+
+async def touch_embedding(
+    db: AsyncSession,
+    model: Any,
+    ids: Ids,
+    _seen: Optional[Set[Any]] = None,
+) -> None:
+    """
+    Sets `zuletzt_geaendert_am` of the records embedding the given ones in
+    their detail views to now, without committing. Embeddings of embeddings
+    are followed as far as their detail views include them, see
+    `EMBEDDED_RELATIONSHIPS`.
+
+    Each embedding model takes one `UPDATE` whose IDs are selected in the
+    database, so nothing is loaded however many records embed the given ones.
+    The records themselves are not written, their own `zuletzt_geaendert_am`
+    is set by the `UPDATE` of their row.
+
+    :param model: The model of the written records.
+    :param ids: The IDs of the written records.
+    """
+    seen = {model} if _seen is None else _seen
+    for relationship, nested in EMBEDDED_RELATIONSHIPS:
+        prop = relationship.property
+        parent = prop.parent.class_
+        if prop.mapper.class_ is not model or parent in seen:
+            continue
+        # Beyond the written records, only embeddings including their embeddings
+        if _seen is not None and not nested:
+            continue
+
+        parent_ids = _embedding_ids(relationship, ids)
+        if is_tracked(parent):
+            await db.execute(
+                update(parent)
+                .where(parent.id.in_(parent_ids))
+                .values(zuletzt_geaendert_am=func.now())
+                .execution_options(synchronize_session=False)
+            )
+        await touch_embedding(db, parent, parent_ids, seen | {parent})
+
+
+def is_tracked(model: Any) -> bool:
+    """Whether the changes of a model are tracked by `zuletzt_geaendert_am`."""
+    return hasattr(model, "zuletzt_geaendert_am")
+
+
+async def log_deletion(db: AsyncSession, model: Any, id: Any, gemeinde_id: int) -> None:
+    """
+    Records the deletion of a record of a tracked model in the
+    `Loeschprotokoll`, without committing. Entries of the table older than
+    the retention period are dropped along with it.
+    """
+    table = model.__tablename__
+    await db.execute(
+        delete(Loeschprotokoll).where(
+            Loeschprotokoll.tabelle == table,
+            Loeschprotokoll.geloescht_am < func.now() - retention(),
+        )
+    )
+    await db.execute(
+        insert(Loeschprotokoll).values(
+            tabelle=table, datensatz_id=id, gemeinde_id=gemeinde_id
+        )
+    )
+
+
+def retention() -> timedelta:
+    """How long deletions are kept in the `Loeschprotokoll`."""
+    return timedelta(days=settings.LOESCHPROTOKOLL_RETENTION_DAYS)
+
+
+async def sync_point(db: AsyncSession) -> datetime:
+    """
+    The time from which on a later sync must look for changes, so it sees
+    every change the current transaction may miss.
+
+    Changes are stamped with the start of their transaction, which can be
+    earlier than their commit. The sync point is therefore the start of the
+    oldest transaction still open, at the latest that of the current one, and
+    must be taken before the changes are read.
+    """
+    result = await db.execute(
+        text(
+            "SELECT coalesce(min(xact_start), now()) FROM pg_stat_activity "
+            "WHERE datname = current_database()"
+        )
+    )
+    return result.scalar_one()
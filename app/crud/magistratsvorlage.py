@@ -1,3 +1,7 @@
+from typing import Any, Dict, List
+
+from sqlalchemy.orm import noload
+
 from app.crud.base import CRUDBase
 from app.models.magistratsvorlage import Magistratsvorlage as Model
 from app.schemas.magistratsvorlage import (
@@ -10,5 +14,13 @@ class CRUDMagistratsvorlage(CRUDBase[Model, CreateSchema, UpdateSchema]):
     def __init__(self):
         super().__init__(Model)
 
+    @property
+    def loader_profiles(self) -> Dict[str, List[Any]]:
+        """
+        * `list`: The columns of the magistrate submission without any of its checks
+          or areas.
+        """
+        return {**super().loader_profiles, "list": [noload("*")]}
+
 
 crud_magistratsvorlage = CRUDMagistratsvorlage()
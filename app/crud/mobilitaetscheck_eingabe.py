@@ -1,14 +1,44 @@
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import (
+    Double,
+    Float,
+    case,
+    cast,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, noload, raiseload, selectinload
+from sqlalchemy.sql import ColumnElement
 
+from app.crud.base import load_user_read
 from app.crud.base_eingabe import CRUDEingabe
+from app.crud.exceptions import DatabaseCommitError
+from app.crud.last_modified import touch_embedding
+from app.models.indikator import Indikator
 from app.models.mobilitaetscheck_eingabe import MobilitaetscheckEingabe as Model
+from app.models.mobilitaetscheck_eingabe_ziel_ober import (
+    MobilitaetscheckEingabeZielOber as EingabeZielOber,
+)
+from app.models.mobilitaetscheck_eingabe_ziel_unter import (
+    MobilitaetscheckEingabeZielUnter as EingabeZielUnter,
+)
+from app.models.mobilitaetscheck_ziel_ober import MobilitaetscheckZielOber as ZielOber
+from app.models.mobilitaetscheck_ziel_unter import (
+    MobilitaetscheckZielUnter as ZielUnter,
+)
 from app.models.user import User
 from app.schemas.mobilitaetscheck_eingabe import (
     MobilitaetscheckEingabeCreate as CreateSchema,
     MobilitaetscheckEingabeUpdate as UpdateSchema,
 )
+from app.services.pdf.pdf_cache import PDFExport
 from app.services.pdf.mobilitaetscheck_pdf import MobilitaetscheckPDF
 
 
@@ -16,7 +46,217 @@ class CRUDMobilitySubmission(CRUDEingabe[Model, CreateSchema, UpdateSchema]):
     def __init__(self):
         super().__init__(Model)
 
-    async def copy(self, db: AsyncSession, id: int, user: User) -> Model:
+    @property
+    def loader_profiles(self) -> Dict[str, List[Any]]:
+        """
+        * `list`: Summary columns, magistrate submission and author in a single query.
+        * `detail`: The objective tree and the users serialized by the read schema.
+        * `pdf`: The objective tree and the names of the editors for the PDF export.
+        """
+        magistratsvorlage = joinedload(Model.magistratsvorlage).raiseload("*")
+
+        def objective_tree(indikator_options: List[Any]) -> Any:
+            return selectinload(Model.eingabe_ziel_ober).options(
+                joinedload(EingabeZielOber.ziel_ober).raiseload("*"),
+                selectinload(EingabeZielOber.eingabe_ziel_unter).options(
+                    joinedload(EingabeZielUnter.ziel_unter).raiseload("*"),
+                    joinedload(EingabeZielUnter.auswirkung_raeumlich),
+                    selectinload(EingabeZielUnter.indikatoren).options(
+                        *indikator_options, raiseload("*")
+                    ),
+                    raiseload("*"),
+                ),
+                raiseload("*"),
+            )
+
+        def editor(relationship: Any) -> Any:
+            return (
+                joinedload(relationship)
+                .load_only(User.id, User.vorname, User.nachname)
+                .raiseload("*")
+            )
+
+        return {
+            **super().loader_profiles,
+            "list": [
+                load_only(
+                    Model.id,
+                    Model.name,
+                    Model.magistratsvorlage_id,
+                    Model.veroeffentlicht,
+                    Model.erstellt_am,
+                    Model.gemeinde_id,
+                    Model.erstellt_von,
+                ),
+                magistratsvorlage,
+                editor(Model.autor),
+                noload("*"),
+            ],
+            "detail": [
+                objective_tree(
+                    [
+                        load_user_read(Indikator.autor),
+                        load_user_read(Indikator.letzter_bearbeiter),
+                    ]
+                ),
+                magistratsvorlage,
+                load_user_read(Model.autor),
+                load_user_read(Model.letzter_bearbeiter),
+                raiseload("*"),
+            ],
+            "pdf": [
+                objective_tree([]),
+                magistratsvorlage,
+                editor(Model.autor),
+                editor(Model.letzter_bearbeiter),
+                raiseload("*"),
+            ],
+        }
+
+    def search_match(self, query: ColumnElement) -> Tuple[ColumnElement, ColumnElement]:
+        """
+        Also matches the remarks on the sub-objectives of a submission, which add
+        the rank of their best match.
+        """
+        condition, rank = super().search_match(query)
+        anmerkungen = (
+            select(EingabeZielOber.eingabe_id)
+            .join(
+                EingabeZielUnter,
+                EingabeZielUnter.eingabe_ziel_ober_id == EingabeZielOber.id,
+            )
+            .where(EingabeZielUnter.suchtext.op("@@")(query))
+        )
+        anmerkung_rank = (
+            anmerkungen.where(EingabeZielOber.eingabe_id == Model.id)
+            .with_only_columns(
+                func.max(cast(func.ts_rank(EingabeZielUnter.suchtext, query), Double))
+            )
+            .scalar_subquery()
+        )
+        return (
+            or_(condition, Model.id.in_(anmerkungen)),
+            rank + func.coalesce(anmerkung_rank, 0.0),
+        )
+
+    async def get_gesamtwirkung(
+        self,
+        db: AsyncSession,
+        ids: List[int],
+        gemeinde_id: Optional[int] = None,
+    ) -> Dict[int, List[Any]]:
+        """
+        Computes the Zielampel of Eingaben in a single aggregate query, without
+        loading their objective trees.
+
+        The impact of a main objective is the mean impact of its sub-objectives
+        which are tangiert, counting those without an impact as 0, as in the
+        PDF export. It is None if the main objective or none of its
+        sub-objectives is tangiert.
+
+        :param ids: The IDs of the Eingaben.
+        :param gemeinde_id: If given, only Eingaben of this municipality are included.
+        :return: Rows of `ziel_ober_id`, `nr`, `tangiert` and `auswirkung` per main
+            objective, by the ID of the Eingabe. Eingaben which do not exist are
+            left out.
+        """
+        tangiert = EingabeZielUnter.tangiert.is_(True)
+        anzahl = func.count(EingabeZielUnter.id).filter(tangiert)
+        summe = func.sum(func.coalesce(EingabeZielUnter.auswirkung, 0)).filter(tangiert)
+        auswirkung = case(
+            (
+                EingabeZielOber.tangiert.is_(True),
+                cast(summe, Float) / func.nullif(anzahl, 0),
+            ),
+            else_=None,
+        )
+
+        statement = (
+            select(
+                Model.id.label("eingabe_id"),
+                EingabeZielOber.ziel_ober_id,
+                ZielOber.nr,
+                EingabeZielOber.tangiert,
+                auswirkung.label("auswirkung"),
+            )
+            .outerjoin(EingabeZielOber, EingabeZielOber.eingabe_id == Model.id)
+            .outerjoin(ZielOber, ZielOber.id == EingabeZielOber.ziel_ober_id)
+            .outerjoin(
+                EingabeZielUnter,
+                EingabeZielUnter.eingabe_ziel_ober_id == EingabeZielOber.id,
+            )
+            .where(Model.id.in_(ids))
+            .group_by(
+                Model.id,
+                EingabeZielOber.id,
+                EingabeZielOber.ziel_ober_id,
+                EingabeZielOber.tangiert,
+                ZielOber.nr,
+            )
+            .order_by(Model.id, ZielOber.nr)
+        )
+        if gemeinde_id is not None:
+            statement = statement.where(Model.gemeinde_id == gemeinde_id)
+
+        result = await db.execute(statement)
+        gesamtwirkung: Dict[int, List[Any]] = {}
+        for row in result.all():
+            ziele = gesamtwirkung.setdefault(row.eingabe_id, [])
+            if row.ziel_ober_id is not None:
+                ziele.append(row)
+        return gesamtwirkung
+
+    async def create_from_catalog(
+        self, db: AsyncSession, obj_in: CreateSchema, user: User
+    ) -> Model:
+        """
+        Creates an Eingabe together with its full objective tree, one
+        `EingabeZielOber` per `ZielOber` and one `EingabeZielUnter` per `ZielUnter`
+        of the user's municipality.
+
+        The tree is inserted set-based with `INSERT ... SELECT` from the catalogue,
+        so the number of statements does not depend on the size of the catalogue.
+        Everything is committed in a single transaction.
+        """
+        obj_data = obj_in.model_dump(exclude_none=True, exclude_unset=True)
+        obj_data["gemeinde_id"] = user.gemeinde_id
+        obj_data["erstellt_von"] = user.id
+        obj_data["zuletzt_bearbeitet_von"] = user.id
+
+        try:
+            result = await db.execute(
+                insert(Model).values(**obj_data).returning(Model.id)
+            )
+            eingabe_id = result.scalar_one()
+
+            await db.execute(
+                insert(EingabeZielOber).from_select(
+                    ["eingabe_id", "ziel_ober_id", "tangiert"],
+                    select(literal(eingabe_id), ZielOber.id, false()).where(
+                        ZielOber.gemeinde_id == user.gemeinde_id
+                    ),
+                )
+            )
+            await db.execute(
+                insert(EingabeZielUnter).from_select(
+                    ["eingabe_ziel_ober_id", "ziel_unter_id", "tangiert"],
+                    select(EingabeZielOber.id, ZielUnter.id, false())
+                    .join(
+                        EingabeZielOber,
+                        EingabeZielOber.ziel_ober_id == ZielUnter.ziel_ober_id,
+                    )
+                    .where(EingabeZielOber.eingabe_id == eingabe_id),
+                )
+            )
+            await touch_embedding(db, Model, [eingabe_id])
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise DatabaseCommitError(e)
+
+        return await self.get(db, eingabe_id, loader_profile="detail")
+
+    def copy_arguments(self, user: User) -> Dict[str, Any]:
         exclude = ["id", "erstellt_am"]
 
         updates = {
@@ -26,19 +266,41 @@ class CRUDMobilitySubmission(CRUDEingabe[Model, CreateSchema, UpdateSchema]):
         }
 
         nested_attributes = {
-            "eingabe_ziel_ober": ["eingabe_ziel_unter"],
+            "eingabe_ziel_ober": {"eingabe_ziel_unter": {"indikatoren": {}}},
+        }
+
+        return {
+            "updates": updates,
+            "exclude": exclude,
+            "nested_attributes": nested_attributes,
         }
 
+    async def copy(self, db: AsyncSession, id: int, user: User) -> Model:
         return await super().copy(
-            db=db,
-            id=id,
-            updates=updates,
-            exclude=exclude,
-            nested_attributes=nested_attributes,
+            db=db, id=id, **self.copy_arguments(user), loader_profile="detail"
         )
 
-    async def export(self, db: AsyncSession, id: int):
+    async def copy_many(
+        self,
+        db: AsyncSession,
+        ids: List[int],
+        user: User,
+        magistratsvorlage_id: Optional[int] = None,
+    ) -> Dict[int, int]:
+        arguments = self.copy_arguments(user)
+        if magistratsvorlage_id is not None:
+            arguments["updates"]["magistratsvorlage_id"] = magistratsvorlage_id
+        return await super().copy_many(db=db, ids=ids, **arguments)
+
+    async def export(self, db: AsyncSession, id: int) -> PDFExport:
         return await super().export(db=db, id=id, PDF=MobilitaetscheckPDF)
 
+    async def export_by_magistratsvorlagen(
+        self, db: AsyncSession, magistratsvorlage_ids: List[int]
+    ) -> List[PDFExport]:
+        return await super().export_by_magistratsvorlagen(
+            db=db, magistratsvorlage_ids=magistratsvorlage_ids, PDF=MobilitaetscheckPDF
+        )
+
 
 crud_mobility_submission = CRUDMobilitySubmission()
@@ -1,10 +1,26 @@
-from app.crud.base import CRUDBase
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import Select, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+
+from app.crud.association import sync_associations
+from app.crud.base import CRUDBase, load_user_read
+from app.crud.exceptions import AuthorizationError, DatabaseCommitError, NotFoundError
+from app.crud.last_modified import touch_embedding
+from app.models.indikator import Indikator
+from app.models.mobilitaetscheck_eingabe import MobilitaetscheckEingabe
+from app.models.mobilitaetscheck_eingabe_ziel_ober import (
+    MobilitaetscheckEingabeZielOber,
+)
 from app.models.mobilitaetscheck_eingabe_ziel_unter import (
     MobilitaetscheckEingabeZielUnter as Model,
 )
 from app.schemas.mobilitaetscheck_eingabe_ziel_unter import (
     MobilitaetscheckEingabeZielUnterCreate as CreateSchema,
     MobilitaetscheckEingabeZielUnterUpdate as UpdateSchema,
+    MobilitaetscheckEingabeZielUnterBulkUpdate as BulkUpdateSchema,
 )
 
 
@@ -12,5 +28,154 @@ class CRUDMobilitySubresult(CRUDBase[Model, CreateSchema, UpdateSchema]):
     def __init__(self):
         super().__init__(Model)
 
+    @property
+    def loader_profiles(self) -> Dict[str, List[Any]]:
+        """
+        * `detail`: The sub-objective, spatial impact and indicators serialized by
+          the read schema.
+        """
+        return {
+            **super().loader_profiles,
+            "detail": [
+                joinedload(Model.ziel_unter).raiseload("*"),
+                joinedload(Model.auswirkung_raeumlich),
+                selectinload(Model.indikatoren).options(
+                    load_user_read(Indikator.autor),
+                    load_user_read(Indikator.letzter_bearbeiter),
+                    raiseload("*"),
+                ),
+                raiseload("*"),
+            ],
+        }
+
+    async def check_gemeinde(
+        self,
+        db: AsyncSession,
+        ids: List[int],
+        gemeinde_id: Optional[int],
+        action: str = "modify this resource",
+    ) -> None:
+        """
+        Checks that sub-results exist and belong to Eingaben of a municipality,
+        looked up through their main objective results in one query.
+
+        :param gemeinde_id: The municipality, or None to only check that the
+            sub-results exist, e.g. for a superuser.
+        :raises NotFoundError: If one of the sub-results does not exist.
+        :raises AuthorizationError: If one of them belongs to another municipality.
+        """
+        statement = (
+            select(Model.id, MobilitaetscheckEingabe.gemeinde_id)
+            .join(
+                MobilitaetscheckEingabeZielOber,
+                MobilitaetscheckEingabeZielOber.id == Model.eingabe_ziel_ober_id,
+            )
+            .join(
+                MobilitaetscheckEingabe,
+                MobilitaetscheckEingabe.id
+                == MobilitaetscheckEingabeZielOber.eingabe_id,
+            )
+            .where(Model.id.in_(ids))
+        )
+        await _check_gemeinde(db, statement, Model, ids, gemeinde_id, action)
+
+    async def check_eingabe_ziel_ober_gemeinde(
+        self,
+        db: AsyncSession,
+        eingabe_ziel_ober_id: int,
+        gemeinde_id: Optional[int],
+    ) -> None:
+        """
+        Checks that sub-results may be added to a main objective result, see
+        `check_gemeinde`.
+        """
+        statement = (
+            select(
+                MobilitaetscheckEingabeZielOber.id, MobilitaetscheckEingabe.gemeinde_id
+            )
+            .join(
+                MobilitaetscheckEingabe,
+                MobilitaetscheckEingabe.id
+                == MobilitaetscheckEingabeZielOber.eingabe_id,
+            )
+            .where(MobilitaetscheckEingabeZielOber.id == eingabe_ziel_ober_id)
+        )
+        await _check_gemeinde(
+            db,
+            statement,
+            MobilitaetscheckEingabeZielOber,
+            [eingabe_ziel_ober_id],
+            gemeinde_id,
+            "modify this resource",
+        )
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        objs_in: List[BulkUpdateSchema],
+        gemeinde_id: Optional[int] = None,
+    ) -> List[Model]:
+        """
+        Updates several sub-results and their indicators in a single transaction.
+
+        The columns are written with one executemany `UPDATE` per set of changed
+        fields, the indicators by inserting and deleting only the association rows
+        which differ from the requested ones. As in `update`, fields which are not
+        set are left unchanged. Several updates of the same sub-result are merged.
+
+        :param objs_in: The updates, each identified by the ID of its sub-result.
+        :param gemeinde_id: If given, only sub-results of Eingaben of this
+            municipality may be updated, see `check_gemeinde`.
+        :return: The updated sub-results, in the order of their first update.
+        :raises NotFoundError: If one of the sub-results does not exist.
+        :raises AuthorizationError: If one of them belongs to another municipality.
+        """
+        values: Dict[int, Dict[str, Any]] = {}
+        indikator_ids: Dict[int, Set[int]] = {}
+        for obj_in in objs_in:
+            obj_data = obj_in.model_dump(exclude_none=True, exclude_unset=True)
+            id = obj_data.pop("id")
+            ids = obj_data.pop("indikator_ids", None)
+            values.setdefault(id, {}).update(obj_data)
+            if ids is not None:
+                indikator_ids[id] = set(ids)
+
+        if not values:
+            return []
+
+        await self.check_gemeinde(db, list(values), gemeinde_id)
+
+        try:
+            rows = [{"id": id, **data} for id, data in values.items() if data]
+            if rows:
+                await db.execute(update(Model), rows)
+            if indikator_ids:
+                await sync_associations(db, Model.indikatoren, indikator_ids)
+            await touch_embedding(db, Model, list(values))
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise DatabaseCommitError(e)
+
+        return await self.get_by_ids(db, list(values), loader_profile="detail")
+
+
+async def _check_gemeinde(
+    db: AsyncSession,
+    statement: Select,
+    model: Any,
+    ids: List[int],
+    gemeinde_id: Optional[int],
+    action: str,
+) -> None:
+    # `statement` selects the ID of each record and the municipality of its Eingabe
+    result = await db.execute(statement)
+    gemeinde_ids = dict(result.all())
+    missing = [id for id in ids if id not in gemeinde_ids]
+    if missing:
+        raise NotFoundError(model.__name__, missing[0])
+    if gemeinde_id is not None and any(gemeinde_ids[id] != gemeinde_id for id in ids):
+        raise AuthorizationError(action)
+
 
 crud_mobility_subresult = CRUDMobilitySubresult()
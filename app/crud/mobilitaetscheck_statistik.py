@@ -0,0 +1,111 @@
+from typing import Any, List
+
+from sqlalchemy import extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.mobilitaetscheck_eingabe import MobilitaetscheckEingabe as Eingabe
+from app.models.mobilitaetscheck_eingabe_ziel_ober import (
+    MobilitaetscheckEingabeZielOber as EingabeZielOber,
+)
+from app.models.mobilitaetscheck_eingabe_ziel_unter import (
+    MobilitaetscheckEingabeZielUnter as EingabeZielUnter,
+)
+from app.models.mobilitaetscheck_ziel_ober import MobilitaetscheckZielOber as ZielOber
+from app.models.mobilitaetscheck_ziel_unter import (
+    MobilitaetscheckZielUnter as ZielUnter,
+)
+
+# The aggregates below are counts grouped by a few small dimensions, so their
+# size depends on the objective catalogue but not on the number of Eingaben.
+
+
+def _monat(column: Any) -> List[Any]:
+    return [
+        extract("year", column).label("jahr"),
+        extract("month", column).label("monat"),
+    ]
+
+
+async def get_ziel_katalog(db: AsyncSession, gemeinde_id: int) -> List[Any]:
+    """
+    The main objectives of a municipality with their sub-objectives, one row
+    per sub-objective, ordered by number.
+    """
+    result = await db.execute(
+        select(
+            ZielOber.id.label("ziel_ober_id"),
+            ZielOber.nr.label("ziel_ober_nr"),
+            ZielOber.name.label("ziel_ober_name"),
+            ZielUnter.id.label("ziel_unter_id"),
+            ZielUnter.nr.label("ziel_unter_nr"),
+            ZielUnter.name.label("ziel_unter_name"),
+        )
+        .outerjoin(ZielUnter, ZielUnter.ziel_ober_id == ZielOber.id)
+        .where(ZielOber.gemeinde_id == gemeinde_id)
+        .order_by(ZielOber.nr, ZielUnter.nr)
+    )
+    return result.all()
+
+
+async def count_eingaben(db: AsyncSession, gemeinde_id: int) -> List[Any]:
+    """
+    The number of Eingaben of a municipality per month of their creation.
+    """
+    result = await db.execute(
+        select(*_monat(Eingabe.erstellt_am), func.count(Eingabe.id).label("anzahl"))
+        .where(Eingabe.gemeinde_id == gemeinde_id)
+        .group_by("jahr", "monat")
+    )
+    return result.all()
+
+
+async def count_eingabe_ziel_ober(db: AsyncSession, gemeinde_id: int) -> List[Any]:
+    """
+    The number of assessed main objectives of a municipality per objective and
+    whether they are tangiert.
+    """
+    result = await db.execute(
+        select(
+            EingabeZielOber.ziel_ober_id,
+            EingabeZielOber.tangiert,
+            func.count(EingabeZielOber.id).label("anzahl"),
+        )
+        .join(Eingabe, Eingabe.id == EingabeZielOber.eingabe_id)
+        .where(Eingabe.gemeinde_id == gemeinde_id)
+        .group_by(EingabeZielOber.ziel_ober_id, EingabeZielOber.tangiert)
+    )
+    return result.all()
+
+
+async def count_eingabe_ziel_unter(db: AsyncSession, gemeinde_id: int) -> List[Any]:
+    """
+    The number of assessed sub-objectives of a municipality per objective,
+    assessment and month of the Eingabe.
+    """
+    dimensions = [
+        EingabeZielUnter.ziel_unter_id,
+        EingabeZielOber.tangiert.label("ziel_ober_tangiert"),
+        EingabeZielUnter.tangiert,
+        EingabeZielUnter.auswirkung,
+        EingabeZielUnter.auswirkung_raeumlich_id,
+        *_monat(Eingabe.erstellt_am),
+    ]
+    result = await db.execute(
+        select(*dimensions, func.count(EingabeZielUnter.id).label("anzahl"))
+        .join(
+            EingabeZielOber,
+            EingabeZielOber.id == EingabeZielUnter.eingabe_ziel_ober_id,
+        )
+        .join(Eingabe, Eingabe.id == EingabeZielOber.eingabe_id)
+        .where(Eingabe.gemeinde_id == gemeinde_id)
+        .group_by(
+            EingabeZielUnter.ziel_unter_id,
+            EingabeZielOber.tangiert,
+            EingabeZielUnter.tangiert,
+            EingabeZielUnter.auswirkung,
+            EingabeZielUnter.auswirkung_raeumlich_id,
+            "jahr",
+            "monat",
+        )
+    )
+    return result.all()
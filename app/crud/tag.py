@@ -1,9 +1,9 @@
-from app.crud.base import CRUDBase
+from app.crud.base_katalog import CRUDKatalog
 from app.models.tag import Tag as Model
 from app.schemas.tag import TagCreate as CreateSchema, TagUpdate as UpdateSchema
 
 
-class CRUDTag(CRUDBase[Model, CreateSchema, UpdateSchema]):
+class CRUDTag(CRUDKatalog[Model, CreateSchema, UpdateSchema]):
     def __init__(self):
         super().__init__(Model)
 
@@ -1,4 +1,4 @@
-from app.crud.base import CRUDBase
+from app.crud.base_katalog import CRUDKatalog
 from app.models.textblock import Textblock as Model
 from app.schemas.textblock import (
     TextblockCreate as CreateSchema,
@@ -6,7 +6,7 @@ from app.schemas.textblock import (
 )
 
 
-class CRUDTextblock(CRUDBase[Model, CreateSchema, UpdateSchema]):
+class CRUDTextblock(CRUDKatalog[Model, CreateSchema, UpdateSchema]):
     def __init__(self):
         super().__init__(Model)
 
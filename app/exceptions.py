@@ -1,7 +1,15 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
-from app.crud.exceptions import AuthorizationError, DatabaseCommitError, NotFoundError
+from app.crud.exceptions import (
+    AuthorizationError,
+    DatabaseCommitError,
+    ExportJobNotReadyError,
+    InvalidCursorError,
+    NotFoundError,
+    PDFRenderTimeoutError,
+    PDFRenderUnavailableError,
+)
 
 
 async def authorization_exception_handler(request: Request, exc: AuthorizationError):
@@ -14,3 +22,25 @@ async def database_commit_exception_handler(request: Request, exc: DatabaseCommi
 
 async def not_found_exception_handler(request: Request, exc: NotFoundError):
     return JSONResponse(status_code=204, content={"message": exc.message})
+
+
+async def invalid_cursor_exception_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=400, content={"message": exc.message})
+
+
+async def pdf_render_unavailable_exception_handler(
+    request: Request, exc: PDFRenderUnavailableError
+):
+    return JSONResponse(status_code=503, content={"message": exc.message})
+
+
+async def pdf_render_timeout_exception_handler(
+    request: Request, exc: PDFRenderTimeoutError
+):
+    return JSONResponse(status_code=504, content={"message": exc.message})
+
+
+async def export_job_not_ready_exception_handler(
+    request: Request, exc: ExportJobNotReadyError
+):
+    return JSONResponse(status_code=409, content={"message": exc.message})
@@ -1,15 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.crud.exceptions import AuthorizationError, DatabaseCommitError, NotFoundError
+from app.crud.exceptions import (
+    AuthorizationError,
+    DatabaseCommitError,
+    ExportJobNotReadyError,
+    InvalidCursorError,
+    NotFoundError,
+    PDFRenderTimeoutError,
+    PDFRenderUnavailableError,
+)
 from app.exceptions import (
     authorization_exception_handler,
     database_commit_exception_handler,
+    export_job_not_ready_exception_handler,
+    invalid_cursor_exception_handler,
     not_found_exception_handler,
+    pdf_render_timeout_exception_handler,
+    pdf_render_unavailable_exception_handler,
 )
 from app.api.main import router
-
+from app.core.invalidation_bus import invalidation_bus
+from app.services.pdf.export_jobs import export_job_worker
+from app.services.pdf.render_service import pdf_render_service
+from app.services.statistik.dashboard import dashboard_refresher
+from app.utils.pagination_util import NEXT_CURSOR_HEADER
 
 description = """
 This is a fancy API built with [FastAPI🚀](https://fastapi.tiangolo.com/)
@@ -19,16 +37,39 @@ This is a fancy API built with [FastAPI🚀](https://fastapi.tiangolo.com/)
 """
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    pdf_render_service.start()
+    export_job_worker.start()
+    dashboard_refresher.start()
+    if settings.INVALIDATION_BUS_ENABLED:
+        invalidation_bus.start()
+    yield
+    await invalidation_bus.stop()
+    await dashboard_refresher.stop()
+    await export_job_worker.stop()
+    pdf_render_service.shutdown()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=description,
     version="1.0.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 app.add_exception_handler(AuthorizationError, authorization_exception_handler)
 app.add_exception_handler(DatabaseCommitError, database_commit_exception_handler)
 app.add_exception_handler(NotFoundError, not_found_exception_handler)
+app.add_exception_handler(InvalidCursorError, invalid_cursor_exception_handler)
+app.add_exception_handler(
+    PDFRenderUnavailableError, pdf_render_unavailable_exception_handler
+)
+app.add_exception_handler(PDFRenderTimeoutError, pdf_render_timeout_exception_handler)
+app.add_exception_handler(
+    ExportJobNotReadyError, export_job_not_ready_exception_handler
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -36,6 +77,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(router)
@@ -11,12 +11,14 @@ from app.models.assoziation_mobilitaetscheckEingabeZielUnter_indikator import (
     mobilitaetscheckEingabeZielUnter_indikator_assoziation,
 )
 from app.models.assoziation_textblock_tag import textblock_tag_assoziation
+from app.models.export_job import ExportJob
 from app.models.gemeinde import Gemeinde
 from app.models.gemeinde_gebiet import GemeindeGebiet
 from app.models.klimacheck_klimarelevanz import KlimacheckKlimarelevanz
 from app.models.klimacheck_auswirkung_dauer import KlimacheckAuswirkungDauer
 from app.models.klimacheck_eingabe import KlimacheckEingabe
 from app.models.indikator import Indikator
+from app.models.loeschprotokoll import Loeschprotokoll
 from app.models.magistratsvorlage import Magistratsvorlage
 from app.models.mobilitaetscheck_auswirkung_raeumlich import (
     MobilitaetscheckAuswirkungRaeumlich,
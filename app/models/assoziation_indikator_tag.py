@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Table
+from sqlalchemy import Column, Index, Integer, ForeignKey, Table
 
 from app.core.db import Base
 
@@ -8,4 +8,7 @@ indikator_tag_assoziation = Table(
     Base.metadata,
     Column("indikator_id", Integer, ForeignKey("indikator.id", ondelete="CASCADE")),
     Column("tag_id", Integer, ForeignKey("tag.id", ondelete="CASCADE")),
+    # Entries by tag for the tag filter, and tags by entry for the facets
+    Index("ix_indikator_tag_tag_id_indikator_id", "tag_id", "indikator_id"),
+    Index("ix_indikator_tag_indikator_id_tag_id", "indikator_id", "tag_id"),
 )
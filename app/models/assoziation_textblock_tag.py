@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Table
+from sqlalchemy import Column, Index, Integer, ForeignKey, Table
 
 from app.core.db import Base
 
@@ -8,4 +8,7 @@ textblock_tag_assoziation = Table(
     Base.metadata,
     Column("textblock_id", Integer, ForeignKey("textblock.id", ondelete="CASCADE")),
     Column("tag_id", Integer, ForeignKey("tag.id", ondelete="CASCADE")),
+    # Entries by tag for the tag filter, and tags by entry for the facets
+    Index("ix_textblock_tag_tag_id_textblock_id", "tag_id", "textblock_id"),
+    Index("ix_textblock_tag_textblock_id_tag_id", "textblock_id", "tag_id"),
 )
@@ -0,0 +1,69 @@
+from typing import List, Optional
+
+from datetime import datetime
+from fastapi_users_db_sqlalchemy.generics import GUID
+from sqlalchemy import JSON, Enum, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import text
+
+from app.core.db import Base
+from app.utils.enum_util import ExportJobStatusEnum
+
+
+class ExportJob(Base):
+    __tablename__ = "export_job"
+
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        index=True,
+        nullable=False,
+        unique=True,
+        comment="ID des Exportauftrags",
+    )
+    magistratsvorlage_ids: Mapped[List[int]] = mapped_column(
+        JSON,
+        nullable=False,
+        comment="IDs der Magistratsvorlagen, deren Checks exportiert werden",
+    )
+    status: Mapped[ExportJobStatusEnum] = mapped_column(
+        Enum(ExportJobStatusEnum, native_enum=False, length=20),
+        nullable=False,
+        default=ExportJobStatusEnum.wartend,
+        index=True,
+        comment="Bearbeitungsstand des Exportauftrags",
+    )
+    anzahl_gesamt: Mapped[int] = mapped_column(
+        nullable=False, default=0, comment="Anzahl der zu exportierenden Checks"
+    )
+    anzahl_fertig: Mapped[int] = mapped_column(
+        nullable=False, default=0, comment="Anzahl der bereits exportierten Checks"
+    )
+    fehler: Mapped[Optional[str]] = mapped_column(
+        nullable=True, comment="Fehlermeldung eines fehlgeschlagenen Exports"
+    )
+    datei: Mapped[Optional[str]] = mapped_column(
+        nullable=True, comment="Pfad der erzeugten ZIP-Datei"
+    )
+    gemeinde_id: Mapped[int] = mapped_column(
+        ForeignKey("gemeinde.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Gemeinde ID, mit der der Exportauftrag verknüpft ist",
+    )
+    erstellt_von: Mapped[Optional[GUID]] = mapped_column(
+        ForeignKey(
+            "user.id",
+            ondelete="SET NULL",
+        ),
+        nullable=True,
+        comment="User ID vom Ersteller des Exportauftrags",
+    )
+    erstellt_am: Mapped[datetime] = mapped_column(
+        nullable=False, server_default=text("now()"), comment="Zeitpunkt der Erstellung"
+    )
+    aktualisiert_am: Mapped[Optional[datetime]] = mapped_column(
+        nullable=True,
+        comment="Zeitpunkt des letzten Fortschritts, solange der Export läuft",
+    )
+    abgeschlossen_am: Mapped[Optional[datetime]] = mapped_column(
+        nullable=True, comment="Zeitpunkt, zu dem der Export fertig wurde"
+    )
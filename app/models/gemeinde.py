@@ -19,10 +19,10 @@ class Gemeinde(Base):
         nullable=False, comment="Name der Gemeinde oder Stadt"
     )
     users: Mapped[Optional[List["User"]]] = relationship(
-        back_populates="gemeinde", lazy="selectin"
+        back_populates="gemeinde", lazy="raise"
     )
     gebiete: Mapped[Optional[List["GemeindeGebiet"]]] = relationship(
-        back_populates="gemeinde", lazy="selectin"
+        back_populates="gemeinde", lazy="raise"
     )
 
 
@@ -1,8 +1,10 @@
 from typing import Optional, List
 
+from datetime import datetime
 from fastapi_users_db_sqlalchemy.generics import GUID
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import text
 
 from app.core.db import Base
 
@@ -28,6 +30,13 @@ class GemeindeGebiet(Base):
     gemeinde: Mapped["Gemeinde"] = relationship(
         back_populates="gebiete", lazy="selectin"
     )
+    zuletzt_geaendert_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=func.now(),
+        comment="Zeitpunkt der letzten Änderung, auch eingebetteter Datensätze",
+    )
     erstellt_von: Mapped[Optional[GUID]] = mapped_column(
         ForeignKey(
             "user.id",
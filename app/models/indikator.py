@@ -1,8 +1,10 @@
 from typing import List, Optional
 
+from datetime import datetime
 from fastapi_users_db_sqlalchemy.generics import GUID
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import text
 
 from app.core.db import Base
 from app.models.assoziation_indikator_tag import indikator_tag_assoziation
@@ -10,6 +12,14 @@ from app.models.assoziation_indikator_tag import indikator_tag_assoziation
 
 class Indikator(Base):
     __tablename__ = "indikator"
+    __table_args__ = (
+        Index(
+            "ix_indikator_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
@@ -39,6 +49,13 @@ class Indikator(Base):
         comment="Gemeinde ID, mit der der Indikator verknüpft ist.",
     )
     gemeinde: Mapped["Gemeinde"] = relationship(lazy="selectin")
+    zuletzt_geaendert_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=func.now(),
+        comment="Zeitpunkt der letzten Änderung, auch eingebetteter Datensätze",
+    )
     erstellt_von: Mapped[Optional[GUID]] = mapped_column(
         ForeignKey(
             "user.id",
@@ -2,7 +2,8 @@ from typing import Optional
 
 from datetime import datetime, date
 from fastapi_users_db_sqlalchemy.generics import GUID
-from sqlalchemy import CheckConstraint, ForeignKey
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import text
 
@@ -19,6 +20,9 @@ class KlimacheckEingabe(Base):
     """
 
     __tablename__ = "klimacheck_eingabe"
+    __table_args__ = (
+        Index("ix_klimacheck_eingabe_suchtext", "suchtext", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
@@ -83,6 +87,13 @@ class KlimacheckEingabe(Base):
         server_default=text("now()"),
         comment="Zeitpunkt der Erstellung des Klimachecks",
     )
+    zuletzt_geaendert_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=func.now(),
+        comment="Zeitpunkt der letzten Änderung, auch eingebetteter Datensätze",
+    )
     gemeinde_id: Mapped[int] = mapped_column(
         ForeignKey(
             "gemeinde.id",
@@ -92,6 +103,17 @@ class KlimacheckEingabe(Base):
         comment="ID der Gemeinde, mit der der Klimacheck verknüpft ist.",
     )
     gemeinde: Mapped["Gemeinde"] = relationship(lazy="selectin")
+    suchtext: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('german', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('german', coalesce(auswirkung_beschreibung, '')), 'B') || "
+            "setweight(to_tsvector('german', coalesce(alternativen, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        comment="Suchindex über Name, Beschreibung der Auswirkungen und Alternativen",
+    )
     erstellt_von: Mapped[Optional[GUID]] = mapped_column(
         ForeignKey(
             "user.id",
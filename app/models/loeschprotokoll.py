@@ -0,0 +1,46 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import text
+
+from app.core.db import Base
+
+
+class Loeschprotokoll(Base):
+    """
+    A deleted record, kept for a while so clients syncing changes since a
+    point in time learn about the deletion.
+    """
+
+    __tablename__ = "loeschprotokoll"
+    __table_args__ = (
+        Index(
+            "ix_loeschprotokoll_tabelle_gemeinde_id_geloescht_am",
+            "tabelle",
+            "gemeinde_id",
+            "geloescht_am",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        nullable=False,
+        comment="ID des Protokolleintrags",
+    )
+    tabelle: Mapped[str] = mapped_column(
+        nullable=False, comment="Tabelle des gelöschten Datensatzes"
+    )
+    datensatz_id: Mapped[int] = mapped_column(
+        nullable=False, comment="ID des gelöschten Datensatzes"
+    )
+    gemeinde_id: Mapped[int] = mapped_column(
+        ForeignKey("gemeinde.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Gemeinde ID des gelöschten Datensatzes",
+    )
+    geloescht_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        comment="Zeitpunkt der Löschung",
+    )
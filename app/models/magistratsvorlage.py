@@ -2,7 +2,8 @@ from typing import List, Optional
 
 from datetime import datetime, date
 from fastapi_users_db_sqlalchemy.generics import GUID
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, DateTime, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import text
 
@@ -14,6 +15,9 @@ from app.models.assoziation_magistratsvorlage_gemeindeGebiet import (
 
 class Magistratsvorlage(Base):
     __tablename__ = "magistratsvorlage"
+    __table_args__ = (
+        Index("ix_magistratsvorlage_suchtext", "suchtext", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
@@ -44,6 +48,13 @@ class Magistratsvorlage(Base):
     erstellt_am: Mapped[datetime] = mapped_column(
         nullable=False, server_default=text("now()"), comment="Zeitpunkt der Erstellung"
     )
+    zuletzt_geaendert_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=func.now(),
+        comment="Zeitpunkt der letzten Änderung, auch eingebetteter Datensätze",
+    )
     veroeffentlicht: Mapped[bool] = mapped_column(
         nullable=False,
         default=False,
@@ -55,6 +66,17 @@ class Magistratsvorlage(Base):
         comment="Gemeinde ID, mit der die Mobilitätscheck-Eingabe verknüpft ist",
     )
     gemeinde: Mapped["Gemeinde"] = relationship(lazy="selectin")
+    suchtext: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('german', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(verwaltungsvorgang_nr, '')), 'A') || "
+            "setweight(to_tsvector('german', coalesce(beschreibung, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        comment="Suchindex über Name, Vorgangsnummer und Beschreibung",
+    )
 
     erstellt_von: Mapped[Optional[GUID]] = mapped_column(
         ForeignKey(
@@ -2,7 +2,8 @@ from typing import List, Optional
 
 from datetime import datetime, date
 from fastapi_users_db_sqlalchemy.generics import GUID
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, DateTime, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import text
 
@@ -14,6 +15,11 @@ from app.models.assoziation_mobilitaetscheckEingabe_user import (
 
 class MobilitaetscheckEingabe(Base):
     __tablename__ = "mobilitaetscheck_eingabe"
+    __table_args__ = (
+        Index(
+            "ix_mobilitaetscheck_eingabe_suchtext", "suchtext", postgresql_using="gin"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
@@ -28,6 +34,13 @@ class MobilitaetscheckEingabe(Base):
     erstellt_am: Mapped[datetime] = mapped_column(
         nullable=False, server_default=text("now()"), comment="Zeitpunkt der Erstellung"
     )
+    zuletzt_geaendert_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=func.now(),
+        comment="Zeitpunkt der letzten Änderung, auch eingebetteter Datensätze",
+    )
     magistratsvorlage_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("magistratsvorlage.id", ondelete="SET NULL"),
         nullable=True,
@@ -53,6 +66,15 @@ class MobilitaetscheckEingabe(Base):
         comment="Gemeinde ID, mit der die Mobilitätscheck-Eingabe verknüpft ist",
     )
     gemeinde: Mapped["Gemeinde"] = relationship(lazy="selectin")
+    suchtext: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('german', coalesce(name, '')), 'A')",
+            persisted=True,
+        ),
+        deferred=True,
+        comment="Suchindex über den Namen",
+    )
     erstellt_von: Mapped[Optional[GUID]] = mapped_column(
         ForeignKey("user.id", ondelete="SET NULL"),
         nullable=True,
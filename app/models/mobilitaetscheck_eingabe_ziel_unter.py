@@ -1,6 +1,7 @@
 from typing import List, Optional, Literal
 
-from sqlalchemy import CheckConstraint, ForeignKey
+from sqlalchemy import CheckConstraint, ForeignKey, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 from sqlalchemy.sql import select
@@ -14,6 +15,13 @@ from app.models.assoziation_mobilitaetscheckEingabeZielUnter_indikator import (
 
 class MobilitaetscheckEingabeZielUnter(Base):
     __tablename__ = "mobilitaetscheck_eingabe_ziel_unter"
+    __table_args__ = (
+        Index(
+            "ix_mobilitaetscheck_eingabe_ziel_unter_suchtext",
+            "suchtext",
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
@@ -74,6 +82,15 @@ class MobilitaetscheckEingabeZielUnter(Base):
     anmerkung: Mapped[Optional[str]] = mapped_column(
         nullable=True, comment="Anmerkung zum Unterziel"
     )
+    suchtext: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('german', coalesce(anmerkung, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        comment="Suchindex über die Anmerkung",
+    )
     indikatoren: Mapped[Optional[List["Indikator"]]] = relationship(
         secondary=mobilitaetscheckEingabeZielUnter_indikator_assoziation,
         passive_deletes=True,
@@ -1,14 +1,24 @@
 from typing import Optional
 
+from datetime import datetime
 from fastapi_users_db_sqlalchemy.generics import GUID
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import text
 
 from app.core.db import Base
 
 
 class Tag(Base):
     __tablename__ = "tag"
+    __table_args__ = (
+        Index(
+            "ix_tag_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True, index=True, nullable=False, unique=True, comment="Tag ID"
@@ -26,6 +36,13 @@ class Tag(Base):
     )
     gemeinde: Mapped["Gemeinde"] = relationship(lazy="selectin")
 
+    zuletzt_geaendert_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=func.now(),
+        comment="Zeitpunkt der letzten Änderung, auch eingebetteter Datensätze",
+    )
     erstellt_von: Mapped[Optional[GUID]] = mapped_column(
         ForeignKey("user.id", ondelete="SET NULL"),
         nullable=True,
@@ -1,8 +1,10 @@
 from typing import List, Optional
 
+from datetime import datetime
 from fastapi_users_db_sqlalchemy.generics import GUID
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import text
 
 from app.core.db import Base
 from app.models.assoziation_textblock_tag import textblock_tag_assoziation
@@ -10,6 +12,14 @@ from app.models.assoziation_textblock_tag import textblock_tag_assoziation
 
 class Textblock(Base):
     __tablename__ = "textblock"
+    __table_args__ = (
+        Index(
+            "ix_textblock_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
@@ -33,6 +43,13 @@ class Textblock(Base):
         comment="Gemeinde ID, mit der der Textblock verknüpft ist",
     )
     gemeinde: Mapped["Gemeinde"] = relationship(lazy="selectin")
+    zuletzt_geaendert_am: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        onupdate=func.now(),
+        comment="Zeitpunkt der letzten Änderung, auch eingebetteter Datensätze",
+    )
     erstellt_von: Mapped[Optional[GUID]] = mapped_column(
         ForeignKey("user.id", ondelete="SET NULL"),
         nullable=True,
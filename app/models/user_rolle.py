@@ -14,7 +14,7 @@ class UserRolle(Base):
         comment="User Rolle ID",
     )
     name: Mapped[str] = mapped_column(nullable=False, comment="Name der Benutzerrolle")
-    users: Mapped["User"] = relationship(back_populates="rolle", lazy="selectin")
+    users: Mapped["User"] = relationship(back_populates="rolle", lazy="raise")
 
 
 from app.models.user import User
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Generic, List, TypeVar
+
+from pydantic import BaseModel, Field
+
+ReadSchemaType = TypeVar("ReadSchemaType")
+
+
+class AenderungenRead(BaseModel, Generic[ReadSchemaType]):
+    """
+    Read schema for the changes of a list since a sync point.
+    """
+
+    geaendert: List[ReadSchemaType] = Field(
+        default_factory=list,
+        description="Records created or changed since the sync point, to be upserted.",
+    )
+    geloescht: List[int] = Field(
+        default_factory=list, description="IDs of the records deleted since."
+    )
+    seit: datetime = Field(
+        ..., description="Sync point to pass as `seit` on the next request."
+    )
+    vollstaendig: bool = Field(
+        ...,
+        description=(
+            "Whether `geaendert` holds all records, which then replace the "
+            "client's copy, because no or an expired sync point was given."
+        ),
+    )
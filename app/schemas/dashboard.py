@@ -0,0 +1,58 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class CheckDashboardRead(BaseModel):
+    """
+    Base schema for the counts of the checks of a municipality.
+    """
+
+    anzahl: int = Field(0, description="Number of checks.")
+    anzahl_veroeffentlicht: int = Field(0, description="Number of published checks.")
+    monat: Dict[str, int] = Field(
+        default_factory=dict, description="Number of checks per month of creation."
+    )
+
+
+class KlimacheckDashboardRead(CheckDashboardRead):
+    """
+    Counts of the climate checks of a municipality.
+    """
+
+    klimarelevanz: Dict[int, int] = Field(
+        default_factory=dict, description="Number of checks per climate relevance ID."
+    )
+    auswirkung_thg: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Number of checks per GHG impact score, or 'keine_angabe'.",
+    )
+    auswirkung_klimaanpassung: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Number of checks per adaptation impact score, or 'keine_angabe'.",
+    )
+
+
+class MobilitaetscheckDashboardRead(CheckDashboardRead):
+    """
+    Counts of the mobility checks of a municipality.
+    """
+
+    auswirkung: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Number of affected sub-objectives per impact score, or 'keine_angabe'.",
+    )
+
+
+class DashboardRead(BaseModel):
+    """
+    Read schema for the dashboard of a municipality.
+    """
+
+    gemeinde_id: int = Field(..., description="ID of the municipality.")
+    klimacheck: KlimacheckDashboardRead = Field(
+        default_factory=KlimacheckDashboardRead, description="Climate checks."
+    )
+    mobilitaetscheck: MobilitaetscheckDashboardRead = Field(
+        default_factory=MobilitaetscheckDashboardRead, description="Mobility checks."
+    )
@@ -0,0 +1,27 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class EingabeKopieCreate(BaseModel):
+    """
+    Schema for copying several checks at once, optionally onto another Magistratsvorlage.
+    """
+
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=500, description="IDs of the checks to copy."
+    )
+    magistratsvorlage_id: Optional[int] = Field(
+        None,
+        description="ID of the Magistratsvorlage the copies belong to. Without it, "
+        "each copy keeps the Magistratsvorlage of its original.",
+    )
+
+
+class EingabeKopieRead(BaseModel):
+    """
+    Read schema mapping a copied check to its copy.
+    """
+
+    id: int = Field(..., description="ID of the copied check.")
+    kopie_id: int = Field(..., description="ID of the copy.")
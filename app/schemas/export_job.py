@@ -0,0 +1,55 @@
+from typing import List, Optional
+
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+from app.utils.enum_util import ExportJobStatusEnum
+
+
+class ExportJobCreate(BaseModel):
+    """
+    Schema for submitting a batch PDF export of Magistratsvorlagen.
+    """
+
+    magistratsvorlage_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        description="IDs of the Magistratsvorlagen whose checks are exported.",
+    )
+
+
+class ExportJobRead(BaseModel):
+    """
+    Read schema for an export job and its progress.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="Unique identifier for the export job.")
+    magistratsvorlage_ids: List[int] = Field(
+        ..., description="IDs of the exported Magistratsvorlagen."
+    )
+    status: ExportJobStatusEnum = Field(..., description="State of the export job.")
+    anzahl_gesamt: int = Field(
+        ..., description="Number of checks to export, known once the job started."
+    )
+    anzahl_fertig: int = Field(..., description="Number of checks exported so far.")
+    fehler: Optional[str] = Field(None, description="Error message of a failed job.")
+    erstellt_am: datetime = Field(
+        ..., description="Timestamp of when the job was submitted."
+    )
+    abgeschlossen_am: Optional[datetime] = Field(
+        None, description="Timestamp of when the export file was ready."
+    )
+
+    @computed_field
+    @property
+    def fortschritt(self) -> float:
+        """
+        Share of exported checks between 0 and 1.
+        """
+        if self.status == ExportJobStatusEnum.fertig:
+            return 1.0
+        if not self.anzahl_gesamt:
+            return 0.0
+        return self.anzahl_fertig / self.anzahl_gesamt
@@ -0,0 +1,28 @@
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TagFacetteRead(BaseModel):
+    """
+    Read schema for the number of catalogue entries carrying a tag.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    tag_id: int = Field(..., description="ID of the tag.")
+    name: str = Field(..., description="Name of the tag.")
+    anzahl: int = Field(
+        ..., description="Number of entries in the result with the tag."
+    )
+
+
+class KatalogFacettenRead(BaseModel):
+    """
+    Read schema for the facets of a filtered catalogue of Indikatoren or Textblöcke.
+    """
+
+    anzahl: int = Field(..., description="Number of entries in the result.")
+    tags: List[TagFacetteRead] = Field(
+        default_factory=list, description="Tags of the entries in the result, by name."
+    )
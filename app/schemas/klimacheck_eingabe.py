@@ -5,7 +5,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from app.utils.label_util import (
     label_klimacheck_auswirkung,
 )
-from app.schemas.user import UserRead
+from app.schemas.user import UserRead, UserSummaryRead
 
 
 class KlimacheckEingabeBase(BaseModel):
@@ -150,6 +150,43 @@ class KlimacheckEingabeRead(KlimacheckEingabeBaseRead):
     )
 
 
+class KlimacheckEingabeSummaryRead(BaseModel):
+    """
+    Lightweight read schema for overview lists.
+    Only includes the columns shown in the overview plus the magistrate submission.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="Unique identifier for each climate submission.")
+    name: Optional[str] = Field(None, description="Name of the climate submission.")
+    magistratsvorlage_id: Optional[int] = Field(
+        None, description="ID of the associated magistrate submission."
+    )
+    magistratsvorlage: Optional["MagistratsvorlageBaseRead"] = Field(
+        None, description="Associated magistrate submission details."
+    )
+    klimarelevanz: Optional["KlimacheckKlimarelevanzRead"] = Field(
+        None, description="Human-readable label for the climate impact."
+    )
+    auswirkung_thg: Optional[int] = Field(
+        None, description="Estimated greenhouse gas impact, ranging from -3 to 3."
+    )
+    auswirkung_klimaanpassung: Optional[int] = Field(
+        None, description="Level of impact on climate adaptation, ranging from -3 to 3."
+    )
+    veroeffentlicht: bool = Field(
+        ..., description="Indicates if the submission is published."
+    )
+    erstellt_am: datetime = Field(..., description="Timestamp of submission creation.")
+    gemeinde_id: int = Field(
+        ..., description="Foreign key to the associated municipality."
+    )
+    autor: Optional[UserSummaryRead] = Field(
+        None, description="User who created the submission."
+    )
+
+
 class KlimacheckEingabeFilter(BaseModel):
     """
     Schema for filtering KlimacheckEingabe records based on criteria.
@@ -1,9 +1,11 @@
 from typing import List, Optional
 
 from datetime import datetime, date
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, ConfigDict, computed_field, field_serializer
 from fastapi_users import models
 
+from app.utils.pdf_util import get_display_impact
+
 
 class MobilitaetscheckEingabeBase(BaseModel):
     """
@@ -93,6 +95,73 @@ class MobilitaetscheckEingabeRead(MobilitaetscheckEingabeBaseRead):
     )
 
 
+class MobilitaetscheckEingabeSummaryRead(BaseModel):
+    """
+    Lightweight read schema for overview lists, without the objective tree.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="Unique identifier for the submission.")
+    name: Optional[str] = Field(None, description="Name of the mobility submission.")
+    magistratsvorlage_id: Optional[int] = Field(
+        None, description="ID of the associated magistrate submission."
+    )
+    magistratsvorlage: Optional["MagistratsvorlageBaseRead"] = Field(
+        None, description="Associated magistrate submission details."
+    )
+    veroeffentlicht: bool = Field(
+        ..., description="Indicates if the submission is published."
+    )
+    erstellt_am: datetime = Field(
+        ..., description="Timestamp of when the submission was created."
+    )
+    gemeinde_id: int = Field(
+        ..., description="ID of the municipality associated with the submission."
+    )
+    erstellt_von: Optional[models.ID] = Field(
+        None, description="User ID of the creator of the mobility submission."
+    )
+    autor: Optional["UserSummaryRead"] = Field(
+        None, description="User who created the submission."
+    )
+
+
+class MobilitaetscheckEingabeZielampelRead(BaseModel):
+    """
+    Read schema for the aggregated impact of a main objective of a mobility submission.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    ziel_ober_id: int = Field(..., description="ID of the main objective.")
+    nr: int = Field(..., description="Number of the main objective.")
+    tangiert: bool = Field(
+        ..., description="Indicates if the main objective is affected."
+    )
+    auswirkung: Optional[float] = Field(
+        None,
+        description="Mean impact of the affected sub-objectives, ranging from -3 to 3.",
+    )
+
+    @computed_field
+    @property
+    def bewertung(self) -> str:
+        return get_display_impact(self.auswirkung, self.tangiert)["label"]
+
+
+class MobilitaetscheckEingabeGesamtwirkungRead(BaseModel):
+    """
+    Read schema for the Zielampel of a mobility submission, one entry per main objective.
+    """
+
+    eingabe_id: int = Field(..., description="ID of the mobility submission.")
+    ziele: List[MobilitaetscheckEingabeZielampelRead] = Field(
+        default_factory=list,
+        description="Impact per main objective, ordered by number.",
+    )
+
+
 class MobilitaetscheckEingabeFilter(BaseModel):
     """
     Schema for filtering mobility submissions based on various criteria.
@@ -114,4 +183,4 @@ from app.schemas.magistratsvorlage import MagistratsvorlageBaseRead
 from app.schemas.mobilitaetscheck_eingabe_ziel_ober import (
     MobilitaetscheckEingabeZielOberRead,
 )
-from app.schemas.user import UserRead
+from app.schemas.user import UserRead, UserSummaryRead
@@ -54,6 +54,16 @@ class MobilitaetscheckEingabeZielUnterUpdate(BaseModel):
     )
 
 
+class MobilitaetscheckEingabeZielUnterBulkUpdate(
+    MobilitaetscheckEingabeZielUnterUpdate
+):
+    """
+    Schema for updating one of several mobility sub-results at once, identified by its ID.
+    """
+
+    id: int = Field(..., description="ID of the mobility sub-result to update.")
+
+
 class MobilitaetscheckEingabeZielUnterRead(MobilitaetscheckEingabeZielUnterBase):
     """
     Detailed read schema for a mobility sub-result, including sub-objective and indicator details.
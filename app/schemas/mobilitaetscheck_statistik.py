@@ -0,0 +1,82 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class AuswirkungStatistik(BaseModel):
+    """
+    Base schema for the aggregated assessments of an objective.
+    """
+
+    anzahl: int = Field(..., description="Number of assessments of the objective.")
+    anzahl_tangiert: int = Field(
+        ..., description="Number of assessments in which the objective is affected."
+    )
+    anteil_tangiert: Optional[float] = Field(
+        None, description="Share of the assessments in which the objective is affected."
+    )
+    auswirkung: Dict[int, int] = Field(
+        ...,
+        description="Number of affected assessments per impact score, from -3 to 3.",
+    )
+    auswirkung_mittel: Optional[float] = Field(
+        None, description="Mean impact score of the affected assessments."
+    )
+    auswirkung_raeumlich: Dict[int, int] = Field(
+        ...,
+        description="Number of affected assessments per ID of the spatial impact type.",
+    )
+
+
+class MobilitaetscheckZielUnterStatistik(AuswirkungStatistik):
+    """
+    Aggregated assessments of a sub-objective.
+    """
+
+    ziel_unter_id: int = Field(..., description="ID of the sub-objective.")
+    nr: int = Field(..., description="Number of the sub-objective.")
+    name: str = Field(..., description="Name of the sub-objective.")
+
+
+class MobilitaetscheckZielOberStatistik(AuswirkungStatistik):
+    """
+    Aggregated assessments of a main objective. The impacts are those of its
+    sub-objectives in assessments where the main objective is affected.
+    """
+
+    ziel_ober_id: int = Field(..., description="ID of the main objective.")
+    nr: int = Field(..., description="Number of the main objective.")
+    name: str = Field(..., description="Name of the main objective.")
+    ziele_unter: List[MobilitaetscheckZielUnterStatistik] = Field(
+        default_factory=list, description="Statistics of the sub-objectives."
+    )
+
+
+class MobilitaetscheckMonatStatistik(BaseModel):
+    """
+    Aggregated assessments of the mobility submissions created in a month.
+    """
+
+    monat: str = Field(..., description="Month of creation, as YYYY-MM.")
+    anzahl_eingaben: int = Field(..., description="Number of submissions created.")
+    anteil_tangiert: Optional[float] = Field(
+        None, description="Share of the assessed sub-objectives which are affected."
+    )
+    auswirkung_mittel: Optional[float] = Field(
+        None, description="Mean impact score of the affected sub-objectives."
+    )
+
+
+class MobilitaetscheckStatistikRead(BaseModel):
+    """
+    Read schema for the statistics of all mobility submissions of a municipality.
+    """
+
+    gemeinde_id: int = Field(..., description="ID of the municipality.")
+    anzahl_eingaben: int = Field(..., description="Number of submissions.")
+    ziele_ober: List[MobilitaetscheckZielOberStatistik] = Field(
+        default_factory=list, description="Statistics per main objective."
+    )
+    verlauf: List[MobilitaetscheckMonatStatistik] = Field(
+        default_factory=list, description="Statistics per month, oldest first."
+    )
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class PaginationParams(BaseModel):
+    """
+    Query parameters for keyset pagination of list endpoints.
+
+    Without a `limit` the full list is returned. When the page is full, the cursor
+    for the following page is sent in the `X-Next-Cursor` response header.
+    """
+
+    limit: Optional[int] = Field(
+        None, ge=1, le=500, description="Maximum number of records per page."
+    )
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor from the `X-Next-Cursor` header of the previous page.",
+    )
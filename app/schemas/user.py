@@ -2,7 +2,7 @@ from typing import Optional
 
 from datetime import datetime
 from fastapi_users import schemas
-from pydantic import Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 
 
@@ -26,6 +26,18 @@ class UserRead(schemas.BaseUser[UUID]):
     )
 
 
+class UserSummaryRead(BaseModel):
+    """
+    Minimal schema for referencing a user in overview lists.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(..., description="Unique identifier of the user.")
+    vorname: str = Field(..., description="User's first name.")
+    nachname: str = Field(..., description="User's last name.")
+
+
 class UserCreate(schemas.BaseUserCreate):
     """
     Schema for creating a new user, requiring essential details.
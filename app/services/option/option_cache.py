@@ -0,0 +1,124 @@
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Type
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from app.core.changes import on_commit
+from app.core.config import settings
+from app.models.gemeinde import Gemeinde
+from app.models.klimacheck_auswirkung_dauer import KlimacheckAuswirkungDauer
+from app.models.klimacheck_klimarelevanz import KlimacheckKlimarelevanz
+from app.models.mobilitaetscheck_auswirkung_raeumlich import (
+    MobilitaetscheckAuswirkungRaeumlich,
+)
+from app.models.user_rolle import UserRolle
+from app.utils.etag_util import etag_matches, not_modified
+
+
+class OptionSnapshot:
+    """
+    The serialized response of an option endpoint, identified by the hash of
+    its content, so every app worker derives the same ETag.
+    """
+
+    def __init__(self, content: bytes, version: int, expires_at: float):
+        self.content = content
+        self.version = version
+        self.expires_at = expires_at
+        self.etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+class OptionCache:
+    """
+    In-process cache of the reference data behind the /option endpoints.
+
+    Snapshots are kept until the TTL has passed or a commit of any app worker
+    writes to one of the reference tables, which starts a new version. Writes
+    outside the app are picked up after the TTL, or at once by clearing the
+    cache through the admin endpoint.
+    """
+
+    def __init__(self, ttl_seconds: int, max_age_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self._snapshots: Dict[str, OptionSnapshot] = {}
+        self._version = 0
+
+    async def get(
+        self, key: str, load: Callable[[], Awaitable[bytes]]
+    ) -> OptionSnapshot:
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.expires_at > time.monotonic():
+            return snapshot
+
+        version = self._version
+        snapshot = OptionSnapshot(
+            await load(), version, time.monotonic() + self.ttl_seconds
+        )
+        # A write during the load may not be included, so it is not kept
+        if self.ttl_seconds > 0 and version == self._version:
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        self._version += 1
+        self._snapshots.clear()
+
+    async def response(
+        self,
+        request: Request,
+        key: str,
+        schema: Type[Any],
+        load: Callable[[], Awaitable[List[Any]]],
+        public: bool = False,
+    ) -> Response:
+        """
+        Answers an option endpoint from its snapshot, with `304 Not Modified`
+        if the client's copy is still current.
+
+        :param schema: Read schema of the options, which `load` returns as
+            model instances.
+        :param public: Whether shared caches may store the response, for
+            endpoints without authentication.
+        """
+        adapter = TypeAdapter(List[schema])
+
+        async def serialize() -> bytes:
+            return adapter.dump_json(adapter.validate_python(await load()))
+
+        snapshot = await self.get(key, serialize)
+        headers = {
+            "ETag": snapshot.etag,
+            "Cache-Control": (
+                f"{'public' if public else 'private'}, "
+                f"max-age={self.max_age_seconds}"
+            ),
+        }
+        if etag_matches(request, snapshot.etag):
+            return not_modified(snapshot.etag, headers)
+        return Response(
+            snapshot.content, media_type="application/json", headers=headers
+        )
+
+
+option_cache = OptionCache(
+    ttl_seconds=settings.OPTION_CACHE_TTL_SECONDS,
+    max_age_seconds=settings.OPTION_CACHE_MAX_AGE_SECONDS,
+)
+
+
+on_commit(
+    [
+        model.__tablename__
+        for model in (
+            Gemeinde,
+            UserRolle,
+            KlimacheckKlimarelevanz,
+            KlimacheckAuswirkungDauer,
+            MobilitaetscheckAuswirkungRaeumlich,
+        )
+    ],
+    option_cache.clear,
+)
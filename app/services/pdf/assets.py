@@ -0,0 +1,156 @@
+import copy
+from io import BytesIO
+from os import path
+from typing import Any, Dict, Optional, Tuple
+
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.fonts import TTFFont
+from fpdf.image_datastructures import ImageCache
+from fpdf.image_parsing import preload_image
+
+try:
+    from fpdf.fonts import SubsetMap, get_color_font_object
+except ImportError:  # pragma: no cover - fpdf2 versions without them
+    SubsetMap = get_color_font_object = None
+
+ASSETS_DIR = path.join(path.dirname(path.abspath(__file__)), "assests")
+
+FONT_FAMILY = "free-sans"
+# Style as normalized by fpdf2 -> font file
+FONT_FILES = {
+    "": path.join(ASSETS_DIR, "FreeSans", "FreeSans.ttf"),
+    "B": path.join(ASSETS_DIR, "FreeSans", "FreeSansBold.ttf"),
+    "I": path.join(ASSETS_DIR, "FreeSans", "FreeSansOblique.ttf"),
+    "BI": path.join(ASSETS_DIR, "FreeSans", "FreeSansBoldOblique.ttf"),
+}
+
+LOGO_IMAGE = path.join(ASSETS_DIR, "pimoo_3logos.png")
+LEGEND_IMAGE = path.join(ASSETS_DIR, "legende.png")
+
+# Per-document state of a parsed font, as set by `add_font` in fpdf2 2.8.5+.
+# Without one of them, fonts are added to every document by `add_font`.
+FONT_DOCUMENT_ATTRIBUTES = (
+    "i",
+    "ttfont",
+    "desc",
+    "subset",
+    "missing_glyphs",
+    "biggest_size_pt",
+    "_hbfont",
+    "palette_index",
+    "color_font",
+)
+# Per-document state of a decoded image, without one of them images are read
+# by `pdf.image` itself
+IMAGE_DOCUMENT_KEYS = ("i", "usages", "iccp_i")
+
+
+class PDFAssets:
+    """
+    Fonts and images of the PDF exports, read and parsed once per process.
+
+    fpdf2 subsets the embedded fonts of a document in place when it is written,
+    so parsed fonts cannot be shared between documents as is. Instead, every
+    document gets a copy of the parsed font with its own font handle, opened on
+    the font file kept in memory. Images are decoded once and seeded into the
+    image cache of each document.
+
+    The copies set the per-document state fpdf2 keeps on fonts and images. If
+    the installed fpdf2 does not keep it where expected, the assets are not
+    shared and every document parses them itself, as without `PDFAssets`.
+    """
+
+    def __init__(self):
+        self._fonts: Dict[str, Tuple[TTFFont, bytes]] = {}
+        self._images: Dict[str, Tuple[Dict[str, Any], Optional[bytes]]] = {}
+        self.shared_fonts = False
+        self.shared_images = False
+        self.loaded = False
+
+    def load(self) -> None:
+        if self.loaded:
+            return
+
+        scratch = FPDF()
+        for style, fname in FONT_FILES.items():
+            with open(fname, "rb") as file:
+                data = file.read()
+            scratch.add_font(FONT_FAMILY, style=style, fname=fname)
+            font = scratch.fonts[f"{FONT_FAMILY}{style}"]
+            # Only the parse results are kept, each document opens its own handle
+            font.close()
+            self._fonts[style] = (font, data)
+        self.shared_fonts = SubsetMap is not None and all(
+            hasattr(font, attribute)
+            for font, _ in self._fonts.values()
+            for attribute in FONT_DOCUMENT_ATTRIBUTES
+        )
+
+        for name in (LOGO_IMAGE, LEGEND_IMAGE):
+            image_cache = ImageCache()
+            _, _, info = preload_image(image_cache, name)
+            icc_profiles = {i: iccp for iccp, i in image_cache.icc_profiles.items()}
+            self._images[name] = (info, icc_profiles.get(info.get("iccp_i")))
+        self.shared_images = all(
+            key in info
+            for info, _ in self._images.values()
+            for key in IMAGE_DOCUMENT_KEYS
+        )
+
+        self.loaded = True
+
+    def add_fonts(self, pdf: FPDF) -> None:
+        """
+        Registers the font family in all styles with `pdf`, as `add_font` would.
+        """
+        self.load()
+        if not self.shared_fonts:
+            for style, fname in FONT_FILES.items():
+                pdf.add_font(FONT_FAMILY, style=style, fname=fname)
+            return
+
+        for style, (template, data) in self._fonts.items():
+            font = copy.copy(template)
+            font.i = len(pdf.fonts) + 1
+            font.ttfont = ttLib.TTFont(BytesIO(data), recalcTimestamp=False, lazy=True)
+            # Written to when the document is output
+            font.desc = copy.copy(template.desc)
+            font.subset = SubsetMap(font)
+            font.missing_glyphs = []
+            font.biggest_size_pt = 0
+            font._hbfont = None
+            font.color_font = (
+                get_color_font_object(pdf, font, font.palette_index)
+                if pdf.render_color_fonts
+                else None
+            )
+            pdf.fonts[f"{FONT_FAMILY}{style}"] = font
+
+    def add_image(self, pdf: FPDF, name: str) -> str:
+        """
+        Seeds the image cache of `pdf` with the decoded image `name`.
+
+        Returns the name to pass to `pdf.image`, which then finds the image in
+        its cache instead of reading and decoding the file again.
+        """
+        self.load()
+        if self.shared_images and name not in pdf.image_cache.images:
+            template, iccp = self._images[name]
+            info = copy.copy(template)
+            info["i"] = len(pdf.image_cache.images) + 1
+            # Counted up by `pdf.image`, unused images are not embedded
+            info["usages"] = 0
+            if iccp is not None:
+                icc_profiles = pdf.image_cache.icc_profiles
+                info["iccp_i"] = icc_profiles.setdefault(iccp, len(icc_profiles))
+            pdf.image_cache.images[name] = info
+        return name
+
+
+pdf_assets = PDFAssets()
+
+
+def load_pdf_assets() -> None:
+    """Initializer of the PDF render workers."""
+    pdf_assets.load()
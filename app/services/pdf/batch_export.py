@@ -0,0 +1,133 @@
+import asyncio
+import zipfile
+from collections import deque
+from typing import AsyncGenerator, Deque, Iterable, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.exceptions import NotFoundError
+from app.crud.klimacheck_eingabe import crud_klimacheck_eingabe
+from app.crud.mobilitaetscheck_eingabe import crud_mobility_submission
+from app.services.pdf.pdf_cache import PDFExport
+
+
+async def archive_exports(
+    db: AsyncSession, magistratsvorlage_ids: List[int]
+) -> List[Tuple[str, PDFExport]]:
+    """
+    Prepares the exports of all checks of the given Magistratsvorlagen, named
+    by their path in the archive. With several Magistratsvorlagen, each gets
+    its own folder.
+
+    :raises NotFoundError: If the Magistratsvorlagen have no checks.
+    """
+    files = []
+    for prefix, crud_eingabe in (
+        ("mobilitaetscheck", crud_mobility_submission),
+        ("klimacheck", crud_klimacheck_eingabe),
+    ):
+        exports = await crud_eingabe.export_by_magistratsvorlagen(
+            db, magistratsvorlage_ids
+        )
+        for export in exports:
+            name = f"{prefix}_{export.data['id']}.pdf"
+            if len(magistratsvorlage_ids) > 1:
+                name = f"magistratsvorlage_{export.data['magistratsvorlage_id']}/{name}"
+            files.append((name, export))
+
+    if not files:
+        raise NotFoundError("Eingabe")
+
+    return files
+
+
+async def render_in_order(
+    exports: Iterable[Tuple[str, PDFExport]], concurrency: int
+) -> AsyncGenerator[Tuple[str, bytes], None]:
+    """
+    Renders named exports with up to `concurrency` renders in flight, yielding
+    the rendered PDFs in the order of `exports`.
+    """
+    remaining = iter(exports)
+    in_flight: Deque[Tuple[str, asyncio.Future]] = deque()
+
+    def schedule() -> None:
+        for name, export in remaining:
+            in_flight.append((name, asyncio.ensure_future(export.render())))
+            return
+
+    try:
+        for _ in range(max(concurrency, 1)):
+            schedule()
+        while in_flight:
+            name, render = in_flight.popleft()
+            content = await render
+            schedule()
+            yield name, content
+    finally:
+        # Renders keep running for the cache, only the waiting is given up
+        for _, render in in_flight:
+            render.cancel()
+
+
+class _ZipSink:
+    """
+    Write-only, unseekable file object collecting what `zipfile` writes, so the
+    archive can be sent on while it is written.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def zip_stream(
+    files: AsyncGenerator[Tuple[str, bytes], None],
+) -> AsyncGenerator[bytes, None]:
+    """
+    Streams a ZIP archive of `files`, one chunk per file and one for the
+    central directory. Only the file currently written is held in memory.
+    """
+    sink = _ZipSink()
+    try:
+        # PDFs are compressed already, deflating them again only costs time
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+            async for name, content in files:
+                archive.writestr(name, content)
+                yield sink.drain()
+        yield sink.drain()
+    finally:
+        await files.aclose()
+
+
+async def started(stream: AsyncGenerator[bytes, None]) -> AsyncGenerator[bytes, None]:
+    """
+    Runs `stream` up to its first chunk, so errors such as a full render queue
+    are raised before a streaming response has sent its status code.
+    """
+    try:
+        first = await stream.__anext__()
+    except BaseException:
+        await stream.aclose()
+        raise
+
+    async def resumed() -> AsyncGenerator[bytes, None]:
+        try:
+            yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    return resumed()
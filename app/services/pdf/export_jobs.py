@@ -0,0 +1,181 @@
+import asyncio
+import os
+import zipfile
+from contextlib import aclosing
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.db import async_session_maker
+from app.crud.exceptions import PDFRenderUnavailableError
+from app.crud.export_job import crud_export_job
+from app.services.pdf.batch_export import archive_exports, render_in_order
+from app.services.pdf.render_service import pdf_render_service
+from app.utils.enum_util import ExportJobStatusEnum
+
+# A running job records progress after every PDF, each of which is bounded by
+# the render timeout. Without progress for much longer, its worker is gone.
+STALE_AFTER = timedelta(seconds=max(60, 10 * settings.PDF_RENDER_TIMEOUT_SECONDS))
+PURGE_INTERVAL = timedelta(minutes=10)
+
+
+class ExportJobWorker:
+    """
+    Runs export jobs in the background of the app process.
+
+    Jobs are persisted in `export_job`, so a job submitted to one app worker may
+    be run by another, and a job interrupted by a restart is picked up again.
+    The archives are written to a local directory and removed together with
+    their job once the retention period has passed.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        concurrency: int,
+        directory: str,
+        retention: timedelta,
+        poll_seconds: float,
+    ):
+        self.session_maker = session_maker
+        self.concurrency = concurrency
+        self.directory = directory
+        self.retention = retention
+        self.poll_seconds = poll_seconds
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._purged_at: Optional[datetime] = None
+
+    def start(self) -> None:
+        if not self._tasks:
+            os.makedirs(self.directory, exist_ok=True)
+            self._tasks = [
+                asyncio.create_task(self._run()) for _ in range(self.concurrency)
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wakes the worker up after a job was submitted."""
+        self._wakeup.set()
+
+    def path(self, id: int) -> str:
+        return os.path.join(self.directory, f"export_{id}.zip")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self.session_maker() as db:
+                    id = await crud_export_job.claim_next(
+                        db, datetime.now() - STALE_AFTER
+                    )
+                if id is not None:
+                    await self._process(id)
+                    continue
+                await self._purge()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The database may be unavailable, retry after the poll interval
+                print(e)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _process(self, id: int) -> None:
+        path = self.path(id)
+        partial = f"{path}.part"
+
+        async with self.session_maker() as db:
+            try:
+                job = await crud_export_job.get(db, id)
+                files = await archive_exports(db, job.magistratsvorlage_ids)
+                await crud_export_job.update_state(db, id, anzahl_gesamt=len(files))
+
+                with zipfile.ZipFile(
+                    partial, "w", compression=zipfile.ZIP_STORED
+                ) as archive:
+                    renders = render_in_order(files, pdf_render_service.workers)
+                    async with aclosing(renders):
+                        done = 0
+                        async for name, content in renders:
+                            await asyncio.to_thread(archive.writestr, name, content)
+                            done += 1
+                            await crud_export_job.update_state(
+                                db, id, anzahl_fertig=done
+                            )
+
+                os.replace(partial, path)
+                await crud_export_job.update_state(
+                    db,
+                    id,
+                    status=ExportJobStatusEnum.fertig,
+                    datei=path,
+                    abgeschlossen_am=datetime.now(),
+                )
+            except asyncio.CancelledError:
+                # Shutting down, the job is handed back to the queue
+                _remove(partial)
+                await db.rollback()
+                await crud_export_job.update_state(
+                    db, id, status=ExportJobStatusEnum.wartend
+                )
+                raise
+            except PDFRenderUnavailableError:
+                # Interactive exports fill the render queue, the job waits
+                _remove(partial)
+                await db.rollback()
+                await crud_export_job.update_state(
+                    db, id, status=ExportJobStatusEnum.wartend
+                )
+                await asyncio.sleep(self.poll_seconds)
+            except Exception as e:
+                _remove(partial)
+                await db.rollback()
+                await crud_export_job.update_state(
+                    db,
+                    id,
+                    status=ExportJobStatusEnum.fehlgeschlagen,
+                    fehler=getattr(e, "message", None) or str(e),
+                    abgeschlossen_am=datetime.now(),
+                )
+
+    async def _purge(self) -> None:
+        """Deletes jobs and their files after the retention period."""
+        now = datetime.now()
+        if self._purged_at is not None and now - self._purged_at < PURGE_INTERVAL:
+            return
+        self._purged_at = now
+
+        async with self.session_maker() as db:
+            jobs = await crud_export_job.get_expired(db, now - self.retention)
+            if not jobs:
+                return
+            for job in jobs:
+                _remove(self.path(job.id))
+            await crud_export_job.delete_by_ids(db, [job.id for job in jobs])
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+export_job_worker = ExportJobWorker(
+    session_maker=async_session_maker,
+    concurrency=settings.EXPORT_JOB_CONCURRENCY,
+    directory=settings.EXPORT_JOB_DIR,
+    retention=timedelta(hours=settings.EXPORT_JOB_RETENTION_HOURS),
+    poll_seconds=settings.EXPORT_JOB_POLL_SECONDS,
+)
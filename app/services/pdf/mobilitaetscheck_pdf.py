@@ -1,7 +1,7 @@
 from io import BytesIO
-from os import path
 
 from app.models.mobilitaetscheck_eingabe import MobilitaetscheckEingabe
+from app.services.pdf.assets import LEGEND_IMAGE, pdf_assets
 from app.services.pdf.base_pdf import BasePDF
 from app.utils.pdf_util import calculate_average_impact, get_display_impact
 
@@ -92,13 +92,7 @@ class MobilitaetscheckPDF(BasePDF):
             new_y="NEXT",
         )
 
-        script_dir = path.dirname(path.abspath(__file__))
-        image_path = path.join(
-            script_dir, "./assests/legende.png"
-        )  # Navigate to assets
-        # Normalize the path for compatibility
-        image_path = path.normpath(image_path)
-        self.image(image_path, box_x + 115, box_y + 3, 70)
+        self.image(pdf_assets.add_image(self, LEGEND_IMAGE), box_x + 115, box_y + 3, 70)
         self.set_font("free-sans", "", 10)
 
         for oberziel in eingabe.eingabe_ziel_ober:
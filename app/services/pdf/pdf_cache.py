@@ -0,0 +1,147 @@
+import asyncio
+import datetime
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, Type
+
+from app.core.config import settings
+from app.services.pdf.base_pdf import BasePDF
+from app.services.pdf.render_service import pdf_render_service
+
+# (table name, id) of the record a cached PDF was rendered from
+Owner = Tuple[str, Any]
+
+
+def pdf_etag(
+    PDF: Type[BasePDF], data: Dict[str, Any], render_date: datetime.date
+) -> str:
+    """
+    Hashes everything a rendered PDF depends on into a strong ETag.
+    """
+    payload = json.dumps(
+        [f"{PDF.__module__}.{PDF.__qualname__}", render_date.isoformat(), data],
+        sort_keys=True,
+        default=str,
+    )
+    return f'"{hashlib.sha256(payload.encode()).hexdigest()}"'
+
+
+class PDFCache:
+    """
+    In-memory LRU cache of rendered PDFs, keyed by the ETag of their input.
+
+    As the key is derived from the rendered data, a changed record never hits
+    a stale entry; invalidation only frees the memory early. Concurrent
+    requests for the same document share a single render.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._owners: Dict[str, Owner] = {}
+        self._etags: Dict[Owner, Set[str]] = {}
+        self._renders: Dict[str, asyncio.Task] = {}
+
+    def get(self, etag: str) -> Optional[bytes]:
+        content = self._entries.get(etag)
+        if content is not None:
+            self._entries.move_to_end(etag)
+        return content
+
+    def set(self, owner: Owner, etag: str, content: bytes) -> None:
+        if len(content) > self.max_bytes:
+            return
+
+        self._remove(etag)
+        self._entries[etag] = content
+        self._size += len(content)
+        self._owners[etag] = owner
+        self._etags.setdefault(owner, set()).add(etag)
+
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    async def get_or_render(
+        self, owner: Owner, etag: str, render: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Returns the cached PDF for `etag`, rendering and caching it if needed.
+        """
+        content = self.get(etag)
+        if content is not None:
+            return content
+
+        task = self._renders.get(etag)
+        if task is None:
+            task = asyncio.ensure_future(render())
+            self._renders[etag] = task
+            task.add_done_callback(lambda _: self._rendered(owner, etag, task))
+        # A request which goes away does not cancel the render for the others
+        return await asyncio.shield(task)
+
+    def invalidate(self, table: str, id: Any) -> None:
+        """
+        Drops all cached PDFs of a record, e.g. after it was updated.
+        """
+        for etag in self._etags.pop((table, id), set()):
+            content = self._entries.pop(etag, None)
+            if content is not None:
+                self._size -= len(content)
+            self._owners.pop(etag, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+        self._owners.clear()
+        self._etags.clear()
+
+    def _rendered(self, owner: Owner, etag: str, task: asyncio.Task) -> None:
+        self._renders.pop(etag, None)
+        # Retrieving the exception also keeps asyncio from logging it
+        if not task.cancelled() and task.exception() is None:
+            self.set(owner, etag, task.result())
+
+    def _remove(self, etag: str) -> None:
+        content = self._entries.pop(etag, None)
+        if content is not None:
+            self._size -= len(content)
+        owner = self._owners.pop(etag, None)
+        etags = self._etags.get(owner)
+        if etags is not None:
+            etags.discard(etag)
+            if not etags:
+                del self._etags[owner]
+
+
+pdf_cache = PDFCache(max_bytes=settings.PDF_CACHE_MAX_SIZE_MB * 1024 * 1024)
+
+
+class PDFExport:
+    """
+    A PDF export ready to be rendered, identified by the ETag of its input.
+
+    The ETag is known before rendering, so a request whose copy is still
+    current can be answered without rendering at all.
+    """
+
+    def __init__(
+        self,
+        owner: Owner,
+        PDF: Type[BasePDF],
+        data: Dict[str, Any],
+        render_date: Optional[datetime.date] = None,
+    ):
+        self.owner = owner
+        self.PDF = PDF
+        self.data = data
+        self.render_date = render_date or datetime.date.today()
+        self.etag = pdf_etag(PDF, data, self.render_date)
+
+    async def render(self) -> bytes:
+        return await pdf_cache.get_or_render(
+            self.owner,
+            self.etag,
+            lambda: pdf_render_service.render(self.PDF, self.data, self.render_date),
+        )
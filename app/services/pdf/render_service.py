@@ -0,0 +1,144 @@
+import asyncio
+import datetime
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy import inspect
+
+from app.core.config import settings
+from app.crud.exceptions import PDFRenderTimeoutError, PDFRenderUnavailableError
+from app.services.pdf.assets import load_pdf_assets
+from app.services.pdf.base_pdf import BasePDF
+
+
+def snapshot(instance: Any, _path: Optional[set] = None) -> Dict[str, Any]:
+    """
+    Converts a loaded ORM instance into plain, picklable data.
+
+    Only attributes that are already loaded are included, so the loader profile
+    of the query decides how much of the tree ends up in the snapshot. No lazy
+    loads are triggered.
+    """
+    path = (_path or set()) | {id(instance)}
+    state = inspect(instance)
+    data = {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+
+    for relationship in state.mapper.relationships:
+        if relationship.key not in state.dict:
+            continue
+        value = state.dict[relationship.key]
+        if value is None:
+            data[relationship.key] = None
+        elif relationship.uselist:
+            data[relationship.key] = [
+                snapshot(item, path) for item in value if id(item) not in path
+            ]
+        elif id(value) not in path:
+            data[relationship.key] = snapshot(value, path)
+
+    return data
+
+
+def _namespace(data: Any) -> Any:
+    if isinstance(data, dict):
+        return SimpleNamespace(
+            **{key: _namespace(value) for key, value in data.items()}
+        )
+    if isinstance(data, list):
+        return [_namespace(item) for item in data]
+    return data
+
+
+def _render(
+    PDF: Type[BasePDF], data: Dict[str, Any], render_date: datetime.date
+) -> bytes:
+    """Runs in a worker process."""
+    pdf = PDF(orientation="P", unit="mm", format="A4")
+    pdf.render_date = render_date
+    return pdf.export(_namespace(data)).getvalue()
+
+
+class PDFRenderService:
+    """
+    Renders PDFs in a bounded pool of worker processes, so the CPU-bound layout
+    work of fpdf2 does not block the event loop.
+
+    At most `max_queue` renders may be running or waiting at the same time;
+    further requests are rejected instead of piling up.
+    """
+
+    def __init__(self, workers: int, max_queue: int, timeout: float):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of renders currently running or waiting for a worker."""
+        return self._pending
+
+    def start(self) -> None:
+        if self._executor is None:
+            # Forking a process with a running event loop and open connections
+            # is not safe, the workers are started fresh instead.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                # Fonts and images are parsed once per worker, not per document
+                initializer=load_pdf_assets,
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def render(
+        self,
+        PDF: Type[BasePDF],
+        data: Dict[str, Any],
+        render_date: Optional[datetime.date] = None,
+    ) -> bytes:
+        """
+        Renders `data`, a snapshot of an Eingabe, with the given PDF class.
+        The render date printed in the header defaults to today.
+
+        :raises PDFRenderUnavailableError: If the render queue is full.
+        :raises PDFRenderTimeoutError: If rendering takes longer than the timeout.
+        """
+        if self._pending >= self.max_queue:
+            raise PDFRenderUnavailableError()
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        future: Future = self._executor.submit(
+            _render, PDF, data, render_date or datetime.date.today()
+        )
+        self._pending += 1
+        # Released from the worker's completion, not from the awaiting request
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            # A render that already started keeps its worker until it is done
+            future.cancel()
+            raise PDFRenderTimeoutError(self.timeout)
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+
+pdf_render_service = PDFRenderService(
+    workers=settings.PDF_RENDER_WORKERS,
+    max_queue=settings.PDF_RENDER_MAX_QUEUE,
+    timeout=settings.PDF_RENDER_TIMEOUT_SECONDS,
+)
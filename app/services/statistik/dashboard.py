@@ -0,0 +1,109 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.changes import on_commit
+from app.core.config import settings
+from app.core.db import async_session_maker
+from app.crud.dashboard import get_kennzahlen, refresh_kennzahlen
+from app.models.klimacheck_eingabe import KlimacheckEingabe
+from app.models.mobilitaetscheck_eingabe import MobilitaetscheckEingabe
+from app.models.mobilitaetscheck_eingabe_ziel_ober import (
+    MobilitaetscheckEingabeZielOber,
+)
+from app.models.mobilitaetscheck_eingabe_ziel_unter import (
+    MobilitaetscheckEingabeZielUnter,
+)
+from app.schemas.dashboard import DashboardRead
+
+
+async def get_dashboard(db: AsyncSession, gemeinde_id: int) -> DashboardRead:
+    """
+    The dashboard of a municipality from the precomputed counts, which lag
+    behind the latest writes by the refresh delay at most.
+    """
+    rows = await get_kennzahlen(db, gemeinde_id)
+
+    checks: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    for row in rows:
+        kennzahlen = checks[row.check_typ]
+        if row.kennzahl == "gesamt":
+            kennzahlen["anzahl"] = row.anzahl
+        elif row.kennzahl == "veroeffentlicht":
+            if row.schluessel == "true":
+                kennzahlen["anzahl_veroeffentlicht"] = row.anzahl
+        else:
+            kennzahlen.setdefault(row.kennzahl, {})[row.schluessel] = row.anzahl
+
+    return DashboardRead(gemeinde_id=gemeinde_id, **checks)
+
+
+class DashboardRefresher:
+    """
+    Refreshes the dashboard counts in the background of the app process.
+
+    Commits of this process which touch the checks schedule a refresh, which
+    runs once the delay has passed, so a burst of writes costs one refresh.
+    Every app worker refreshes after its own writes.
+    """
+
+    def __init__(
+        self, session_maker: async_sessionmaker[AsyncSession], delay_seconds: float
+    ):
+        self.session_maker = session_maker
+        self.delay_seconds = delay_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._scheduled = asyncio.Event()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def schedule(self) -> None:
+        self._scheduled.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._scheduled.wait()
+            await asyncio.sleep(self.delay_seconds)
+            # Writes during the refresh schedule the next one
+            self._scheduled.clear()
+            try:
+                async with self.session_maker() as db:
+                    await refresh_kennzahlen(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The database may be unavailable, retry after the delay
+                print(e)
+                self._scheduled.set()
+
+
+dashboard_refresher = DashboardRefresher(
+    session_maker=async_session_maker,
+    delay_seconds=settings.DASHBOARD_REFRESH_DELAY_SECONDS,
+)
+
+
+on_commit(
+    [
+        model.__tablename__
+        for model in (
+            KlimacheckEingabe,
+            MobilitaetscheckEingabe,
+            MobilitaetscheckEingabeZielOber,
+            MobilitaetscheckEingabeZielUnter,
+        )
+    ],
+    dashboard_refresher.schedule,
+    # The view is shared, the worker which wrote refreshes it
+    remote=False,
+)
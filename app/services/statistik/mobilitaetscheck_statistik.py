@@ -0,0 +1,227 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.changes import on_commit
+from app.core.config import settings
+from app.core.db import async_session_maker
+from app.crud.mobilitaetscheck_statistik import (
+    count_eingabe_ziel_ober,
+    count_eingabe_ziel_unter,
+    count_eingaben,
+    get_ziel_katalog,
+)
+from app.models.mobilitaetscheck_eingabe import MobilitaetscheckEingabe
+from app.models.mobilitaetscheck_eingabe_ziel_ober import (
+    MobilitaetscheckEingabeZielOber,
+)
+from app.models.mobilitaetscheck_eingabe_ziel_unter import (
+    MobilitaetscheckEingabeZielUnter,
+)
+from app.models.mobilitaetscheck_ziel_ober import MobilitaetscheckZielOber
+from app.models.mobilitaetscheck_ziel_unter import MobilitaetscheckZielUnter
+from app.schemas.mobilitaetscheck_statistik import MobilitaetscheckStatistikRead
+
+AUSWIRKUNGEN = range(-3, 4)
+
+
+class _Zaehler:
+    """Sums up grouped assessment counts of an objective or month."""
+
+    def __init__(self):
+        self.anzahl = 0
+        self.anzahl_tangiert = 0
+        self.auswirkung: Dict[int, int] = dict.fromkeys(AUSWIRKUNGEN, 0)
+        self.auswirkung_raeumlich: Dict[int, int] = defaultdict(int)
+
+    def add(
+        self,
+        anzahl: int,
+        tangiert: bool,
+        auswirkung: Optional[int] = None,
+        auswirkung_raeumlich_id: Optional[int] = None,
+    ) -> None:
+        self.anzahl += anzahl
+        if not tangiert:
+            return
+        self.anzahl_tangiert += anzahl
+        if auswirkung is not None:
+            self.auswirkung[auswirkung] = self.auswirkung.get(auswirkung, 0) + anzahl
+        if auswirkung_raeumlich_id is not None:
+            self.auswirkung_raeumlich[auswirkung_raeumlich_id] += anzahl
+
+    @property
+    def anteil_tangiert(self) -> Optional[float]:
+        return self.anzahl_tangiert / self.anzahl if self.anzahl else None
+
+    @property
+    def auswirkung_mittel(self) -> Optional[float]:
+        anzahl = sum(self.auswirkung.values())
+        if not anzahl:
+            return None
+        return sum(wert * n for wert, n in self.auswirkung.items()) / anzahl
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "anzahl": self.anzahl,
+            "anzahl_tangiert": self.anzahl_tangiert,
+            "anteil_tangiert": self.anteil_tangiert,
+            "auswirkung": self.auswirkung,
+            "auswirkung_mittel": self.auswirkung_mittel,
+            "auswirkung_raeumlich": dict(self.auswirkung_raeumlich),
+        }
+
+
+async def compute_statistik(
+    db: AsyncSession, gemeinde_id: int
+) -> MobilitaetscheckStatistikRead:
+    """
+    Aggregates the assessments of all Mobilitätschecks of a municipality.
+
+    The database returns grouped counts only, whose size is bounded by the
+    objective catalogue, so the effort here does not grow with the number of
+    Eingaben.
+    """
+    katalog = await get_ziel_katalog(db, gemeinde_id)
+    eingaben = await count_eingaben(db, gemeinde_id)
+    ziel_ober_rows = await count_eingabe_ziel_ober(db, gemeinde_id)
+    ziel_unter_rows = await count_eingabe_ziel_unter(db, gemeinde_id)
+
+    ziel_ober: Dict[int, _Zaehler] = defaultdict(_Zaehler)
+    ziel_unter: Dict[int, _Zaehler] = defaultdict(_Zaehler)
+    monate: Dict[Tuple[int, int], _Zaehler] = defaultdict(_Zaehler)
+    ziel_ober_von: Dict[int, int] = {
+        row.ziel_unter_id: row.ziel_ober_id
+        for row in katalog
+        if row.ziel_unter_id is not None
+    }
+
+    for row in ziel_ober_rows:
+        ziel_ober[row.ziel_ober_id].anzahl += row.anzahl
+        if row.tangiert:
+            ziel_ober[row.ziel_ober_id].anzahl_tangiert += row.anzahl
+
+    for row in ziel_unter_rows:
+        values = (row.auswirkung, row.auswirkung_raeumlich_id)
+        ziel_unter[row.ziel_unter_id].add(row.anzahl, row.tangiert, *values)
+        monate[(int(row.jahr), int(row.monat))].add(row.anzahl, row.tangiert, *values)
+        ziel_ober_id = ziel_ober_von.get(row.ziel_unter_id)
+        if ziel_ober_id is not None and row.ziel_ober_tangiert and row.tangiert:
+            # Only the impacts, the counts are those of the main objective
+            oberziel = ziel_ober[ziel_ober_id]
+            if row.auswirkung is not None:
+                oberziel.auswirkung[row.auswirkung] += row.anzahl
+            if row.auswirkung_raeumlich_id is not None:
+                oberziel.auswirkung_raeumlich[row.auswirkung_raeumlich_id] += row.anzahl
+
+    ziele_ober: Dict[int, Dict[str, Any]] = {}
+    for row in katalog:
+        if row.ziel_ober_id not in ziele_ober:
+            ziele_ober[row.ziel_ober_id] = {
+                "ziel_ober_id": row.ziel_ober_id,
+                "nr": row.ziel_ober_nr,
+                "name": row.ziel_ober_name,
+                **ziel_ober[row.ziel_ober_id].dump(),
+                "ziele_unter": [],
+            }
+        if row.ziel_unter_id is not None:
+            ziele_ober[row.ziel_ober_id]["ziele_unter"].append(
+                {
+                    "ziel_unter_id": row.ziel_unter_id,
+                    "nr": row.ziel_unter_nr,
+                    "name": row.ziel_unter_name,
+                    **ziel_unter[row.ziel_unter_id].dump(),
+                }
+            )
+
+    anzahl_eingaben = {(int(row.jahr), int(row.monat)): row.anzahl for row in eingaben}
+    verlauf = [
+        {
+            "monat": f"{jahr:04d}-{monat:02d}",
+            "anzahl_eingaben": anzahl,
+            "anteil_tangiert": monate[(jahr, monat)].anteil_tangiert,
+            "auswirkung_mittel": monate[(jahr, monat)].auswirkung_mittel,
+        }
+        for (jahr, monat), anzahl in sorted(anzahl_eingaben.items())
+    ]
+
+    return MobilitaetscheckStatistikRead(
+        gemeinde_id=gemeinde_id,
+        anzahl_eingaben=sum(anzahl_eingaben.values()),
+        ziele_ober=list(ziele_ober.values()),
+        verlauf=verlauf,
+    )
+
+
+class StatistikCache:
+    """
+    In-process cache of statistics per municipality.
+
+    Any committed write to the Mobilitätscheck tables clears the cache, those
+    of other app workers through the invalidation bus.
+    Concurrent requests for the same municipality share one computation, which
+    runs in its own session so it does not depend on any of the requests.
+    """
+
+    def __init__(
+        self, session_maker: async_sessionmaker[AsyncSession], ttl_seconds: int
+    ):
+        self.session_maker = session_maker
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[int, Tuple[float, MobilitaetscheckStatistikRead]] = {}
+        self._pending: Dict[int, asyncio.Task] = {}
+        self._generation = 0
+
+    async def get(self, gemeinde_id: int) -> MobilitaetscheckStatistikRead:
+        entry = self._entries.get(gemeinde_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._pending.get(gemeinde_id)
+        if task is None:
+            task = asyncio.ensure_future(self._compute(gemeinde_id))
+            self._pending[gemeinde_id] = task
+            task.add_done_callback(lambda _: self._pending.pop(gemeinde_id, None))
+        # A request which goes away does not cancel the computation for the others
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._pending.clear()
+
+    async def _compute(self, gemeinde_id: int) -> MobilitaetscheckStatistikRead:
+        generation = self._generation
+        async with self.session_maker() as db:
+            statistik = await compute_statistik(db, gemeinde_id)
+        # A write during the computation may not be included, so it is not kept
+        if self.ttl_seconds > 0 and generation == self._generation:
+            self._entries[gemeinde_id] = (
+                time.monotonic() + self.ttl_seconds,
+                statistik,
+            )
+        return statistik
+
+
+statistik_cache = StatistikCache(
+    session_maker=async_session_maker,
+    ttl_seconds=settings.STATISTIK_CACHE_TTL_SECONDS,
+)
+
+
+on_commit(
+    [
+        model.__tablename__
+        for model in (
+            MobilitaetscheckEingabe,
+            MobilitaetscheckEingabeZielOber,
+            MobilitaetscheckEingabeZielUnter,
+            MobilitaetscheckZielOber,
+            MobilitaetscheckZielUnter,
+        )
+    ],
+    statistik_cache.clear,
+)
@@ -0,0 +1,172 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+import jwt
+from fastapi_users import BaseUserManager, exceptions
+from fastapi_users.authentication import JWTStrategy
+from fastapi_users.jwt import decode_jwt
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from uuid import UUID
+
+from app.core.changes import on_commit_rows
+from app.core.config import settings
+from app.models.gemeinde import Gemeinde
+from app.models.user import User
+from app.models.user_rolle import UserRolle
+
+# Relationships of the user which are cached alongside its columns
+CACHED_RELATIONSHIPS = {"rolle": UserRolle, "gemeinde": Gemeinde}
+
+
+def _columns(instance: Any) -> Dict[str, Any]:
+    state = inspect(instance)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+
+
+def _detached(model: Any, values: Dict[str, Any]) -> Any:
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return instance
+
+
+class UserCache:
+    """
+    In-process cache of authenticated users, keyed by user id and token.
+
+    Entries are plain column snapshots of the user, its role and municipality.
+    Every hit materializes a new detached `User`, so requests never share an
+    instance and each request may attach its copy to its own session.
+    """
+
+    def __init__(self, ttl_seconds: int, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[UUID, str], Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._tokens: Dict[UUID, Set[str]] = {}
+
+    def get(self, user_id: UUID, token: str) -> Optional[User]:
+        key = (user_id, token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+
+        user = _detached(User, snapshot["user"])
+        for attr, model in CACHED_RELATIONSHIPS.items():
+            if attr in snapshot:
+                set_committed_value(user, attr, _detached(model, snapshot[attr]))
+        return user
+
+    def set(self, user_id: UUID, token: str, user: User) -> None:
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+
+        state = inspect(user)
+        snapshot = {"user": _columns(user)}
+        for attr in CACHED_RELATIONSHIPS:
+            related = state.dict.get(attr)
+            if related is not None:
+                snapshot[attr] = _columns(related)
+
+        key = (user_id, token)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, snapshot)
+        self._entries.move_to_end(key)
+        self._tokens.setdefault(user_id, set()).add(token)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, user_id: UUID) -> None:
+        """
+        Drops all cached entries of a user, e.g. after the user was updated.
+        """
+        for token in self._tokens.pop(user_id, set()):
+            self._entries.pop((user_id, token), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tokens.clear()
+
+    def _remove(self, key: Tuple[UUID, str]) -> None:
+        self._entries.pop(key, None)
+        user_id, token = key
+        tokens = self._tokens.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens[user_id]
+
+
+user_cache = UserCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_size=settings.USER_CACHE_MAX_SIZE,
+)
+
+
+def _evict(table: str, ids: Optional[Set[Any]]) -> None:
+    if table == User.__tablename__ and ids is not None:
+        for id in ids:
+            user_cache.invalidate(UUID(str(id)))
+    else:
+        # Roles and municipalities are part of every entry
+        user_cache.clear()
+
+
+on_commit_rows(
+    [
+        User.__tablename__,
+        *(model.__tablename__ for model in CACHED_RELATIONSHIPS.values()),
+    ],
+    _evict,
+)
+
+
+class CachedJWTStrategy(JWTStrategy[User, UUID]):
+    """
+    JWT strategy which resolves the user of a token from `user_cache`.
+
+    The token is still decoded and verified on every request; only the database
+    lookup of the user is skipped while a cached entry is valid.
+    """
+
+    async def read_token(
+        self, token: Optional[str], user_manager: BaseUserManager[User, UUID]
+    ) -> Optional[User]:
+        if token is None:
+            return None
+
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+            )
+            user_id = data.get("sub")
+            if user_id is None:
+                return None
+            parsed_id = user_manager.parse_id(user_id)
+        except (jwt.PyJWTError, exceptions.InvalidID):
+            return None
+
+        user = user_cache.get(parsed_id, token)
+        if user is not None:
+            return user
+
+        try:
+            user = await user_manager.get(parsed_id)
+        except exceptions.UserNotExists:
+            return None
+
+        user_cache.set(parsed_id, token, user)
+        return user
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from fastapi import Request
 from fastapi_users import BaseUserManager, UUIDIDMixin
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from app.models.user import User
 from app.core.config import settings
+from app.services.user.user_cache import user_cache
 from app.services.mail.messages import (
     send_welcome,
     send_verification,
@@ -38,3 +39,20 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, UUID]):
 
     async def on_after_verify(self, user: User, request: Optional[Request] = None):
         print(f"User {user.id} has been verified")
+        user_cache.invalidate(user.id)
+
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: Dict[str, Any],
+        request: Optional[Request] = None,
+    ):
+        user_cache.invalidate(user.id)
+
+    async def on_after_reset_password(
+        self, user: User, request: Optional[Request] = None
+    ):
+        user_cache.invalidate(user.id)
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        user_cache.invalidate(user.id)
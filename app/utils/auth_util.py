@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from app.crud.exceptions import AuthorizationError
 
 
@@ -20,6 +22,17 @@ def check_user_authorization(user: User, gemeinde_id: int):
         grant_access = True
 
     if not grant_access:
-        raise AuthorizationError(
-            detail="User is not authorized to access this resource"
-        )
+        raise AuthorizationError("access this resource")
+
+
+def authorized_gemeinde_id(user: User) -> Optional[int]:
+    """
+    The municipality a user may modify records of, for scoping a statement
+    instead of checking authorization beforehand.
+
+    :param user: The user instance to check.
+    :return: The user's municipality ID, or None for a superuser.
+    """
+    if user.is_superuser:
+        return None
+    return user.gemeinde_id
@@ -17,3 +17,15 @@ class SpatialImpactEnum(str, Enum):
     lokal = "lokal"
     quartiersweit = "quartiersweit"
     stadtweit = "stadtweit"
+
+
+class ExportJobStatusEnum(str, Enum):
+    wartend = "wartend"
+    laeuft = "laeuft"
+    fertig = "fertig"
+    fehlgeschlagen = "fehlgeschlagen"
+
+
+class TagModusEnum(str, Enum):
+    und = "und"
+    oder = "oder"
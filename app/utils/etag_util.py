@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Checks whether the `If-None-Match` header of a request matches `etag`,
+    i.e. whether the client's copy is still current.
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as for GET requests
+    return etag.removeprefix("W/") in {
+        tag.strip().removeprefix("W/") for tag in header.split(",")
+    }
+
+
+def not_modified(etag: str, headers: dict = {}) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **headers}
+    )
+
+
+def last_modified_etag(id: Any, last_modified: datetime) -> str:
+    """
+    A weak ETag of the representation of a record, as of its last change.
+    """
+    return f'W/"{id}-{round(last_modified.timestamp() * 1_000_000)}"'
+
+
+def http_date(value: datetime) -> str:
+    """Formats a time for the `Last-Modified` header."""
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """
+    Checks whether the client's copy is still current, by the `If-None-Match`
+    header of a request or, only without it, by `If-Modified-Since`.
+    """
+    if "if-none-match" in request.headers:
+        return etag_matches(request, etag)
+    header = request.headers.get("if-modified-since")
+    if header is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # The header has whole seconds only
+    return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
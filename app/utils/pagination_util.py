@@ -0,0 +1,96 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Literal, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import Response
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.sql import ColumnElement
+
+from app.crud.exceptions import InvalidCursorError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+KeysetColumn = Tuple[ColumnElement, Literal["asc", "desc"]]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(column: ColumnElement, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encodes the sort values of the last row of a page into an opaque cursor.
+    """
+    payload = json.dumps([_encode_value(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, keys: List[KeysetColumn]) -> List[Any]:
+    """
+    Decodes a cursor created by `encode_cursor` back into typed sort values.
+
+    :raises InvalidCursorError: If the cursor is malformed or does not match the sort keys.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        return [
+            _decode_value(column, value) for (column, _), value in zip(keys, values)
+        ]
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorError(cursor)
+
+
+def keyset_condition(keys: List[KeysetColumn], values: List[Any]) -> ColumnElement:
+    """
+    Builds the WHERE clause selecting all rows that come after `values` in the sort order.
+
+    Uniform sort directions use a row-value comparison, which Postgres can answer
+    with a single index range scan. Mixed directions fall back to the expanded form
+    `(a > x) OR (a = x AND b < y) ...`.
+    """
+    directions = {order for _, order in keys}
+    if len(directions) == 1:
+        columns = tuple_(*[column for column, _ in keys])
+        row = tuple_(*values)
+        return columns > row if directions.pop() == "asc" else columns < row
+
+    clauses = []
+    for index, (column, order) in enumerate(keys):
+        equal = [keys[i][0] == values[i] for i in range(index)]
+        after = column > values[index] if order == "asc" else column < values[index]
+        clauses.append(and_(*equal, after))
+    return or_(*clauses)
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """
+    Exposes the cursor of the next page as a response header, keeping list bodies unchanged.
+    """
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
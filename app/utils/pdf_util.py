@@ -12,6 +12,9 @@ def get_display_impact(value, target):
     if not target:
         return {"label": "Ziel nicht tangiert", "color": {"r": 229, "g": 229, "b": 229}}
 
+    if value is None:
+        return {"label": "keine Angabe", "color": {"r": 255, "g": 255, "b": 255}}
+
     if value < -2.5:
         return {"label": "stark negativ", "color": {"r": 255, "g": 16, "b": 16}}
     elif value <= -1.5:
@@ -27,7 +30,7 @@ def get_display_impact(value, target):
     elif value > 1.5:
         return {"label": "stark positiv", "color": {"r": 18, "g": 157, "b": 5}}
     else:
-        return {"label": "keine Angabe", "color": {"r": None, "g": None, "b": None}}
+        return {"label": "keine Angabe", "color": {"r": 255, "g": 255, "b": 255}}
 
     # if not target:
     #     return {"label": "Ziel nicht tangiert",
@@ -94,6 +97,8 @@ def calculate_average_impact(data):
                 average_impact[eingabe_ziel_ober_obj.ziel_ober_id] = total_impact / len(
                     eingabe_ziel_unter_liste
                 )
+            else:
+                average_impact[eingabe_ziel_ober_obj.ziel_ober_id] = None
         else:
             average_impact[eingabe_ziel_ober_obj.ziel_ober_id] = None
 
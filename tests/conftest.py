@@ -1,26 +1,109 @@
+import uuid
+
 from fastapi.testclient import TestClient
+import httpx
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import CheckConstraint, DefaultClause, MetaData, Text, create_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from app.main import app
 
 from app.core.config import settings
-from app.core.db import get_db
 from app.core.db import Base
-from app.oauth2 import create_access_token
+from app.core.deps import current_active_user, get_async_session
 from app import models
 
 
-SQLALCHEMY_DATABASE_URL = f"postgresql+psycopg://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_port}/{settings.database_name}_test"
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def sqlite_session_maker(tmp_path):
+    """
+    An SQLite database standing in for Postgres, with the tables of all models.
+
+    The parts of the schema only Postgres has are left out: check constraints,
+    indexes and the generated search columns, which stay empty. `now()`
+    defaults are replaced by `CURRENT_TIMESTAMP`.
+    """
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table = table.to_metadata(metadata)
+        table.constraints = {
+            constraint
+            for constraint in table.constraints
+            if not isinstance(constraint, CheckConstraint)
+        }
+        table.indexes = set()
+        for column in table.columns:
+            column.constraints = set()
+            if column.computed is not None:
+                column.type = Text()
+                column.computed = None
+                column.server_default = None
+            elif column.server_default is not None and "now()" in str(
+                column.server_default.arg
+            ):
+                column.server_default = DefaultClause(text("CURRENT_TIMESTAMP"))
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def sqlite_user():
+    """An active user of the Gemeinde with ID 1, not stored in the database."""
+    return models.User(
+        id=uuid.uuid4(),
+        email="sachbearbeitung@example.org",
+        hashed_password="-",
+        vorname="Sach",
+        nachname="Bearbeitung",
+        rolle_id=1,
+        gemeinde_id=1,
+        is_active=True,
+        is_verified=True,
+        is_superuser=False,
+    )
+
+
+@pytest.fixture
+async def sqlite_client(sqlite_session_maker, sqlite_user):
+    """A client of the app, on the SQLite database and logged in as `sqlite_user`."""
 
+    async def override_get_async_session():
+        async with sqlite_session_maker() as session:
+            yield session
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[current_active_user] = lambda: sqlite_user
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    app.dependency_overrides.clear()
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# The fixtures below are only set up by the tests using them, so the tests not
+# needing the test database can run without it.
 
 
 @pytest.fixture()
 def session():
+    SQLALCHEMY_DATABASE_URL = f"postgresql+psycopg://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_port}/{settings.database_name}_test"
+
+    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     db = TestingSessionLocal()
@@ -32,6 +115,8 @@ def session():
 
 @pytest.fixture()
 def client(session):
+    from app.core.db import get_db
+
     def override_get_db():
 
         try:
@@ -82,6 +167,8 @@ def test_user(client):
 
 @pytest.fixture
 def token(test_user):
+    from app.oauth2 import create_access_token
+
     return create_access_token({"id": test_user["id"]})
 
 
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+
+from app.crud.klimacheck_eingabe import crud_klimacheck_eingabe
+from app.crud.mobilitaetscheck_eingabe import crud_mobility_submission
+from app.models import (
+    KlimacheckEingabe,
+    Magistratsvorlage,
+    MobilitaetscheckEingabe,
+    MobilitaetscheckEingabeZielOber,
+)
+
+GEAENDERT_AM = datetime(2020, 1, 1)
+
+
+async def add_magistratsvorlage(db):
+    magistratsvorlage = Magistratsvorlage(
+        name="Umbau Große Bleiche",
+        verwaltungsvorgang_nr="MV/2024/001",
+        verwaltungsvorgang_datum=GEAENDERT_AM.date(),
+        gemeinde_id=1,
+        zuletzt_geaendert_am=GEAENDERT_AM,
+    )
+    db.add(magistratsvorlage)
+    await db.flush()
+    return magistratsvorlage
+
+
+async def add_mobilitaetscheck(db):
+    magistratsvorlage = await add_magistratsvorlage(db)
+    eingabe = MobilitaetscheckEingabe(
+        name="Radweg",
+        gemeinde_id=1,
+        magistratsvorlage_id=magistratsvorlage.id,
+        eingabe_ziel_ober=[MobilitaetscheckEingabeZielOber(ziel_ober_id=1)],
+        zuletzt_geaendert_am=GEAENDERT_AM,
+    )
+    db.add(eingabe)
+    return eingabe
+
+
+async def add_klimacheck(db):
+    magistratsvorlage = await add_magistratsvorlage(db)
+    eingabe = KlimacheckEingabe(
+        name="Radweg",
+        gemeinde_id=1,
+        magistratsvorlage_id=magistratsvorlage.id,
+        klimarelevanz_id=1,
+        auswirkung_dauer_id=1,
+        zuletzt_geaendert_am=GEAENDERT_AM,
+    )
+    db.add(eingabe)
+    return eingabe
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "crud, add_eingabe",
+    [
+        (crud_mobility_submission, add_mobilitaetscheck),
+        (crud_klimacheck_eingabe, add_klimacheck),
+    ],
+    ids=["mobilitaetscheck", "klimacheck"],
+)
+async def test_copy_is_changed_when_made(
+    sqlite_session_maker, sqlite_user, crud, add_eingabe
+):
+    async with sqlite_session_maker() as db:
+        eingabe = await add_eingabe(db)
+        await db.commit()
+
+        copies = await crud.copy_many(db, [eingabe.id], sqlite_user)
+
+    async with sqlite_session_maker() as db:
+        copy = await db.get(crud.model, copies[eingabe.id])
+        source = await db.get(crud.model, eingabe.id)
+
+    assert source.zuletzt_geaendert_am == GEAENDERT_AM
+    assert copy.zuletzt_geaendert_am > GEAENDERT_AM
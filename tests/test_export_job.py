@@ -0,0 +1,218 @@
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.db import Base
+from app.core.deps import current_active_user, get_async_session
+from app.crud.exceptions import PDFRenderUnavailableError
+from app.crud.export_job import crud_export_job
+from app.main import app
+from app.models.export_job import ExportJob
+from app.models.user import User
+from app.services.pdf import export_jobs
+from app.services.pdf.export_jobs import ExportJobWorker
+from app.utils.enum_util import ExportJobStatusEnum
+
+GEMEINDE_ID = 1
+
+
+@pytest.fixture
+async def session_maker(tmp_path, monkeypatch):
+    """An SQLite database standing in for Postgres, with the export job table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    table = ExportJob.__table__
+    # `now()` is Postgres only
+    monkeypatch.setattr(
+        table.c.erstellt_am.server_default, "arg", text("CURRENT_TIMESTAMP")
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[table])
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def user():
+    return User(
+        id=uuid.uuid4(),
+        email="sachbearbeitung@example.org",
+        gemeinde_id=GEMEINDE_ID,
+        is_active=True,
+        is_verified=True,
+        is_superuser=False,
+    )
+
+
+@pytest.fixture
+async def client(session_maker, user):
+    async def override_get_async_session():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[current_active_user] = lambda: user
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+async def add_job(session_maker, gemeinde_id=GEMEINDE_ID, **values):
+    async with session_maker() as db:
+        job = ExportJob(magistratsvorlage_ids=[1, 2], gemeinde_id=gemeinde_id, **values)
+        db.add(job)
+        await db.commit()
+        return job.id
+
+
+async def get_job(session_maker, id):
+    async with session_maker() as db:
+        return await db.get(ExportJob, id)
+
+
+@pytest.mark.anyio
+async def test_claim_next_claims_oldest_waiting_job_once(session_maker):
+    first = await add_job(session_maker)
+    second = await add_job(session_maker)
+    stale_before = datetime.now() - timedelta(minutes=5)
+
+    async with session_maker() as db:
+        claimed = [await crud_export_job.claim_next(db, stale_before) for _ in range(3)]
+
+    assert claimed == [first, second, None]
+    job = await get_job(session_maker, first)
+    assert job.status == ExportJobStatusEnum.laeuft
+    assert job.aktualisiert_am is not None
+
+
+@pytest.mark.anyio
+async def test_claim_next_reclaims_stale_running_job(session_maker):
+    stale_before = datetime.now() - timedelta(minutes=5)
+    running = await add_job(
+        session_maker,
+        status=ExportJobStatusEnum.laeuft,
+        aktualisiert_am=datetime.now(),
+    )
+    stale = await add_job(
+        session_maker,
+        status=ExportJobStatusEnum.laeuft,
+        anzahl_fertig=3,
+        aktualisiert_am=stale_before - timedelta(minutes=1),
+    )
+    await add_job(session_maker, status=ExportJobStatusEnum.fehlgeschlagen)
+
+    async with session_maker() as db:
+        claimed = [await crud_export_job.claim_next(db, stale_before) for _ in range(2)]
+
+    assert claimed == [stale, None]
+    job = await get_job(session_maker, stale)
+    assert job.anzahl_fertig == 0
+    assert (await get_job(session_maker, running)).status == ExportJobStatusEnum.laeuft
+
+
+@pytest.mark.anyio
+async def test_failed_job_is_marked_failed(session_maker, tmp_path, monkeypatch):
+    async def archive_exports(db, magistratsvorlage_ids):
+        raise ValueError("Magistratsvorlage 2 not found")
+
+    monkeypatch.setattr(export_jobs, "archive_exports", archive_exports)
+    worker = ExportJobWorker(
+        session_maker=session_maker,
+        concurrency=1,
+        directory=str(tmp_path),
+        retention=timedelta(hours=1),
+        poll_seconds=0,
+    )
+    id = await add_job(session_maker)
+    async with session_maker() as db:
+        assert await crud_export_job.claim_next(db, datetime.now()) == id
+
+    await worker._process(id)
+
+    job = await get_job(session_maker, id)
+    assert job.status == ExportJobStatusEnum.fehlgeschlagen
+    assert job.fehler == "Magistratsvorlage 2 not found"
+    assert job.abgeschlossen_am is not None
+    assert os.listdir(tmp_path) == ["test.db"]
+    async with session_maker() as db:
+        assert await crud_export_job.claim_next(db, datetime.now()) is None
+
+
+@pytest.mark.anyio
+async def test_job_waits_while_renderer_is_busy(session_maker, tmp_path, monkeypatch):
+    async def archive_exports(db, magistratsvorlage_ids):
+        raise PDFRenderUnavailableError()
+
+    monkeypatch.setattr(export_jobs, "archive_exports", archive_exports)
+    worker = ExportJobWorker(
+        session_maker=session_maker,
+        concurrency=1,
+        directory=str(tmp_path),
+        retention=timedelta(hours=1),
+        poll_seconds=0,
+    )
+    id = await add_job(session_maker)
+    async with session_maker() as db:
+        assert await crud_export_job.claim_next(db, datetime.now()) == id
+
+    await worker._process(id)
+
+    job = await get_job(session_maker, id)
+    assert job.status == ExportJobStatusEnum.wartend
+    assert job.fehler is None
+    async with session_maker() as db:
+        assert await crud_export_job.claim_next(db, datetime.now()) == id
+
+
+@pytest.mark.anyio
+async def test_download_finished_job(session_maker, client, tmp_path):
+    path = tmp_path / "export.zip"
+    path.write_bytes(b"PK\x05\x06" + bytes(18))
+    id = await add_job(
+        session_maker,
+        status=ExportJobStatusEnum.fertig,
+        datei=str(path),
+        abgeschlossen_am=datetime.now(),
+    )
+
+    response = await client.get(f"/exports/{id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == ExportJobStatusEnum.fertig.value
+
+    response = await client.get(f"/exports/{id}/file")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert response.content == path.read_bytes()
+
+
+@pytest.mark.anyio
+async def test_download_unfinished_job(session_maker, client):
+    id = await add_job(session_maker, status=ExportJobStatusEnum.laeuft)
+
+    response = await client.get(f"/exports/{id}/file")
+
+    assert response.status_code == 409
+
+
+@pytest.mark.anyio
+async def test_download_job_of_other_gemeinde(session_maker, client, tmp_path):
+    path = tmp_path / "export.zip"
+    path.write_bytes(b"PK\x05\x06" + bytes(18))
+    id = await add_job(
+        session_maker,
+        gemeinde_id=GEMEINDE_ID + 1,
+        status=ExportJobStatusEnum.fertig,
+        datei=str(path),
+    )
+
+    response = await client.get(f"/exports/{id}/file")
+
+    assert response.status_code == 403
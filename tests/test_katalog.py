@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy.orm import selectinload
+
+from app.models import Gemeinde, Indikator, Tag, Textblock, UserRolle
+
+KATALOGE = [
+    ("/einstellungen/indikator", Indikator),
+    ("/einstellungen/textblock", Textblock),
+]
+
+
+@pytest.fixture
+async def eintraege(sqlite_session_maker, sqlite_user):
+    """The ID of an Indikator and a Textblock of Gemeinde 1 and 2 each, tagged."""
+    async with sqlite_session_maker() as db:
+        db.add_all(
+            [
+                Gemeinde(id=1, name="Mainz"),
+                Gemeinde(id=2, name="Wiesbaden"),
+                UserRolle(id=1, name="Sachbearbeitung"),
+            ]
+        )
+        await db.merge(sqlite_user)
+        ids = {}
+        for gemeinde_id in (1, 2):
+            tag = Tag(
+                name="Radverkehr", gemeindespezifisch=True, gemeinde_id=gemeinde_id
+            )
+            for _, Model in KATALOGE:
+                entry = Model(
+                    name=f"Eintrag {gemeinde_id}",
+                    gemeindespezifisch=True,
+                    gemeinde_id=gemeinde_id,
+                    erstellt_von=sqlite_user.id,
+                    tags=[tag],
+                )
+                db.add(entry)
+                ids[Model, gemeinde_id] = entry
+        db.add(Tag(id=99, name="Fußverkehr", gemeindespezifisch=False, gemeinde_id=1))
+        await db.commit()
+        return {key: entry.id for key, entry in ids.items()}
+
+
+async def get_entry(sqlite_session_maker, Model, id):
+    async with sqlite_session_maker() as db:
+        entry = await db.get(Model, id, options=[selectinload(Model.tags)])
+        return entry.name, sorted(tag.id for tag in entry.tags)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("url, Model", KATALOGE)
+async def test_update_own_gemeinde(
+    sqlite_session_maker, sqlite_client, eintraege, url, Model
+):
+    id = eintraege[Model, 1]
+
+    response = await sqlite_client.patch(
+        f"{url}/{id}", json={"name": "Neu", "tag_ids": [99]}
+    )
+
+    assert response.status_code == 200
+    assert await get_entry(sqlite_session_maker, Model, id) == ("Neu", [99])
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("url, Model", KATALOGE)
+async def test_update_other_gemeinde(
+    sqlite_session_maker, sqlite_client, eintraege, url, Model
+):
+    id = eintraege[Model, 2]
+    before = await get_entry(sqlite_session_maker, Model, id)
+
+    response = await sqlite_client.patch(
+        f"{url}/{id}", json={"name": "Neu", "tag_ids": [99]}
+    )
+
+    assert response.status_code == 403
+    assert await get_entry(sqlite_session_maker, Model, id) == before
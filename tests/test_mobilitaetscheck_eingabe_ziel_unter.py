@@ -0,0 +1,116 @@
+import pytest
+
+from app.models import (
+    Gemeinde,
+    MobilitaetscheckAuswirkungRaeumlich,
+    MobilitaetscheckEingabe,
+    MobilitaetscheckEingabeZielOber,
+    MobilitaetscheckEingabeZielUnter,
+    MobilitaetscheckZielOber,
+    MobilitaetscheckZielUnter,
+)
+
+URL = "/mobilitaetscheck/eingabe/ziel/unter"
+
+
+@pytest.fixture
+async def eingabe_ziel_unter_ids(sqlite_session_maker):
+    """The ID of a sub-result of an Eingabe of Gemeinde 1 and 2 each."""
+    async with sqlite_session_maker() as db:
+        ziel_ober = MobilitaetscheckZielOber(
+            nr=1, name="Verkehrssicherheit", gemeinde_id=1
+        )
+        ziel_unter = MobilitaetscheckZielUnter(
+            nr=1, name="Unfälle vermeiden", ziel_ober=ziel_ober, gemeinde_id=1
+        )
+        db.add_all(
+            [
+                Gemeinde(id=1, name="Mainz"),
+                Gemeinde(id=2, name="Wiesbaden"),
+                MobilitaetscheckAuswirkungRaeumlich(id=1, name="Gesamtstadt"),
+            ]
+        )
+        eingabe_ziel_unter = {}
+        for gemeinde_id in (1, 2):
+            sub_result = MobilitaetscheckEingabeZielUnter(
+                ziel_unter=ziel_unter, tangiert=False, auswirkung_raeumlich_id=1
+            )
+            db.add(
+                MobilitaetscheckEingabe(
+                    name=f"Radweg {gemeinde_id}",
+                    gemeinde_id=gemeinde_id,
+                    eingabe_ziel_ober=[
+                        MobilitaetscheckEingabeZielOber(
+                            ziel_ober=ziel_ober, eingabe_ziel_unter=[sub_result]
+                        )
+                    ],
+                )
+            )
+            eingabe_ziel_unter[gemeinde_id] = sub_result
+        await db.commit()
+        return {gemeinde_id: row.id for gemeinde_id, row in eingabe_ziel_unter.items()}
+
+
+async def get_tangiert(sqlite_session_maker, id):
+    async with sqlite_session_maker() as db:
+        return (await db.get(MobilitaetscheckEingabeZielUnter, id)).tangiert
+
+
+@pytest.mark.anyio
+async def test_bulk_update_own_gemeinde(
+    sqlite_session_maker, sqlite_client, eingabe_ziel_unter_ids
+):
+    id = eingabe_ziel_unter_ids[1]
+
+    response = await sqlite_client.patch(
+        URL, json=[{"id": id, "tangiert": True, "auswirkung": 2}]
+    )
+
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()] == [id]
+    assert await get_tangiert(sqlite_session_maker, id)
+
+
+@pytest.mark.anyio
+async def test_bulk_update_other_gemeinde(
+    sqlite_session_maker, sqlite_client, eingabe_ziel_unter_ids
+):
+    own, other = eingabe_ziel_unter_ids[1], eingabe_ziel_unter_ids[2]
+
+    response = await sqlite_client.patch(
+        URL,
+        json=[{"id": own, "tangiert": True}, {"id": other, "tangiert": True}],
+    )
+
+    assert response.status_code == 403
+    assert not await get_tangiert(sqlite_session_maker, own)
+    assert not await get_tangiert(sqlite_session_maker, other)
+
+
+@pytest.mark.anyio
+async def test_bulk_update_other_gemeinde_as_superuser(
+    sqlite_session_maker, sqlite_client, sqlite_user, eingabe_ziel_unter_ids
+):
+    sqlite_user.is_superuser = True
+    other = eingabe_ziel_unter_ids[2]
+
+    response = await sqlite_client.patch(URL, json=[{"id": other, "tangiert": True}])
+
+    assert response.status_code == 200
+    assert await get_tangiert(sqlite_session_maker, other)
+
+
+@pytest.mark.anyio
+async def test_single_row_routes_other_gemeinde(
+    sqlite_session_maker, sqlite_client, eingabe_ziel_unter_ids
+):
+    other = eingabe_ziel_unter_ids[2]
+
+    responses = [
+        await sqlite_client.get(f"{URL}/{other}"),
+        await sqlite_client.patch(f"{URL}/{other}", json={"tangiert": True}),
+        await sqlite_client.delete(f"{URL}/{other}"),
+    ]
+
+    assert [response.status_code for response in responses] == [403, 403, 403]
+    assert not await get_tangiert(sqlite_session_maker, other)
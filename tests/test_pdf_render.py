@@ -0,0 +1,157 @@
+import datetime
+
+import pytest
+
+from app.services.pdf.assets import pdf_assets
+from app.services.pdf.klimacheck_pdf import KlimacheckPDF
+from app.services.pdf.mobilitaetscheck_pdf import MobilitaetscheckPDF
+from app.services.pdf.render_service import _render
+
+RENDER_DATE = datetime.date(2024, 5, 1)
+CREATION_DATE = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.timezone.utc)
+
+
+class FixedDateMobilitaetscheckPDF(MobilitaetscheckPDF):
+    # fpdf2 stamps every document with the time it was created
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_creation_date(CREATION_DATE)
+
+
+class FixedDateKlimacheckPDF(KlimacheckPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_creation_date(CREATION_DATE)
+
+
+MAGISTRATSVORLAGE = {
+    "verwaltungsvorgang_nr": "MV/2024/001",
+    "verwaltungsvorgang_datum": datetime.date(2024, 4, 30),
+    "beschreibung": "Umgestaltung der Großen Bleiche",
+}
+
+
+def eingabe_ziel_unter(nr, tangiert, auswirkung):
+    return {
+        "tangiert": tangiert,
+        "auswirkung": auswirkung,
+        "anmerkung": "Mehr Platz für den Fußverkehr" if auswirkung else None,
+        "ziel_unter": {"nr": nr, "name": f"Unterziel {nr}"},
+        "auswirkung_raeumlich": {"name": "Gesamtstadt"},
+        "indikatoren": [
+            {"name": "Modal Split", "quelle_url": "https://example.org/modal-split"},
+            {"name": "Unfallzahlen", "quelle_url": None},
+        ],
+    }
+
+
+def mobilitaetscheck(eingabe_ziel_ober):
+    return {
+        "name": "Umbau Große Bleiche",
+        "erstellt_von": None,
+        "zuletzt_bearbeitet_von": None,
+        "magistratsvorlage": MAGISTRATSVORLAGE,
+        "eingabe_ziel_ober": eingabe_ziel_ober,
+    }
+
+
+MOBILITAETSCHECK = mobilitaetscheck(
+    [
+        {
+            "ziel_ober_id": 1,
+            "tangiert": True,
+            "ziel_ober": {"nr": 1, "name": "Verkehrssicherheit"},
+            "eingabe_ziel_unter": [
+                eingabe_ziel_unter(1, True, 2),
+                eingabe_ziel_unter(2, True, -1),
+                eingabe_ziel_unter(3, False, None),
+            ],
+        },
+        {
+            "ziel_ober_id": 2,
+            "tangiert": False,
+            "ziel_ober": {"nr": 2, "name": "Klimaschutz"},
+            "eingabe_ziel_unter": [eingabe_ziel_unter(1, False, None)],
+        },
+    ]
+)
+
+KLIMACHECK = {
+    "name": "Umbau Große Bleiche",
+    "magistratsvorlage": MAGISTRATSVORLAGE,
+    "klimarelevanz_id": 1,
+    "klimarelevanz": {"name": "klimarelevant"},
+    "auswirkung_thg": 1,
+    "auswirkung_klimaanpassung": -1,
+    "auswirkung_beschreibung": "Weniger Kfz-Verkehr, mehr Versiegelung",
+    "auswirkung_dauer": {"alt_name": "langfristig"},
+    "alternativen": "-",
+}
+
+
+@pytest.fixture(params=[True, False], ids=["shared", "add_font"])
+def shared_assets(request, monkeypatch):
+    pdf_assets.load()
+    monkeypatch.setattr(pdf_assets, "shared_fonts", request.param)
+    monkeypatch.setattr(pdf_assets, "shared_images", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "PDF, data",
+    [
+        (FixedDateMobilitaetscheckPDF, MOBILITAETSCHECK),
+        (FixedDateKlimacheckPDF, KLIMACHECK),
+    ],
+    ids=["mobilitaetscheck", "klimacheck"],
+)
+def test_render_is_repeatable(shared_assets, PDF, data):
+    first = _render(PDF, data, RENDER_DATE)
+    second = _render(PDF, data, RENDER_DATE)
+
+    assert first.startswith(b"%PDF")
+    assert first == second
+
+
+def test_shared_assets_render_as_add_font(monkeypatch):
+    shared = _render(FixedDateMobilitaetscheckPDF, MOBILITAETSCHECK, RENDER_DATE)
+
+    monkeypatch.setattr(pdf_assets, "shared_fonts", False)
+    monkeypatch.setattr(pdf_assets, "shared_images", False)
+    unshared = _render(FixedDateMobilitaetscheckPDF, MOBILITAETSCHECK, RENDER_DATE)
+
+    assert shared == unshared
+
+
+def test_installed_fpdf2_shares_assets():
+    # The pinned fpdf2 versions keep the state `PDFAssets` copies
+    pdf_assets.load()
+
+    assert pdf_assets.shared_fonts
+    assert pdf_assets.shared_images
+
+
+def test_fonts_fall_back_to_add_font(monkeypatch):
+    pdf_assets.load()
+    monkeypatch.setattr(pdf_assets, "shared_fonts", False)
+
+    pdf = MobilitaetscheckPDF()
+
+    assert {"free-sans", "free-sansB", "free-sansI", "free-sansBI"} <= set(pdf.fonts)
+
+
+def test_render_tangiert_oberziel_without_tangiert_unterziel():
+    data = mobilitaetscheck(
+        [
+            {
+                "ziel_ober_id": 1,
+                "tangiert": True,
+                "ziel_ober": {"nr": 1, "name": "Verkehrssicherheit"},
+                "eingabe_ziel_unter": [eingabe_ziel_unter(1, False, None)],
+            }
+        ]
+    )
+
+    content = _render(MobilitaetscheckPDF, data, RENDER_DATE)
+
+    assert content.startswith(b"%PDF")